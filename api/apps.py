@@ -3,3 +3,11 @@ from django.apps import AppConfig
 
 class ApiConfig(AppConfig):
     name = "api"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from api import signals  # noqa: F401
+        from api.metrics import install_query_recorder
+
+        connection_created.connect(install_query_recorder)
@@ -0,0 +1,141 @@
+"""
+Read-only async views for serving the catalog and orders under ASGI.
+
+Everything that touches the database goes through the async ORM
+(``aget``, ``aiterator`` with chunked async prefetches), so a worker keeps serving
+other requests while it waits on queries. Serializers only run on objects
+whose relations were prefetched, so they never query from the event loop.
+"""
+
+import base64
+import binascii
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.views import View
+from rest_framework.authtoken.models import Token
+
+from api.authentication import token_cache_key, user_from_snapshot, user_snapshot
+
+
+async def aauthenticate(request):
+    """
+    Resolve the user from a ``Token``/``Basic`` Authorization header or the
+    session, mirroring the DRF authentication classes.
+    """
+    keyword, _, credentials = request.headers.get("Authorization", "").partition(" ")
+
+    if keyword == "Token" and credentials:
+        # Shares CachedTokenAuthentication's cache entries.
+        cache_key = token_cache_key(credentials)
+        snapshot = await cache.aget(cache_key)
+        if snapshot is not None:
+            user = user_from_snapshot(snapshot)
+            return user if user.is_active else None
+        try:
+            token = await Token.objects.select_related("user").aget(key=credentials)
+        except Token.DoesNotExist:
+            return None
+        if not token.user.is_active:
+            return None
+        await cache.aset(
+            cache_key, user_snapshot(token.user), settings.TOKEN_CACHE_TIMEOUT
+        )
+        return token.user
+
+    if keyword == "Basic" and credentials:
+        try:
+            username, _, password = (
+                base64.b64decode(credentials).decode("utf-8").partition(":")
+            )
+        except (binascii.Error, UnicodeDecodeError):
+            return None
+        # Password hashing is CPU bound, keep it off the event loop.
+        return await sync_to_async(authenticate)(
+            request, username=username, password=password
+        )
+
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+class AsyncReadView(View):
+    """
+    Base class for async list/detail endpoints.
+
+    Subclasses set ``serializer_class`` and either ``queryset`` or, to scope
+    rows to the user, ``get_queryset(user)``, as with DRF's generic views.
+
+    Lists use keyset pagination on the primary key
+    (``?after=<id>&page_size=<n>``), ascending unless ``ordering`` is
+    ``"-pk"``, and never count rows.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    queryset = None
+    serializer_class = None
+    ordering = "pk"
+    login_required = True
+    max_page_size = 100
+
+    def get_queryset(self, user):
+        assert self.queryset is not None, (
+            f"'{self.__class__.__name__}' should either include a `queryset` "
+            "attribute, or override the `get_queryset()` method."
+        )
+        # A fresh queryset per request, so results are never shared.
+        return self.queryset.all()
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.GET.get("page_size", ""))
+        except ValueError:
+            return settings.REST_FRAMEWORK["PAGE_SIZE"]
+        return max(1, min(page_size, self.max_page_size))
+
+    async def get(self, request, *args, **kwargs):
+        user = await aauthenticate(request)
+        if self.login_required and user is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=401,
+            )
+
+        queryset = self.get_queryset(user)
+        if "pk" in kwargs:
+            return await self.retrieve(request, queryset, kwargs["pk"])
+        return await self.list(request, queryset)
+
+    async def retrieve(self, request, queryset, pk):
+        try:
+            instance = await queryset.aget(pk=pk)
+        except queryset.model.DoesNotExist:
+            return JsonResponse({"detail": "Not found."}, status=404)
+        return JsonResponse(self.serializer_class(instance).data)
+
+    async def list(self, request, queryset):
+        page_size = self.get_page_size(request)
+        after = request.GET.get("after")
+        if after and after.isdigit():
+            lookup = "pk__lt" if self.ordering.startswith("-") else "pk__gt"
+            queryset = queryset.filter(**{lookup: int(after)})
+
+        page = [
+            obj
+            async for obj in queryset.order_by(self.ordering)[
+                : page_size + 1
+            ].aiterator(chunk_size=page_size + 1)
+        ]
+
+        next_url = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            params = request.GET.copy()
+            params["after"] = page[-1].pk
+            next_url = request.build_absolute_uri(f"?{params.urlencode()}")
+
+        results = self.serializer_class(page, many=True).data
+        return JsonResponse({"next": next_url, "results": results})
@@ -0,0 +1,63 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+# The user fields cached per token: what authentication and the permission
+# checks read. Every other field is deferred and loaded on first access.
+SNAPSHOT_FIELDS = ("id", "is_active", "is_staff")
+
+
+def token_cache_key(key):
+    # Hashed so raw tokens never end up in the cache backend.
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f"auth:token:{digest}"
+
+
+def invalidate_tokens(*keys):
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+def invalidate_user_tokens(user):
+    invalidate_tokens(*Token.objects.filter(user=user).values_list("key", flat=True))
+
+
+def user_snapshot(user):
+    return {field: getattr(user, field) for field in SNAPSHOT_FIELDS}
+
+
+def user_from_snapshot(snapshot):
+    # from_db() takes values in the model's field order.
+    model = get_user_model()
+    names = [f.attname for f in model._meta.concrete_fields if f.attname in snapshot]
+    return model.from_db(DEFAULT_DB_ALIAS, names, [snapshot[name] for name in names])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    ``TokenAuthentication`` that remembers token -> user for
+    ``TOKEN_CACHE_TIMEOUT`` seconds, so a hit runs no query. Only the
+    ``SNAPSHOT_FIELDS`` of the user are cached, never the password hash or
+    the rest of the row. ``api.signals`` drops entries when a token is
+    deleted or its user is saved or deleted; changes written with
+    ``queryset.update()`` apply once the entry times out.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        snapshot = cache.get(cache_key)
+        if snapshot is None:
+            user, token = super().authenticate_credentials(key)
+            cache.set(cache_key, user_snapshot(user), settings.TOKEN_CACHE_TIMEOUT)
+            return user, token
+
+        user = user_from_snapshot(snapshot)
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        return user, Token(key=key, user=user)
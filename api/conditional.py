@@ -0,0 +1,103 @@
+import hashlib
+
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    fingerprint = repr(parts).encode()
+    return quote_etag(hashlib.md5(fingerprint, usedforsecurity=False).hexdigest())
+
+
+def conditional_response(request, etag, last_modified, render):
+    """
+    Answer with a 304 when the request's validators match, otherwise with
+    ``render()``, and set ``ETag`` / ``Last-Modified`` on either.
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = render()
+
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for ``list`` and ``retrieve``.
+
+    Validators describe the page actually served: its rows in order, the
+    pagination envelope, and the newest value of each field in
+    ``conditional_fields`` among those rows, read with one aggregate bounded
+    by the page size. Related fields belong there when the representation
+    embeds them. The page is fetched first, but a matching ``If-None-Match``
+    or ``If-Modified-Since`` gets a 304 before anything is serialized.
+
+    Deleting a row changes the page and therefore the ETag, but it can not
+    move ``Last-Modified`` forward; clients should prefer ``If-None-Match``.
+    """
+
+    conditional_fields = ("updated_at",)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        objects = list(queryset) if page is None else page
+
+        def render():
+            serializer = self.get_serializer(objects, many=True)
+            if page is None:
+                return Response(serializer.data)
+            return self.get_paginated_response(serializer.data)
+
+        # The envelope without results still carries the count and links.
+        envelope = None if page is None else self.get_paginated_response([]).data
+        etag, last_modified = self.get_validators(request, objects, envelope)
+        return conditional_response(request, etag, last_modified, render)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        def render():
+            return Response(self.get_serializer(instance).data)
+
+        etag, last_modified = self.get_validators(request, [instance])
+        return conditional_response(request, etag, last_modified, render)
+
+    def get_validators(self, request, objects, envelope=None):
+        pks = [obj.pk for obj in objects]
+
+        values = {}
+        if pks:
+            model = type(objects[0])
+            aggregates = {
+                f"max_{index}": Max(field)
+                for index, field in enumerate(self.conditional_fields)
+            }
+            values = (
+                model._default_manager.using(objects[0]._state.db)
+                .filter(pk__in=pks)
+                .order_by()
+                .aggregate(**aggregates)
+            )
+
+        timestamps = [value for value in values.values() if value is not None]
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+
+        etag = make_etag(
+            request.get_full_path(),
+            request.version,
+            request.accepted_renderer.format,
+            request.user.pk,
+            pks,
+            envelope,
+            sorted(values.items()),
+        )
+
+        return etag, last_modified
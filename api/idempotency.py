@@ -0,0 +1,137 @@
+"""
+``Idempotency-Key`` support for create endpoints.
+
+The first request with a key runs the create and stores its response in
+``IdempotencyKey``, in the same transaction; retries with the same key get
+the stored response back, marked ``Idempotent-Replayed: true``, without
+running the write again. A key row is inserted before the create runs, so
+a concurrent request with the same key blocks on the unique index until the
+first one commits and then replays its response (or, if the first one
+failed and rolled back, runs the create itself). Failed requests store
+nothing and can be retried with the same key.
+
+Keys are scoped to the user, or to the client address for anonymous
+requests, and to the path. Stored responses are also cached until the key
+expires, ``IDEMPOTENCY_KEY_TTL`` seconds after the first request, so most
+retries never touch the database. An expired key is free again even before
+``purge_idempotency_keys`` deletes its row.
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+
+from api.models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+
+def _digest(*parts):
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    ).hexdigest()
+
+
+def _cache_key(key):
+    return f"idempotency:{key}"
+
+
+class IdempotentCreateMixin:
+    """Replays the stored response of ``create`` for a repeated key."""
+
+    def create(self, request, *args, **kwargs):
+        client_key = request.headers.get(HEADER)
+        if client_key is None:
+            return super().create(request, *args, **kwargs)
+        if not client_key or len(client_key) > MAX_KEY_LENGTH:
+            raise ValidationError(
+                {HEADER: [f"Must be 1 to {MAX_KEY_LENGTH} characters long."]}
+            )
+
+        key = _digest(self.get_idempotency_client(request), request.path, client_key)
+        data = request.data
+        fingerprint = _digest(dict(data.lists()) if hasattr(data, "lists") else data)
+
+        stored = cache.get(_cache_key(key))
+        if stored is not None:
+            return self.replay_response(stored, fingerprint)
+
+        with transaction.atomic():
+            record = self.insert_key(key, fingerprint)
+            while record is None:
+                existing = IdempotencyKey.objects.filter(key=key).first()
+                if existing is not None and existing.expires_at > timezone.now():
+                    stored = self.stored_response(existing)
+                    self.cache_response(key, stored, existing.expires_at)
+                    return self.replay_response(stored, fingerprint)
+                # Past its TTL but not purged yet: the key is free again.
+                if existing is not None:
+                    existing.delete()
+                record = self.insert_key(key, fingerprint)
+
+            response = super().create(request, *args, **kwargs)
+            record.status_code = response.status_code
+            record.response = response.data
+            record.save(update_fields=["status_code", "response"])
+
+        self.cache_response(key, self.stored_response(record), record.expires_at)
+        return response
+
+    def get_idempotency_client(self, request):
+        # Anonymous clients are told apart by address, as the throttles do.
+        if request.user.is_authenticated:
+            return request.user.pk
+        return f"ip:{BaseThrottle().get_ident(request)}"
+
+    def insert_key(self, key, fingerprint):
+        """The new key row, or ``None`` if the key is already taken."""
+        try:
+            # Savepoint: the transaction stays usable if the key exists.
+            with transaction.atomic():
+                return IdempotencyKey.objects.create(
+                    key=key,
+                    fingerprint=fingerprint,
+                    # Filled in after the create, before anyone else can read it.
+                    status_code=0,
+                    response={},
+                    expires_at=timezone.now()
+                    + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+                )
+        except IntegrityError:
+            return None
+
+    def cache_response(self, key, stored, expires_at):
+        timeout = (expires_at - timezone.now()).total_seconds()
+        if timeout > 0:
+            cache.set(_cache_key(key), stored, timeout)
+
+    def stored_response(self, record):
+        return {
+            "fingerprint": record.fingerprint,
+            "status": record.status_code,
+            # Round-trip through JSON, as replays will read it.
+            "data": json.loads(json.dumps(record.response, cls=DjangoJSONEncoder)),
+        }
+
+    def replay_response(self, stored, fingerprint):
+        if stored["fingerprint"] != fingerprint:
+            return Response(
+                {"detail": f"{HEADER} was already used with a different request."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        return Response(
+            stored["data"],
+            status=stored["status"],
+            headers={"Idempotent-Replayed": "true"},
+        )
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "Delete idempotency keys whose replay window has passed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = timezone.now()
+        deleted = 0
+
+        # Small batches keep each delete's locks short.
+        while True:
+            ids = list(
+                IdempotencyKey.objects.filter(expires_at__lte=now)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            deleted += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} keys."))
@@ -0,0 +1,267 @@
+"""
+Per-request performance instrumentation.
+
+``MetricsMiddleware`` opens a ``RequestStats`` for every request. While it
+is open, the execute wrapper installed on each database connection records
+every query and its duration, and serializers using
+``TimedSerializerMixin`` add their time. The totals are sent back in a
+``Server-Timing`` header, folded into the in-process Prometheus histograms
+rendered by ``render_metrics`` (served at ``/metrics``), and requests slower
+than ``SLOW_REQUEST_MS`` are logged with their queries.
+
+The histograms live in process memory, so each server worker reports its
+own series.
+"""
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger("bookstore.performance")
+
+MAX_RECORDED_QUERIES = 100
+
+_current_stats = ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.query_time = 0.0
+        self.queries = []
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+
+    def add_query(self, sql, duration):
+        self.query_count += 1
+        self.query_time += duration
+        if len(self.queries) < MAX_RECORDED_QUERIES:
+            self.queries.append((sql, duration))
+
+
+def record_query(execute, sql, params, many, context):
+    """``connection.execute_wrapper`` hook; a no-op outside a request."""
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.add_query(sql, time.perf_counter() - started)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """``connection_created`` receiver."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class TimedSerializerMixin:
+    """
+    Adds the time spent in ``to_representation`` to the current request.
+
+    Only the outermost call is timed, so nested serializers and the items
+    of a list are not counted twice.
+    """
+
+    def to_representation(self, instance):
+        stats = _current_stats.get()
+        if stats is None:
+            return super().to_representation(instance)
+
+        stats.serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            stats.serializer_depth -= 1
+            if not stats.serializer_depth:
+                stats.serializer_time += time.perf_counter() - started
+
+
+def _format_labels(names, values):
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, values))
+
+
+class Histogram:
+    def __init__(self, name, documentation, buckets, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self.labelnames = labelnames
+        self.series = {}
+
+    def observe(self, labels, value):
+        series = self.series.setdefault(labels, [[0] * len(self.buckets), 0.0, 0])
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[0][index] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self):
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (buckets, total, count) in sorted(self.series.items()):
+            pairs = _format_labels(self.labelnames, labels)
+            for bound, bucket in zip(self.buckets, buckets):
+                yield f'{self.name}_bucket{{{pairs},le="{bound}"}} {bucket}'
+            yield f'{self.name}_bucket{{{pairs},le="+Inf"}} {count}'
+            yield f"{self.name}_sum{{{pairs}}} {total}"
+            yield f"{self.name}_count{{{pairs}}} {count}"
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.series = {}
+
+    def inc(self, labels):
+        self.series[labels] = self.series.get(labels, 0) + 1
+
+    def render(self):
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in sorted(self.series.items()):
+            pairs = _format_labels(self.labelnames, labels)
+            yield f"{self.name}{{{pairs}}} {value}"
+
+
+SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNTS = (1, 2, 3, 5, 10, 20, 50, 100, 250)
+BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+ROUTE = ("route", "method")
+
+REQUESTS = Counter(
+    "http_requests_total", "Requests by route and status.", ROUTE + ("status",)
+)
+HISTOGRAMS = {
+    "duration": Histogram(
+        "http_request_duration_seconds", "Wall time per request.", SECONDS, ROUTE
+    ),
+    "db_queries": Histogram(
+        "http_request_db_queries", "SQL queries per request.", COUNTS, ROUTE
+    ),
+    "db_duration": Histogram(
+        "http_request_db_duration_seconds",
+        "Time spent in SQL per request.",
+        SECONDS,
+        ROUTE,
+    ),
+    "serializer_duration": Histogram(
+        "http_request_serializer_duration_seconds",
+        "Time spent serializing per request.",
+        SECONDS,
+        ROUTE,
+    ),
+    "response_size": Histogram(
+        "http_response_size_bytes", "Response body size.", BYTES, ROUTE
+    ),
+}
+_lock = threading.Lock()
+
+
+def observe(route, method, status, stats, duration, size):
+    labels = (route, method)
+    with _lock:
+        REQUESTS.inc(labels + (str(status),))
+        HISTOGRAMS["duration"].observe(labels, duration)
+        HISTOGRAMS["db_queries"].observe(labels, stats.query_count)
+        HISTOGRAMS["db_duration"].observe(labels, stats.query_time)
+        HISTOGRAMS["serializer_duration"].observe(labels, stats.serializer_time)
+        if size is not None:
+            HISTOGRAMS["response_size"].observe(labels, size)
+
+
+def render_metrics():
+    with _lock:
+        lines = list(REQUESTS.render())
+        for histogram in HISTOGRAMS.values():
+            lines.extend(histogram.render())
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics():
+    with _lock:
+        REQUESTS.series.clear()
+        for histogram in HISTOGRAMS.values():
+            histogram.series.clear()
+
+
+class MetricsMiddleware:
+    """
+    Times the request and reports it; see the module docstring. Put it first
+    in ``MIDDLEWARE`` so the timings cover the rest of the stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self.finish(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self.finish(request, response, stats)
+
+    def finish(self, request, response, stats):
+        duration = time.perf_counter() - stats.started
+        size = None if response.streaming else len(response.content)
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={stats.query_time * 1000:.1f};desc="{stats.query_count} queries"',
+                f"serializer;dur={stats.serializer_time * 1000:.1f}",
+                f"total;dur={duration * 1000:.1f}",
+            ]
+        )
+
+        match = request.resolver_match
+        route = match.view_name if match else "unmatched"
+        if route != "metrics":
+            observe(route, request.method, response.status_code, stats, duration, size)
+
+        if duration * 1000 >= settings.SLOW_REQUEST_MS:
+            logger.warning(
+                "Slow request: %s %s took %.1f ms, %d queries in %.1f ms\n%s",
+                request.method,
+                request.get_full_path(),
+                duration * 1000,
+                stats.query_count,
+                stats.query_time * 1000,
+                "\n".join(
+                    f"  {query_duration * 1000:.1f} ms  {sql}"
+                    for sql, query_duration in stats.queries
+                ),
+            )
+
+        return response
@@ -1,3 +1,20 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
-# Create your models here.
+
+class IdempotencyKey(models.Model):
+    """
+    The stored response of a create request sent with an ``Idempotency-Key``
+    header. ``key`` digests the client's key with the user and the path, so
+    clients can not collide with each other's keys.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField()
+    response = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.key
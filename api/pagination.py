@@ -0,0 +1,57 @@
+from rest_framework.pagination import (
+    BasePagination,
+    CursorPagination,
+    PageNumberPagination,
+)
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination on ``id``.
+
+    Pages are fetched with ``WHERE id > <cursor> LIMIT <page_size>``, so deep
+    pages cost the same as the first one and no ``COUNT(*)`` is issued. An
+    ordering the view already applied, such as a search rank, is kept and
+    used as the key instead.
+    """
+
+    ordering = "id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(queryset.query.order_by) or (self.ordering,)
+
+
+class VersionedPagination(BasePagination):
+    """
+    Page-number pagination for v1 clients, keyset pagination for v2.
+    """
+
+    version_classes = {
+        "v1": PageNumberPagination,
+        "v2": IdCursorPagination,
+    }
+    default_class = PageNumberPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        pagination_class = self.version_classes.get(request.version, self.default_class)
+        self.paginator = pagination_class()
+        page = self.paginator.paginate_queryset(queryset, request, view)
+        self.display_page_controls = self.paginator.display_page_controls
+        return page
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.default_class().get_paginated_response_schema(schema)
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+    def get_results(self, data):
+        return self.paginator.get_results(data)
+
+    def get_schema_operation_parameters(self, view):
+        return self.default_class().get_schema_operation_parameters(view)
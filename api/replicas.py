@@ -0,0 +1,91 @@
+"""
+Read-replica routing.
+
+Reads go to the primary unless a view opted in with ``ReplicaReadMixin``:
+then safe requests pick one of ``DATABASE_REPLICAS`` for their queries.
+Writes, ``select_for_update`` (a write query) and anything inside a
+transaction stay on the primary. A user who writes is pinned to the primary
+for ``REPLICA_PIN_SECONDS`` so they read their own writes while the replicas
+catch up; the pin lives in the cache, so it needs a cache shared by all
+workers.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+_read_alias = ContextVar("read_alias", default=None)
+
+
+def _pin_key(user):
+    return f"db:pinned:{user.pk}"
+
+
+def pin_to_primary(user):
+    if user.is_authenticated:
+        cache.set(_pin_key(user), True, settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned(user):
+    return user.is_authenticated and cache.get(_pin_key(user)) is not None
+
+
+@contextmanager
+def read_from_primary():
+    """Send the reads inside the block to the primary, replicas or not."""
+    token = _read_alias.set(None)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+
+class ReplicaReadMixin:
+    """
+    Serve safe requests from a replica once the user is authenticated
+    (authentication itself reads the primary), and pin users to the primary
+    after a successful write.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        token = _read_alias.set(None)
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        replicas = settings.DATABASE_REPLICAS
+        if replicas and request.method in SAFE_METHODS and not is_pinned(request.user):
+            _read_alias.set(random.choice(replicas))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            pin_to_primary(request.user)
+        return response
@@ -0,0 +1,107 @@
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def _list_param(request, name):
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    ``?fields=`` and ``?expand=`` support for model serializers.
+
+    ``?fields=id,total`` drops every other readable field of the top-level
+    serializer. Relations listed in ``expandable_fields`` are embedded as
+    nested objects on v1, while v2 renders them as primary keys unless they
+    are named in ``?expand=``.
+    """
+
+    expandable_fields = ()
+
+    @classmethod
+    def requested_fields(cls, request):
+        return _list_param(request, "fields")
+
+    @classmethod
+    def expanded_fields(cls, request):
+        if getattr(request, "version", None) == "v1":
+            return set(cls.expandable_fields)
+        return (_list_param(request, "expand") or set()) & set(cls.expandable_fields)
+
+    def is_top_level(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is None or not self.is_top_level():
+            return fields
+
+        expanded = self.expanded_fields(request)
+        for name in self.expandable_fields:
+            if name not in expanded:
+                fields[name] = serializers.PrimaryKeyRelatedField(
+                    many=True, read_only=True
+                )
+
+        requested = self.requested_fields(request)
+        if requested is not None:
+            fields = {
+                name: field
+                for name, field in fields.items()
+                if name in requested or field.write_only
+            }
+
+        return fields
+
+
+class SparseQuerysetMixin:
+    """
+    Viewset counterpart of ``SparseFieldsetMixin``.
+
+    On reads, loads only the columns of the requested fields and prefetches
+    each relation in ``sparse_prefetches`` either fully (expanded, or not
+    expandable at all) or as bare ids (collapsed), or not at all when it was
+    not requested.
+    """
+
+    sparse_prefetches = {}
+
+    def trim_queryset(self, queryset):
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        serializer_class = self.get_serializer_class()
+        requested = serializer_class.requested_fields(self.request)
+        expanded = serializer_class.expanded_fields(self.request)
+
+        queryset = queryset.prefetch_related(None)
+        for name, lookups in self.sparse_prefetches.items():
+            if requested is not None and name not in requested:
+                continue
+            if name in expanded or name not in serializer_class.expandable_fields:
+                queryset = queryset.prefetch_related(*lookups)
+            else:
+                related_model = queryset.model._meta.get_field(name).related_model
+                queryset = queryset.prefetch_related(
+                    Prefetch(name, queryset=related_model.objects.only("pk"))
+                )
+
+        if requested is not None:
+            # Ordering columns are kept as well: cursor pagination reads them.
+            ordering = {name.lstrip("-") for name in queryset.query.order_by}
+            columns = [
+                field.name
+                for field in queryset.model._meta.concrete_fields
+                if field.name in requested | ordering
+            ]
+            queryset = queryset.select_related(None).only("pk", *columns)
+
+        return queryset
@@ -0,0 +1,24 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from api.authentication import invalidate_tokens, invalidate_user_tokens
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_tokens(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_tokens_of_saved_user(sender, instance, created, update_fields, **kwargs):
+    # Logins only touch last_login, which cached credentials do not depend on.
+    if not created and update_fields != frozenset({"last_login"}):
+        invalidate_user_tokens(instance)
+
+
+@receiver(pre_delete, sender=User)
+def invalidate_tokens_of_deleted_user(sender, instance, **kwargs):
+    # Before the cascade, while the user's tokens can still be listed.
+    invalidate_user_tokens(instance)
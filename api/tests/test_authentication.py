@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from api.authentication import CachedTokenAuthentication, token_cache_key
+from order.factories import UserFactory
+
+
+class TestCachedTokenAuthentication(APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.token = Token.objects.create(user=self.user)
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+
+    def test_token_lookup_is_cached(self):
+        authentication = CachedTokenAuthentication()
+        with self.assertNumQueries(1):
+            authentication.authenticate_credentials(self.token.key)
+
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate_credentials(self.token.key)
+
+        self.assertEqual((user.pk, user.is_staff), (self.user.pk, False))
+        self.assertEqual(token.key, self.token.key)
+        # Fields outside the snapshot are loaded on demand.
+        self.assertEqual(user.username, self.user.username)
+
+    def test_cache_key_does_not_contain_the_token(self):
+        self.client.get(self.url)
+
+        self.assertNotIn(self.token.key, token_cache_key(self.token.key))
+        self.assertIsNotNone(cache.get(token_cache_key(self.token.key)))
+
+    def test_only_a_user_snapshot_is_cached(self):
+        self.client.get(self.url)
+
+        self.assertEqual(
+            cache.get(token_cache_key(self.token.key)),
+            {"id": self.user.pk, "is_active": True, "is_staff": False},
+        )
+
+    def test_deleted_token_is_rejected(self):
+        self.client.get(self.url)
+        self.token.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_staff_flag_survives_the_cache(self):
+        self.user.is_staff = True
+        self.user.save()
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(self.token.key)
+
+        user, _ = authentication.authenticate_credentials(self.token.key)
+
+        self.assertEqual((user.is_active, user.is_staff), (True, True))
+
+    def test_saving_the_user_drops_the_snapshot(self):
+        self.client.get(self.url)
+        self.user.is_staff = True
+        self.user.save()
+
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+    def test_deleted_user_is_rejected(self):
+        self.client.get(self.url)
+        self.user.delete()
+
+        response = self.client.get(self.url)
+        async_response = self.client.get(
+            reverse("async-order-list", kwargs={"version": "v1"})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(async_response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_async_view_uses_the_same_cache(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("async-order-list", kwargs={"version": "v1"})
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unauthenticated_request_asks_for_a_token(self):
+        self.client.credentials()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response["WWW-Authenticate"], "Token")
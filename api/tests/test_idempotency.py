@@ -0,0 +1,244 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import StringIO
+from threading import Barrier
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from api.models import IdempotencyKey
+from order.factories import UserFactory
+from order.models import Order
+from order.viewsets import OrderViewSet
+from product.factories import CategoryFactory, ProductFactory
+from product.models import Category, Product
+
+
+class TestIdempotentCreate(APITestCase):
+    def setUp(self):
+        # Cached responses are keyed by user id, which other tests reuse.
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+        self.product = ProductFactory()
+
+    def create_order(self, key="retry-1", products=None):
+        return self.client.post(
+            self.url,
+            {"products_id": products or [self.product.pk], "user": self.user.pk},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_replays_the_response_from_the_cache(self):
+        first = self.create_order()
+
+        with self.assertNumQueries(0):
+            retry = self.create_order()
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertNotIn("Idempotent-Replayed", first)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_retry_replays_the_response_from_the_key_table(self):
+        first = self.create_order()
+        cache.clear()
+
+        retry = self.create_order()
+
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_key_reused_with_another_request_is_rejected(self):
+        self.create_order()
+
+        response = self.create_order(products=[ProductFactory().pk])
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_keys_are_scoped_to_the_user(self):
+        self.create_order()
+        other = UserFactory()
+        self.client.force_authenticate(user=other)
+
+        response = self.client.post(
+            self.url,
+            {"products_id": [self.product.pk], "user": other.pk},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="retry-1",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_anonymous_keys_are_scoped_to_the_client_address(self):
+        self.client.force_authenticate(user=None)
+        url = reverse("category-list", kwargs={"version": "v1"})
+
+        responses = [
+            self.client.post(
+                url,
+                {"title": title, "slug": title},
+                format="json",
+                HTTP_IDEMPOTENCY_KEY="1",
+                REMOTE_ADDR=address,
+            )
+            for title, address in (("sci-fi", "10.0.0.1"), ("poetry", "10.0.0.2"))
+        ]
+
+        self.assertEqual(
+            [response.status_code for response in responses],
+            [status.HTTP_201_CREATED] * 2,
+        )
+        self.assertNotIn("Idempotent-Replayed", responses[1])
+        self.assertEqual(Category.objects.count(), 2)
+
+    def test_expired_key_runs_the_create_again(self):
+        self.create_order()
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        cache.clear()
+
+        response = self.create_order(products=[ProductFactory().pk])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+    def test_failed_requests_are_not_stored(self):
+        response = self.create_order(products=[0])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+        response = self.create_order()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_invalid_key(self):
+        response = self.create_order(key="k" * 256)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Idempotency-Key", response.json())
+
+    def test_requests_without_a_key_are_not_deduplicated(self):
+        for _ in range(2):
+            self.client.post(
+                self.url,
+                {"products_id": [self.product.pk], "user": self.user.pk},
+                format="json",
+            )
+
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_product_and_category_creates(self):
+        category = CategoryFactory()
+        for name, model, data in (
+            ("product", Product, {"title": "dune", "categories_id": [category.pk]}),
+            ("category", Category, {"title": "sci-fi", "slug": "sci-fi"}),
+        ):
+            url = reverse(f"{name}-list", kwargs={"version": "v1"})
+            before = model.objects.count()
+
+            for _ in range(2):
+                response = self.client.post(
+                    url, data, format="json", HTTP_IDEMPOTENCY_KEY="create-1"
+                )
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+            self.assertEqual(response["Idempotent-Replayed"], "true")
+            self.assertEqual(model.objects.count(), before + 1)
+
+
+class TestConcurrentIdempotentCreate(TransactionTestCase):
+    workers = 6
+
+    def test_concurrent_retries_create_one_order(self):
+        user = UserFactory()
+        product = ProductFactory()
+        # Called directly: the test client re-raises exceptions from any
+        # thread's request.
+        view = OrderViewSet.as_view({"post": "create"})
+        factory = APIRequestFactory()
+        barrier = Barrier(self.workers)
+
+        def submit(_):
+            barrier.wait()
+            try:
+                while True:
+                    request = factory.post(
+                        "/bookstore/v1/order/",
+                        {"products_id": [product.pk], "user": user.pk},
+                        format="json",
+                        HTTP_IDEMPOTENCY_KEY="checkout-1",
+                    )
+                    force_authenticate(request, user=user)
+                    try:
+                        return view(request, version="v1")
+                    except OperationalError:
+                        # SQLite's shared in-memory test database fails with
+                        # "table is locked" instead of waiting; start over.
+                        if connection.vendor != "sqlite":
+                            raise
+                        time.sleep(0.01)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            responses = list(pool.map(submit, range(self.workers)))
+
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertEqual(
+            {response.status_code for response in responses},
+            {status.HTTP_201_CREATED},
+        )
+        self.assertEqual(
+            {response.data["id"] for response in responses},
+            {Order.objects.get().pk},
+        )
+        self.assertEqual(
+            sum("Idempotent-Replayed" in response for response in responses),
+            self.workers - 1,
+        )
+
+
+class TestPurgeIdempotencyKeys(TestCase):
+    def test_purge_deletes_expired_keys(self):
+        now = timezone.now()
+        for index, expires_at in enumerate(
+            [
+                now - timedelta(hours=1),
+                now - timedelta(seconds=1),
+                now + timedelta(hours=1),
+            ]
+        ):
+            IdempotencyKey.objects.create(
+                key=str(index),
+                fingerprint="",
+                status_code=201,
+                response={},
+                expires_at=expires_at,
+            )
+
+        out = StringIO()
+        call_command("purge_idempotency_keys", batch_size=1, stdout=out)
+
+        self.assertIn("Deleted 2 keys", out.getvalue())
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list("key", flat=True)), ["2"]
+        )
@@ -0,0 +1,90 @@
+import re
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.metrics import reset_metrics
+from order.factories import OrderFactory, UserFactory
+from product.factories import ProductFactory
+
+
+class TestMetrics(APITestCase):
+    def setUp(self):
+        reset_metrics()
+        self.addCleanup(reset_metrics)
+        self.user = UserFactory()
+        self.order = OrderFactory(
+            user=self.user, product=ProductFactory.create_batch(2)
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+
+    def test_server_timing_header(self):
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url)
+
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="6 queries"')
+        self.assertRegex(timing, r"serializer;dur=[\d.]+")
+        self.assertRegex(timing, r"total;dur=[\d.]+")
+
+    def test_metrics_endpoint_has_route_histograms(self):
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        self.client.force_login(UserFactory(is_staff=True))
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.content.decode()
+        labels = 'route="order-list",method="GET"'
+        self.assertIn(f'http_requests_total{{{labels},status="200"}} 2', body)
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 2", body)
+        self.assertIn(f'http_request_db_queries_bucket{{{labels},le="10"}} 2', body)
+        self.assertRegex(
+            body, re.escape(f"http_response_size_bytes_sum{{{labels}}} ") + r"\d+"
+        )
+        self.assertNotIn('route="metrics"', body)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_token(self):
+        self.assertEqual(
+            self.client.get(reverse("metrics")).status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+        response = self.client.get(
+            reverse("metrics"), headers={"Authorization": "Bearer secret"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_metrics_need_staff_without_a_token(self):
+        self.client.force_login(self.user)
+        self.assertEqual(
+            self.client.get(reverse("metrics")).status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+
+        with override_settings(DEBUG=True):
+            response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(SLOW_REQUEST_MS=0)
+    def test_slow_requests_are_logged_with_queries(self):
+        with self.assertLogs("bookstore.performance", level="WARNING") as logs:
+            self.client.get(self.url)
+
+        self.assertIn("Slow request: GET /bookstore/v1/order/", logs.output[0])
+        self.assertIn("6 queries", logs.output[0])
+        self.assertIn('FROM "order_order"', logs.output[0])
+
+    async def test_async_views_are_measured(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(
+            reverse("async-order-list", kwargs={"version": "v1"})
+        )
+
+        # Session, user, orders and the item/product/category prefetches.
+        self.assertIn('desc="6 queries"', response["Server-Timing"])
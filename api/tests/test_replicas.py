@@ -0,0 +1,121 @@
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from api.replicas import ReplicaRouter, _read_alias, is_pinned
+from order.factories import UserFactory
+from product.factories import ProductFactory
+from product.models import Product
+
+
+class TestReplicaRouter(SimpleTestCase):
+    def setUp(self):
+        token = _read_alias.set("replica1")
+        self.addCleanup(_read_alias.reset, token)
+
+    def test_reads_follow_the_request_alias(self):
+        self.assertEqual(Product.objects.all().db, "replica1")
+
+    def test_writes_and_locking_reads_use_the_primary(self):
+        router = ReplicaRouter()
+
+        self.assertEqual(router.db_for_write(Product), "default")
+        self.assertEqual(Product.objects.select_for_update().db, "default")
+
+    def test_reads_default_to_the_primary(self):
+        _read_alias.set(None)
+
+        self.assertEqual(Product.objects.all().db, "default")
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+class TestReplicaPinning(APITestCase):
+    def setUp(self):
+        # Pins are keyed by user id, which other tests reuse.
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+
+    def test_successful_write_pins_the_user(self):
+        product = ProductFactory()
+
+        response = self.client.post(
+            self.url,
+            {"products_id": [product.pk], "user": self.user.pk},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(is_pinned(self.user))
+
+    def test_failed_write_does_not_pin(self):
+        response = self.client.post(self.url, {"user": self.user.pk}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(is_pinned(self.user))
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+class TestReplicaCatalogCache(APITransactionTestCase):
+    # Outside a test transaction, so reads really are routed.
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=UserFactory())
+        self.product = ProductFactory(title="dune")
+        self.url = reverse(
+            "product-detail", kwargs={"version": "v1", "pk": self.product.pk}
+        )
+
+    def test_cache_misses_render_from_the_primary(self):
+        # "replica1" is not configured here, so a replica read would fail.
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "MISS")
+
+        self.product.title = "dune messiah"
+        self.product.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["title"], "dune messiah")
+        self.assertEqual(self.client.get(self.url)["X-Cache"], "HIT")
+
+
+@skipUnless(
+    settings.DATABASE_REPLICAS, "set SQL_REPLICA_DATABASES to run against a replica"
+)
+class TestReplicaReads(TransactionTestCase):
+    databases = "__all__"
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_login(self.user)
+        self.replica = connections[settings.DATABASE_REPLICAS[0]]
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+
+    @override_settings(DATABASE_REPLICAS=settings.DATABASE_REPLICAS[:1])
+    def test_reads_go_to_the_replica_until_the_user_writes(self):
+        with CaptureQueriesContext(self.replica) as queries:
+            self.client.get(self.url)
+        self.assertTrue(queries)
+
+        product = ProductFactory()
+        self.client.post(
+            self.url,
+            {"products_id": [product.pk], "user": self.user.pk},
+            content_type="application/json",
+        )
+
+        with CaptureQueriesContext(self.replica) as queries:
+            response = self.client.get(self.url)
+        self.assertFalse(queries)
+        self.assertEqual(len(response.json()["results"]), 1)
@@ -0,0 +1,171 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from api.throttling import CounterThrottle, ReadThrottle, WriteThrottle
+from order.factories import OrderFactory, UserFactory
+from product.factories import ProductFactory
+
+RATES = {"read": "3/min", "write": "2/min"}
+
+
+class CountingCache:
+    """Records the cache calls made through it."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.calls = []
+
+    def __getattr__(self, name):
+        self.calls.append(name)
+        return getattr(self.backend, name)
+
+
+@override_settings(THROTTLE_RATES=RATES)
+class TestThrottling(APITestCase):
+    def setUp(self):
+        # Counters are keyed by user id, which other tests reuse.
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("product-list", kwargs={"version": "v1"})
+
+    def test_reads_are_throttled_per_user(self):
+        for _ in range(3):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertLessEqual(int(response["Retry-After"]), 60)
+
+        self.client.force_authenticate(user=UserFactory())
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_writes_have_their_own_budget(self):
+        for _ in range(3):
+            self.client.get(self.url)
+        url = reverse("category-list", kwargs={"version": "v1"})
+
+        statuses = [
+            self.client.post(url, {"title": "t", "slug": f"s{index}"}).status_code
+            for index in range(3)
+        ]
+
+        self.assertEqual(statuses, [201, 201, 429])
+
+    def test_tokens_are_throttled(self):
+        token = Token.objects.create(user=self.user)
+        self.client.force_authenticate(user=None)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+        statuses = [self.client.get(self.url).status_code for _ in range(4)]
+
+        self.assertEqual(statuses, [200, 200, 200, 429])
+
+    def test_anonymous_clients_are_throttled_per_ip(self):
+        self.client.force_authenticate(user=None)
+        url = reverse("category-list", kwargs={"version": "v1"})
+
+        for _ in range(3):
+            self.client.get(url, REMOTE_ADDR="10.0.0.1")
+
+        self.assertEqual(self.client.get(url, REMOTE_ADDR="10.0.0.1").status_code, 429)
+        self.assertEqual(self.client.get(url, REMOTE_ADDR="10.0.0.2").status_code, 200)
+
+    def test_budget_is_restored_in_the_next_window(self):
+        now = time.time()
+        with mock.patch.object(CounterThrottle, "timer", return_value=now):
+            for _ in range(4):
+                self.client.get(self.url)
+        with mock.patch.object(CounterThrottle, "timer", return_value=now + 60):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(THROTTLE_RATES={"read": "", "write": ""})
+    def test_empty_rate_disables_throttling(self):
+        statuses = {self.client.get(self.url).status_code for _ in range(5)}
+
+        self.assertEqual(statuses, {200})
+
+
+class TestThrottleOverhead(APITestCase):
+    """What a throttle check adds to each request."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+        # Not served from the catalog cache, so every request hits the database.
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+        OrderFactory(user=self.user, product=ProductFactory.create_batch(2))
+
+    def count_queries(self, rates):
+        with override_settings(THROTTLE_RATES=rates):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_throttling_adds_no_queries(self):
+        # Warm the token cache; the page then costs the same either way.
+        self.client.get(self.url)
+
+        self.assertEqual(
+            self.count_queries({"read": "1000/min", "write": "1000/min"}),
+            self.count_queries({"read": "", "write": ""}),
+        )
+
+    def test_check_is_one_cache_call(self):
+        request = APIRequestFactory().get("/")
+        force_authenticate(request, user=self.user)
+        request = Request(request)
+        counting = CountingCache(cache)
+
+        with mock.patch.object(CounterThrottle, "cache", counting):
+            with self.assertNumQueries(0):
+                ReadThrottle().allow_request(request, None)
+                first = list(counting.calls)
+                counting.calls.clear()
+                ReadThrottle().allow_request(request, None)
+
+        self.assertEqual(first, ["incr", "add"])
+        self.assertEqual(counting.calls, ["incr"])
+
+    def test_write_budget_is_not_checked_on_reads(self):
+        request = Request(APIRequestFactory().get("/"))
+        counting = CountingCache(cache)
+
+        with mock.patch.object(CounterThrottle, "cache", counting):
+            WriteThrottle().allow_request(request, None)
+
+        self.assertEqual(counting.calls, [])
+
+
+class TestThrottleCheckLatency(SimpleTestCase):
+    iterations = 2000
+
+    @override_settings(THROTTLE_RATES={"read": "1000000/min"})
+    def test_check_stays_cheap(self):
+        request = APIRequestFactory().get("/", REMOTE_ADDR="10.0.0.3")
+        request = Request(request)
+
+        started = time.perf_counter()
+        for _ in range(self.iterations):
+            ReadThrottle().allow_request(request, None)
+        per_check_ms = (time.perf_counter() - started) * 1000 / self.iterations
+
+        # A local-memory increment takes microseconds; this only catches a
+        # check that started doing real work, such as a query.
+        self.assertLess(per_check_ms, 1)
@@ -0,0 +1,87 @@
+"""
+Request throttling on shared cache counters.
+
+Each request is counted against one identity: its token when it
+authenticated with one, else its user, else its client IP. Safe requests
+spend the ``read`` budget and the others the ``write`` budget, both
+configured in ``THROTTLE_RATES`` as ``"<requests>/<period>"``.
+
+A budget is a counter per identity and window of the rate's period, bumped
+with one atomic ``cache.incr``, so a check costs a single cache round-trip
+(two on the first request of a window) and never touches the database.
+Counters are only shared between workers with a shared cache
+(``CACHE_BACKEND``/``CACHE_LOCATION``).
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class CounterThrottle(SimpleRateThrottle):
+    """
+    Fixed-window counter throttle. Unlike ``SimpleRateThrottle``, which reads
+    and rewrites a list of timestamps, it never needs more than an increment.
+    """
+
+    cache = cache
+
+    def get_rate(self):
+        # Read on every request so the rates can be changed in settings.
+        return settings.THROTTLE_RATES.get(self.scope) or None
+
+    def applies_to(self, request):
+        return True
+
+    def get_cache_key(self, request, view):
+        if isinstance(request.auth, Token):
+            digest = hashlib.sha256(request.auth.key.encode()).hexdigest()
+            ident = f"token:{digest[:32]}"
+        elif request.user and request.user.is_authenticated:
+            ident = f"user:{request.user.pk}"
+        else:
+            ident = f"ip:{self.get_ident(request)}"
+        return f"throttle:{self.scope}:{ident}:{self.window}"
+
+    def allow_request(self, request, view):
+        if self.rate is None or not self.applies_to(request):
+            return True
+
+        self.now = self.timer()
+        self.window = int(self.now // self.duration)
+        key = self.get_cache_key(request, view)
+        try:
+            count = self.cache.incr(key)
+        except ValueError:
+            # First request of the window; an expired counter can not leak
+            # into the next window, whose key differs.
+            if self.cache.add(key, 1, self.duration + 1):
+                count = 1
+            else:
+                count = self.cache.incr(key)
+        return count <= self.num_requests
+
+    def wait(self):
+        return (self.window + 1) * self.duration - self.now
+
+    def timer(self):
+        return time.time()
+
+
+class ReadThrottle(CounterThrottle):
+    scope = "read"
+
+    def applies_to(self, request):
+        return request.method in SAFE_METHODS
+
+
+class WriteThrottle(CounterThrottle):
+    scope = "write"
+
+    def applies_to(self, request):
+        return request.method not in SAFE_METHODS
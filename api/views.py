@@ -1,3 +1,28 @@
-from django.shortcuts import render
+import hmac
 
-# Create your views here.
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+from api.metrics import render_metrics
+
+
+def can_read_metrics(request):
+    # Open only while debugging without a token; otherwise the bearer token
+    # or a staff session is required.
+    if request.user.is_staff:
+        return True
+    if settings.METRICS_TOKEN:
+        return hmac.compare_digest(
+            request.headers.get("Authorization", ""),
+            f"Bearer {settings.METRICS_TOKEN}",
+        )
+    return settings.DEBUG
+
+
+def metrics(request):
+    """Prometheus text exposition of this worker's request metrics."""
+    if not can_read_metrics(request):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,117 @@
+"""
+Per-request cost of each authentication scheme.
+
+Runs every authentication class the API accepts against a GET request on a
+throwaway test database and reports its queries and latency::
+
+    python benchmarks/auth.py --iterations 200
+
+``basic`` hashes the password on every request, ``token`` joins the token
+and user tables, ``cached-token`` reads a user snapshot from the cache after
+the first request, and ``session`` loads the session and then the user.
+"""
+
+import argparse
+import base64
+import sys
+
+from suite import measure, setup_django
+
+PASSWORD = "benchmark-password"
+
+
+def schemes():
+    from django.conf import settings
+    from django.contrib.auth.middleware import AuthenticationMiddleware
+    from django.contrib.sessions.backends.db import SessionStore
+    from django.contrib.sessions.middleware import SessionMiddleware
+    from django.test import RequestFactory
+    from rest_framework.authentication import (
+        BasicAuthentication,
+        SessionAuthentication,
+        TokenAuthentication,
+    )
+    from rest_framework.authtoken.models import Token
+    from rest_framework.request import Request
+
+    from api.authentication import CachedTokenAuthentication
+    from order.factories import UserFactory
+
+    user = UserFactory()
+    user.set_password(PASSWORD)
+    user.save()
+    token = Token.objects.create(user=user)
+
+    session = SessionStore()
+    session["_auth_user_id"] = str(user.pk)
+    session["_auth_user_backend"] = settings.AUTHENTICATION_BACKENDS[0]
+    session["_auth_user_hash"] = user.get_session_auth_hash()
+    session.create()
+
+    factory = RequestFactory()
+    basic = base64.b64encode(f"{user.username}:{PASSWORD}".encode()).decode()
+
+    def scheme(authentication_class, **headers):
+        def run():
+            request = factory.get("/", **headers)
+            if authentication_class is SessionAuthentication:
+                SessionMiddleware(lambda request: None).process_request(request)
+                AuthenticationMiddleware(lambda request: None).process_request(request)
+            result = authentication_class().authenticate(Request(request))
+            assert result and result[0].pk == user.pk, result
+
+        return run
+
+    return {
+        "basic": scheme(BasicAuthentication, HTTP_AUTHORIZATION=f"Basic {basic}"),
+        "token": scheme(TokenAuthentication, HTTP_AUTHORIZATION=f"Token {token.key}"),
+        "cached-token": scheme(
+            CachedTokenAuthentication, HTTP_AUTHORIZATION=f"Token {token.key}"
+        ),
+        "session": scheme(
+            SessionAuthentication,
+            HTTP_COOKIE=f"{settings.SESSION_COOKIE_NAME}={session.session_key}",
+        ),
+    }
+
+
+def run(options):
+    # The cached scheme needs a real cache even though the suite disables it.
+    setup_django(use_cache=True)
+
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+        teardown_test_environment,
+    )
+
+    setup_test_environment(debug=False)
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        return {
+            name: measure(scheme, options.iterations, options.warmup)
+            for name, scheme in schemes().items()
+        }
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=5)
+    options = parser.parse_args(argv)
+
+    print(f"{'scheme':<14} {'queries':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, result in run(options).items():
+        print(
+            f"{name:<14} {result['queries']:>7} {result['p50_ms']:>9.3f} "
+            f"{result['p95_ms']:>9.3f} {result['p99_ms']:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Time-to-first-byte and throughput of a streaming export::
+
+    python benchmarks/export_ttfb.py http://127.0.0.1:8000/bookstore/v1/order/export/ \\
+        --token <key> --format csv
+"""
+
+import argparse
+import http.client
+import time
+from urllib.parse import urlencode, urlsplit
+
+
+def measure(url, token=None, export_format="ndjson"):
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80)
+    headers = {"Authorization": f"Token {token}"} if token else {}
+    path = f"{parts.path}?{urlencode({'format': export_format})}"
+
+    started = time.perf_counter()
+    connection.request("GET", path, headers=headers)
+    response = connection.getresponse()
+    first = response.read1()
+    ttfb = time.perf_counter() - started
+
+    size, lines = len(first), first.count(b"\n")
+    while chunk := response.read1():
+        size += len(chunk)
+        lines += chunk.count(b"\n")
+    total = time.perf_counter() - started
+    connection.close()
+
+    return {
+        "status": response.status,
+        "ttfb_ms": ttfb * 1000,
+        "total_s": total,
+        "bytes": size,
+        "lines": lines,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure a streaming export.")
+    parser.add_argument("url")
+    parser.add_argument("--token")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="ndjson")
+    args = parser.parse_args(argv)
+
+    result = measure(args.url, args.token, args.format)
+    print(
+        f"HTTP {result['status']}  TTFB {result['ttfb_ms']:.1f} ms  "
+        f"total {result['total_s']:.2f} s  {result['lines']} lines  "
+        f"{result['bytes'] / 1024:.0f} KiB  "
+        f"{result['lines'] / result['total_s']:.0f} lines/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+HTTP load generator for comparing the sync (WSGI) and async (ASGI) read paths.
+
+Hit a running server::
+
+    python benchmarks/loadtest.py http://127.0.0.1:8000/bookstore/v1/async/product/ \\
+        --token <key> --concurrency 200 --requests 5000
+
+Or let the script start each server of a comparison in turn against the
+local database and run the same load against it::
+
+    # gunicorn (WSGI, DRF viewsets) vs uvicorn (ASGI, async views)
+    python benchmarks/loadtest.py --compare async --concurrency 200
+
+    # runserver vs the production profile (gunicorn.conf.py, persistent or
+    # pooled connections)
+    python benchmarks/loadtest.py --compare profile --concurrency 200
+
+Compared servers run with ``DEBUG=0`` and the catalog cache disabled so every
+request reaches the database. A ``loadtest`` user and token are created on
+first use.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SYNC_PATH = "/bookstore/v2/product/"
+ASYNC_PATH = "/bookstore/v1/async/product/"
+
+
+async def read_response(reader):
+    """Read one HTTP/1.1 response; return ``(status, keep_alive)``."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by server")
+    status = int(status_line.split()[1])
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+
+    return status, headers.get("connection") != "close"
+
+
+async def worker(url, headers, deadline, counter, latencies, errors):
+    parts = urlsplit(url)
+    request = (
+        f"GET {parts.path}?{parts.query} HTTP/1.1\r\n"
+        f"Host: {parts.netloc}\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers)
+    )
+    reader = writer = None
+
+    while counter[0] > 0 and time.monotonic() < deadline:
+        counter[0] -= 1
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(
+                    parts.hostname,
+                    parts.port or (443 if parts.scheme == "https" else 80),
+                    ssl=parts.scheme == "https",
+                )
+            writer.write(request.encode() + b"\r\n")
+            await writer.drain()
+            status, keep_alive = await read_response(reader)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            errors.append("connection")
+            writer = None
+            continue
+
+        latencies.append(time.perf_counter() - started)
+        if status != 200:
+            errors.append(status)
+        if not keep_alive:
+            writer.close()
+            writer = None
+
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(url, token, concurrency, requests, duration):
+    headers = [("Connection", "keep-alive")]
+    if token:
+        headers.append(("Authorization", f"Token {token}"))
+
+    latencies, errors = [], []
+    counter = [requests]
+    deadline = time.monotonic() + duration
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            worker(url, headers, deadline, counter, latencies, errors)
+            for _ in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    return summarize(latencies, errors, elapsed)
+
+
+def summarize(latencies, errors, elapsed):
+    latencies = sorted(latencies)
+
+    def percentile(p):
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def print_report(label, result):
+    print(
+        f"{label:<6} {result['requests']:>7} req  {result['errors']:>5} err  "
+        f"{result['rps']:>9.1f} req/s  p50 {result['p50_ms']:>8.1f} ms  "
+        f"p95 {result['p95_ms']:>8.1f} ms  p99 {result['p99_ms']:>8.1f} ms"
+    )
+
+
+def get_token():
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bookstore.settings")
+
+    import django
+
+    django.setup()
+
+    from django.contrib.auth.models import User
+    from rest_framework.authtoken.models import Token
+
+    user, _ = User.objects.get_or_create(username="loadtest")
+    token, _ = Token.objects.get_or_create(user=user)
+    return token.key
+
+
+def wait_for(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def serve(command, port, env):
+    env = {
+        **os.environ,
+        "DEBUG": "0",
+        "CACHE_BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        # One client sends every request: do not throttle it.
+        "THROTTLE_READ_RATE": "",
+        "THROTTLE_WRITE_RATE": "",
+        **env,
+    }
+    process = subprocess.Popen(
+        command,
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    wait_for(port)
+    return process
+
+
+def gunicorn(args):
+    return (
+        [sys.executable, "-m", "gunicorn", "bookstore.wsgi:application"]
+        + ["--config", "gunicorn.conf.py"],
+        {
+            "GUNICORN_BIND": f"127.0.0.1:{args.port}",
+            "GUNICORN_WORKERS": str(args.workers),
+            "GUNICORN_THREADS": str(args.threads),
+            "GUNICORN_ACCESSLOG": "",
+            "SQL_CONN_MAX_AGE": "60",
+            "SQL_CONN_HEALTH_CHECKS": "1",
+            "SQL_POOL": "1",
+        },
+    )
+
+
+def async_servers(args):
+    """Sync DRF viewsets on gunicorn against the async views on uvicorn."""
+    uvicorn = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "bookstore.asgi:application",
+        "--port",
+        str(args.port),
+        "--workers",
+        str(args.workers),
+        "--no-access-log",
+    ]
+    return [
+        ("wsgi", SYNC_PATH, *gunicorn(args)),
+        ("asgi", ASYNC_PATH, uvicorn, {"SQL_CONN_MAX_AGE": "60"}),
+    ]
+
+
+def profile_servers(args):
+    """The development server against the production gunicorn profile."""
+    runserver = [
+        sys.executable,
+        "manage.py",
+        "runserver",
+        f"127.0.0.1:{args.port}",
+        "--noreload",
+    ]
+    return [
+        ("dev", SYNC_PATH, runserver, {"SQL_CONN_MAX_AGE": "0"}),
+        ("prod", SYNC_PATH, *gunicorn(args)),
+    ]
+
+
+COMPARISONS = {"async": async_servers, "profile": profile_servers}
+
+
+def compare(args):
+    token = args.token or get_token()
+
+    for label, path, command, env in COMPARISONS[args.compare](args):
+        process = serve(command, args.port, env)
+        try:
+            url = f"http://127.0.0.1:{args.port}{path}?page_size={args.page_size}"
+            asyncio.run(run_load(url, token, args.concurrency, args.warmup, 30))
+            result = asyncio.run(
+                run_load(url, token, args.concurrency, args.requests, args.duration)
+            )
+            print_report(label, result)
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("url", nargs="?", help="URL to load (omit with --compare)")
+    parser.add_argument("--token", help="API token to authenticate with")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument(
+        "--compare",
+        choices=sorted(COMPARISONS),
+        help="start servers and compare them: async (WSGI vs ASGI) or "
+        "profile (runserver vs the production gunicorn profile)",
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--threads", type=int, default=4, help="gunicorn threads per worker"
+    )
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(args)
+    elif args.url:
+        result = asyncio.run(
+            run_load(
+                args.url, args.token, args.concurrency, args.requests, args.duration
+            )
+        )
+        print_report("load", result)
+    else:
+        parser.error("pass a URL or --compare")
+
+
+if __name__ == "__main__":
+    main()
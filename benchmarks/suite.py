@@ -0,0 +1,341 @@
+"""
+Benchmark suite for the REST endpoints and the ORM paths behind them.
+
+Seeds a throwaway test database with the bulk factory mode, times each
+scenario through ``APIClient`` or the raw ORM, and writes query counts plus
+latency percentiles as JSON::
+
+    python benchmarks/suite.py --products 10000 --orders 100000 \\
+        --products-per-order 5 --output results.json
+
+``--baseline`` compares against an earlier results file and exits with status
+1 when a scenario's p50 grows by more than ``--threshold`` or it runs more
+queries than before::
+
+    python benchmarks/suite.py --baseline baseline.json --output results.json
+
+The catalog response cache is disabled unless ``--cache`` is given, so list
+and retrieve timings measure the database and serializers.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django(use_cache):
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bookstore.settings")
+    if not use_cache:
+        os.environ["CACHE_BACKEND"] = "django.core.cache.backends.dummy.DummyCache"
+
+    import django
+
+    django.setup()
+
+
+def seed(options):
+    from order.factories import OrderFactory, UserFactory
+    from order.sales import rebuild_sales
+    from product.factories import CategoryFactory, ProductFactory
+
+    rng = random.Random(options.seed)
+    categories = CategoryFactory.create_batch(options.categories)
+    products = ProductFactory.create_bulk(
+        options.products,
+        category=lambda index: rng.sample(categories, 2),
+        batch_size=options.batch_size,
+    )
+
+    users = UserFactory.create_batch(options.users)
+    per_user, extra = divmod(options.orders, options.users)
+    for index, user in enumerate(users):
+        OrderFactory.create_bulk(
+            per_user + (index < extra),
+            user=user,
+            product=lambda index: rng.sample(products, options.products_per_order),
+            batch_size=options.batch_size,
+        )
+    rebuild_sales(batch_size=options.batch_size)
+
+    return users[0], products
+
+
+def measure(run, iterations, warmup):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    for _ in range(warmup):
+        run()
+
+    # Counted on a separate call: capturing queries slows them down.
+    with CaptureQueriesContext(connection) as queries:
+        run()
+    # Read now: the next request resets the connection's query log.
+    query_count = len(queries)
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+
+    def percentile(p):
+        return timings[min(len(timings) - 1, int(len(timings) * p))]
+
+    return {
+        "iterations": iterations,
+        "queries": query_count,
+        "mean_ms": statistics.fmean(timings),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def scenarios(user, products, options):
+    from datetime import timedelta
+
+    from django.db import transaction
+    from django.db.models import Sum
+    from django.urls import reverse
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+
+    from order.models import Order, OrderItem
+    from order.sales import bestsellers
+    from order.serializers import OrderBulkSerializer
+    from product.models import Product
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    rng = random.Random(options.seed)
+    order = Order.objects.filter(user=user).first()
+    product = products[len(products) // 2]
+    sample = products[: options.products_per_order]
+    stocked = products[-options.products_per_order:]
+    Product.objects.filter(pk__in=[p.pk for p in stocked]).update(stock=10**9)
+
+    def url(name, **kwargs):
+        return reverse(name, kwargs={"version": "v1", **kwargs})
+
+    def get(path, version="v1", **params):
+        def run():
+            response = client.get(path.replace("/v1/", f"/{version}/"), params)
+            assert response.status_code == 200, response.status_code
+
+        return run
+
+    def create_order():
+        response = client.post(
+            url("order-list"),
+            {"products_id": [p.pk for p in sample], "user": user.pk},
+            format="json",
+        )
+        assert response.status_code == 201, response.status_code
+
+    def bulk_orders():
+        items = [
+            {
+                "user": user.pk,
+                "products_id": [
+                    p.pk for p in rng.sample(products, options.products_per_order)
+                ],
+            }
+            for _ in range(options.bulk_size)
+        ]
+        response = client.post(url("order-bulk"), items, format="json")
+        assert response.status_code == 201, response.status_code
+
+    def orm_product_list():
+        list(Product.objects.with_categories().order_by("id")[:20])
+
+    def orm_order_list():
+        list(
+            Order.objects.with_products()
+            .filter(user=user)
+            .order_by("-created_at", "-id")[:20]
+        )
+
+    def orm_order_retrieve():
+        Order.objects.with_products().get(pk=order.pk).product.all()[0]
+
+    def orm_order_create():
+        created = Order.objects.create(user=user)
+        created.product.add(*sample)
+
+    def orm_bulk_orders():
+        serializer = OrderBulkSerializer(
+            data=[
+                {"user": user.pk, "products_id": [p.pk for p in sample]}
+                for _ in range(options.bulk_size)
+            ]
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+    def orm_stock_reserve():
+        with transaction.atomic():
+            Product.objects.reserve({p.pk: 1 for p in stocked})
+
+    def orm_bestsellers():
+        bestsellers(30, 10)
+
+    def orm_bestsellers_live():
+        # What the rollups replace: aggregating every order line in the window.
+        since = timezone.now() - timedelta(days=30)
+        list(
+            OrderItem.objects.filter(order__created_at__gte=since)
+            .values("product", "product__title")
+            .annotate(units=Sum("quantity"))
+            .order_by("-units", "product")[:10]
+        )
+
+    return {
+        "api.product_list.v1": get(url("product-list")),
+        "api.product_list.v2": get(url("product-list"), "v2", page_size=20),
+        "api.product_search": get(url("product-list"), q="a"),
+        "api.product_retrieve": get(url("product-detail", pk=product.pk)),
+        "api.category_list": get(url("category-list")),
+        "api.bestsellers": get(url("product-bestsellers")),
+        "api.order_list.v1": get(url("order-list")),
+        "api.order_mine.v2": get(url("order-mine"), "v2", page_size=20),
+        "api.order_retrieve": get(url("order-detail", pk=order.pk)),
+        "api.order_create": create_order,
+        "api.order_bulk": bulk_orders,
+        "orm.product_list": orm_product_list,
+        "orm.order_list": orm_order_list,
+        "orm.order_retrieve": orm_order_retrieve,
+        "orm.order_create": orm_order_create,
+        "orm.order_bulk": orm_bulk_orders,
+        "orm.stock_reserve": orm_stock_reserve,
+        "orm.bestsellers": orm_bestsellers,
+        "orm.bestsellers_live": orm_bestsellers_live,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return the scenarios that got slower or run more queries."""
+    regressions = []
+    for name, before in baseline["results"].items():
+        after = results["results"].get(name)
+        if after is None:
+            continue
+        if after["queries"] > before["queries"]:
+            regressions.append(
+                f"{name}: {before['queries']} -> {after['queries']} queries"
+            )
+        if after["p50_ms"] > before["p50_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p50 {before['p50_ms']:.2f} -> {after['p50_ms']:.2f} ms"
+            )
+    return regressions
+
+
+def print_table(results):
+    print(f"{'scenario':<24} {'queries':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, result in results["results"].items():
+        print(
+            f"{name:<24} {result['queries']:>7} {result['p50_ms']:>9.2f} "
+            f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f}"
+        )
+
+
+def run(options):
+    setup_django(options.cache)
+
+    import django
+    from django.db import connection
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+        teardown_test_environment,
+    )
+
+    setup_test_environment(debug=False)
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        started = time.perf_counter()
+        user, products = seed(options)
+        seeded = time.perf_counter() - started
+        print(f"Seeded in {seeded:.1f}s", file=sys.stderr)
+
+        results = {}
+        for name, scenario in scenarios(user, products, options).items():
+            if options.only and not any(part in name for part in options.only):
+                continue
+            results[name] = measure(scenario, options.iterations, options.warmup)
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+    return {
+        "meta": {
+            "products": options.products,
+            "orders": options.orders,
+            "products_per_order": options.products_per_order,
+            "users": options.users,
+            "categories": options.categories,
+            "iterations": options.iterations,
+            "cache": options.cache,
+            "seed_seconds": seeded,
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--orders", type=int, default=100000)
+    parser.add_argument("--products-per-order", type=int, default=5)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--bulk-size", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache", action="store_true")
+    parser.add_argument(
+        "--only", nargs="*", help="Run scenarios whose name contains any of these"
+    )
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed p50 growth (0.2 = 20%%)"
+    )
+    options = parser.parse_args(argv)
+
+    results = run(options)
+    print_table(results)
+
+    if options.output:
+        Path(options.output).write_text(json.dumps(results, indent=2) + "\n")
+
+    if options.baseline:
+        baseline = json.loads(Path(options.baseline).read_text())
+        regressions = compare(results, baseline, options.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
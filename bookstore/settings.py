@@ -42,11 +42,14 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "rest_framework.authtoken",
+    "api",
     "order",
     "product",
+    "jobs",
 ]
 
 MIDDLEWARE = [
+    "api.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -87,9 +90,93 @@ DATABASES = {
         "PASSWORD": os.environ.get("SQL_PASSWORD", "password"),
         "HOST": os.environ.get("SQL_HOST", "localhost"),
         "PORT": os.environ.get("SQL_PORT", "5432"),
+        # Seconds to keep a connection open between requests (0 closes it at
+        # the end of every request). Health checks drop stale ones first.
+        "CONN_MAX_AGE": int(os.environ.get("SQL_CONN_MAX_AGE", 0)),
+        "CONN_HEALTH_CHECKS": bool(int(os.environ.get("SQL_CONN_HEALTH_CHECKS", 0))),
     }
 }
 
+# psycopg connection pool, one per worker process. Replaces persistent
+# connections, so CONN_MAX_AGE must stay 0.
+if (
+    int(os.environ.get("SQL_POOL", 0))
+    and "postgresql" in DATABASES["default"]["ENGINE"]
+):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.environ.get("SQL_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.environ.get("SQL_POOL_MAX_SIZE", 10)),
+            "timeout": int(os.environ.get("SQL_POOL_TIMEOUT", 10)),
+        }
+    }
+
+# Read replicas: SQL_REPLICA_DATABASES and/or SQL_REPLICA_HOSTS are comma
+# separated, one entry per replica (a single entry is shared by all of them);
+# everything else is copied from "default". Two SQLite files work locally.
+# In tests each replica mirrors the default test database.
+_replica_names = [
+    v for v in os.environ.get("SQL_REPLICA_DATABASES", "").split(",") if v
+]
+_replica_hosts = [v for v in os.environ.get("SQL_REPLICA_HOSTS", "").split(",") if v]
+DATABASE_REPLICAS = []
+for _index in range(max(len(_replica_names), len(_replica_hosts))):
+    DATABASE_REPLICAS.append(f"replica{_index + 1}")
+    DATABASES[DATABASE_REPLICAS[-1]] = {
+        **DATABASES["default"],
+        "NAME": (_replica_names or [DATABASES["default"]["NAME"]])[
+            min(_index, len(_replica_names) - 1)
+        ],
+        "HOST": (_replica_hosts or [DATABASES["default"]["HOST"]])[
+            min(_index, len(_replica_hosts) - 1)
+        ],
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["api.replicas.ReplicaRouter"]
+
+# Seconds a user's reads stay on the primary after they write.
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", 10))
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
+    }
+}
+
+CATALOG_CACHE_TIMEOUT = int(os.environ.get("CATALOG_CACHE_TIMEOUT", 300))
+BESTSELLERS_CACHE_TIMEOUT = int(os.environ.get("BESTSELLERS_CACHE_TIMEOUT", 60))
+
+
+# Instrumentation
+# Requests slower than this are logged with their queries. /metrics asks for
+# "Authorization: Bearer <METRICS_TOKEN>" or a staff session; without a token
+# it is only open while DEBUG is on.
+
+SLOW_REQUEST_MS = int(os.environ.get("SLOW_REQUEST_MS", 500))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+
+# Background jobs
+# `manage.py run_workers` runs JOBS_WORKERS processes; a failed job is retried
+# after JOBS_RETRY_BACKOFF seconds, doubled per attempt, and a job whose
+# worker stopped answering is requeued after JOBS_LOCK_TIMEOUT seconds.
+
+JOBS_WORKERS = int(os.environ.get("JOBS_WORKERS", 2))
+JOBS_POLL_INTERVAL = float(os.environ.get("JOBS_POLL_INTERVAL", 1))
+JOBS_MAX_ATTEMPTS = int(os.environ.get("JOBS_MAX_ATTEMPTS", 5))
+JOBS_RETRY_BACKOFF = int(os.environ.get("JOBS_RETRY_BACKOFF", 10))
+JOBS_RETRY_BACKOFF_MAX = int(os.environ.get("JOBS_RETRY_BACKOFF_MAX", 3600))
+JOBS_LOCK_TIMEOUT = int(os.environ.get("JOBS_LOCK_TIMEOUT", 300))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -134,15 +221,36 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
 REST_FRAMEWORK = {
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.VersionedPagination",
     "PAGE_SIZE": 5,
+    "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
+    "ALLOWED_VERSIONS": ["v1", "v2"],
+    # Cheapest first: Basic hashes the password on every request.
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.BasicAuthentication",
+        "api.authentication.CachedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+    ],
+    "DEFAULT_THROTTLE_CLASSES": [
+        "api.throttling.ReadThrottle",
+        "api.throttling.WriteThrottle",
     ],
 }
 
+# Requests per token, user or (for anonymous clients) IP: "<count>/<period>"
+# with a period of sec, min, hour or day. An empty rate disables the budget.
+THROTTLE_RATES = {
+    "read": os.environ.get("THROTTLE_READ_RATE", "1200/min"),
+    "write": os.environ.get("THROTTLE_WRITE_RATE", "120/min"),
+}
+
+# Seconds a token -> user lookup stays cached.
+TOKEN_CACHE_TIMEOUT = int(os.environ.get("TOKEN_CACHE_TIMEOUT", 60))
+
+# Seconds a create response stays replayable for its Idempotency-Key;
+# `manage.py purge_idempotency_keys` deletes older keys.
+IDEMPOTENCY_KEY_TTL = int(os.environ.get("IDEMPOTENCY_KEY_TTL", 24 * 60 * 60))
+
 INTERNAL_IPS = [
     "127.0.0.1",
 ]
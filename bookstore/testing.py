@@ -0,0 +1,40 @@
+from contextlib import contextmanager
+
+from rest_framework import status
+
+from jobs.worker import run_pending
+
+
+class QueryCountMixin:
+    """
+    Test helpers for guarding endpoints against N+1 queries.
+
+    Meant to be mixed into a Django/DRF ``TestCase``.
+    """
+
+    def assertConstantQueries(self, num, request, grow, rounds=3):
+        """
+        Assert that ``request()`` runs exactly ``num`` queries, calling
+        ``grow()`` between rounds to add more rows to the page.
+        """
+        for _ in range(rounds):
+            with self.assertNumQueries(num):
+                response = request()
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            grow()
+
+
+class JobsMixin:
+    """
+    Runs background jobs inline. Meant to be mixed into a Django/DRF
+    ``TestCase``, where nothing commits and ``on_commit`` callbacks are
+    dropped unless captured.
+    """
+
+    @contextmanager
+    def runJobs(self):
+        """Run the jobs queued by the block, as a worker would after commit."""
+        with self.captureOnCommitCallbacks(execute=True):
+            yield
+        run_pending()
@@ -0,0 +1,32 @@
+#!/bin/sh
+# Start the server selected by SERVER_MODE:
+#   dev  - Django development server (default)
+#   wsgi - gunicorn, configured by gunicorn.conf.py
+#   asgi - uvicorn serving bookstore.asgi
+#   worker - background job workers (manage.py run_workers)
+set -e
+
+if [ "${DJANGO_MIGRATE:-0}" = "1" ]; then
+    python manage.py migrate --noinput
+fi
+
+case "${SERVER_MODE:-dev}" in
+    wsgi)
+        exec gunicorn bookstore.wsgi:application --config gunicorn.conf.py
+        ;;
+    asgi)
+        exec uvicorn bookstore.asgi:application \
+            --host 0.0.0.0 --port 8000 \
+            --workers "${UVICORN_WORKERS:-2}" --no-access-log
+        ;;
+    dev)
+        exec python manage.py runserver 0.0.0.0:8000
+        ;;
+    worker)
+        exec python manage.py run_workers
+        ;;
+    *)
+        echo "Unknown SERVER_MODE: ${SERVER_MODE}" >&2
+        exit 1
+        ;;
+esac
@@ -0,0 +1,18 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from jobs.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ["id", "name", "status", "attempts", "run_at", "created_at"]
+    list_filter = ["status", "name"]
+    readonly_fields = ["attempts", "locked_by", "locked_at", "last_error"]
+    actions = ["retry"]
+
+    @admin.action(description="Retry selected jobs now")
+    def retry(self, request, queryset):
+        queryset.exclude(status=Job.Status.RUNNING).update(
+            status=Job.Status.QUEUED, attempts=0, run_at=timezone.now()
+        )
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    name = "jobs"
+
+    def ready(self):
+        from django.utils.module_loading import autodiscover_modules
+
+        # Register the tasks of every app so workers can look them up by name.
+        autodiscover_modules("tasks")
@@ -0,0 +1,81 @@
+import multiprocessing
+import signal
+
+import django
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+def _work_in_process(burst, poll_interval):
+    # Spawned processes start from a fresh interpreter: set Django up before
+    # importing anything that defines models.
+    django.setup()
+    from jobs.worker import work
+
+    work(burst=burst, poll_interval=poll_interval)
+
+
+class Command(BaseCommand):
+    help = "Run background job workers until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=settings.JOBS_WORKERS,
+            help="Number of worker processes (default: JOBS_WORKERS).",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling for new jobs.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            help="Seconds to wait when the queue is empty (default: "
+            "JOBS_POLL_INTERVAL).",
+        )
+
+    def handle(self, *args, **options):
+        from jobs.worker import work
+
+        if isinstance(caches["default"], LocMemCache):
+            # Jobs invalidate cached responses (catalog generation bumps); in
+            # a process-local cache those never reach the web processes.
+            raise CommandError(
+                "run_workers needs a cache shared with the web processes; "
+                "set CACHE_BACKEND/CACHE_LOCATION (e.g. RedisCache)."
+            )
+
+        burst, poll_interval = options["burst"], options["poll_interval"]
+
+        if options["processes"] <= 1:
+            processed = work(burst=burst, poll_interval=poll_interval)
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs."))
+            return
+
+        # Children open their own connections.
+        connections.close_all()
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_work_in_process, args=(burst, poll_interval))
+            for _ in range(options["processes"])
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(f"Started {len(processes)} workers.")
+
+        def stop(signum, frame):
+            # Workers finish their current job before exiting.
+            for process in processes:
+                process.terminate()
+
+        signal.signal(signal.SIGTERM, stop)
+        # Ctrl-C reaches the whole process group, workers included.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        for process in processes:
+            process.join()
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+
+class JobQuerySet(models.QuerySet):
+    def due(self):
+        return self.filter(status=Job.Status.QUEUED, run_at__lte=timezone.now())
+
+    def claim(self, worker, candidates=10):
+        """
+        Take the next due job for ``worker``, or return ``None``.
+
+        A job is claimed with an ``UPDATE`` conditional on it still being
+        queued, so of several workers racing for it exactly one wins and the
+        others move on to the next candidate.
+        """
+        pks = list(
+            self.due()
+            .order_by("run_at", "id")
+            .values_list("pk", flat=True)[:candidates]
+        )
+        for pk in pks:
+            claimed = self.filter(pk=pk, status=Job.Status.QUEUED).update(
+                status=Job.Status.RUNNING,
+                locked_by=worker,
+                locked_at=timezone.now(),
+                attempts=F("attempts") + 1,
+            )
+            if claimed:
+                return self.get(pk=pk)
+        return None
+
+    def requeue_stale(self, timeout):
+        """Release jobs whose worker died without finishing them."""
+        return self.filter(
+            status=Job.Status.RUNNING,
+            locked_at__lt=timezone.now() - timedelta(seconds=timeout),
+        ).update(status=Job.Status.QUEUED, locked_by="", locked_at=None)
+
+
+class Job(models.Model):
+    class Status(models.TextChoices):
+        QUEUED = "queued"
+        RUNNING = "running"
+        FAILED = "failed"
+
+    name = models.CharField(max_length=200)
+    kwargs = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = JobQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_at"], name="job_status_run_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk}"
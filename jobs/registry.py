@@ -0,0 +1,55 @@
+"""
+Task registration and enqueueing.
+
+A task is a function decorated with ``@task`` in an app's ``tasks`` module.
+``task.delay(**kwargs)`` stores a ``Job`` once the current transaction
+commits, so work for a rolled back write is never queued and the request
+that enqueued it does not wait for it. Keyword arguments must be JSON
+serializable. A job is lost if the process dies between the commit and the
+enqueue, so tasks should only do work a rebuild command can redo.
+"""
+
+from functools import update_wrapper
+
+from django.conf import settings
+from django.db import transaction
+
+tasks = {}
+
+
+class Task:
+    def __init__(self, func, max_attempts=None):
+        update_wrapper(self, func)
+        self.func = func
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        self.max_attempts = max_attempts
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def delay(self, using=None, **kwargs):
+        from jobs.models import Job
+
+        def enqueue():
+            Job.objects.using(using).create(
+                name=self.name,
+                kwargs=kwargs,
+                max_attempts=self.max_attempts or settings.JOBS_MAX_ATTEMPTS,
+            )
+
+        transaction.on_commit(
+            enqueue,
+            using=using,
+            # The write has committed by then; a failed enqueue is logged
+            # rather than turned into an error response.
+            robust=True,
+        )
+
+
+def task(func=None, *, max_attempts=None):
+    def register(func):
+        registered = Task(func, max_attempts)
+        tasks[registered.name] = registered
+        return registered
+
+    return register(func) if func is not None else register
@@ -0,0 +1,206 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import task
+from jobs.worker import run_job, run_pending
+from product.models import Category
+
+calls = []
+
+
+@task
+def remember(value):
+    calls.append(value)
+
+
+@task(max_attempts=2)
+def create_then_fail(slug):
+    Category.objects.create(title=slug, slug=slug)
+    raise RuntimeError("boom")
+
+
+@task
+def create_then_lose_lock(slug):
+    Category.objects.create(title=slug, slug=slug)
+    # Presumed stale and handed to another worker while this one runs.
+    Job.objects.filter(name=create_then_lose_lock.name).update(locked_by="other")
+
+
+class TestEnqueue(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_jobs_are_queued_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            remember.delay(value=1)
+            self.assertFalse(Job.objects.exists())
+
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.kwargs), (remember.name, {"value": 1}))
+        self.assertEqual(job.status, Job.Status.QUEUED)
+
+    def test_rolled_back_writes_queue_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    remember.delay(value=1)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertFalse(Job.objects.exists())
+
+    def test_run_pending_runs_and_deletes_jobs(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            remember.delay(value=1)
+            remember.delay(value=2)
+
+        self.assertEqual(run_pending(), 2)
+        self.assertEqual(calls, [1, 2])
+        self.assertFalse(Job.objects.exists())
+
+
+@override_settings(JOBS_RETRY_BACKOFF=10, JOBS_RETRY_BACKOFF_MAX=15)
+class TestRetries(TestCase):
+    def test_failed_job_is_retried_with_backoff(self):
+        job = Job.objects.create(
+            name=create_then_fail.name, kwargs={"slug": "x"}, max_attempts=3
+        )
+
+        for attempt, delay in ((1, 10), (2, 15)):
+            Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+            claimed = Job.objects.claim("test")
+            started = timezone.now()
+            with self.assertLogs("jobs.worker", "WARNING"):
+                self.assertFalse(run_job(claimed))
+
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts), (Job.Status.QUEUED, attempt))
+            self.assertIn("RuntimeError: boom", job.last_error)
+            self.assertAlmostEqual(
+                (job.run_at - started).total_seconds(), delay, delta=1
+            )
+            # The job's writes were rolled back with it.
+            self.assertFalse(Category.objects.filter(slug="x").exists())
+
+        self.assertIsNone(Job.objects.claim("test"))
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        with self.assertLogs("jobs.worker", "WARNING") as logs:
+            run_job(Job.objects.claim("test"))
+        self.assertIn("giving up", logs.output[0])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.Status.FAILED, 3))
+
+    def test_unknown_task_fails_without_retry(self):
+        job = Job.objects.create(name="jobs.tests.missing")
+
+        with self.assertLogs("jobs.worker", "WARNING"):
+            run_pending()
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.Status.FAILED, 1))
+
+
+class TestLock(TestCase):
+    def test_job_taken_away_mid_run_is_rolled_back(self):
+        job = Job.objects.create(name=create_then_lose_lock.name, kwargs={"slug": "x"})
+        claimed = Job.objects.claim("test")
+
+        with self.assertLogs("jobs.worker", "WARNING") as logs:
+            self.assertFalse(run_job(claimed))
+
+        self.assertIn("no longer locked", logs.output[0])
+        self.assertFalse(Category.objects.filter(slug="x").exists())
+        self.assertTrue(Job.objects.filter(pk=job.pk).exists())
+
+    def test_requeued_job_is_not_run(self):
+        calls.clear()
+        Job.objects.create(name=remember.name, kwargs={"value": 1})
+        claimed = Job.objects.claim("test")
+        Job.objects.filter(pk=claimed.pk).update(
+            status=Job.Status.QUEUED, locked_by="", locked_at=None
+        )
+
+        with self.assertLogs("jobs.worker", "WARNING"):
+            self.assertFalse(run_job(claimed))
+
+        self.assertEqual(calls, [])
+        self.assertEqual(Job.objects.get().status, Job.Status.QUEUED)
+
+
+class TestClaim(TestCase):
+    def test_a_job_is_claimed_once(self):
+        first = Job.objects.create(name=remember.name, kwargs={"value": 1})
+        second = Job.objects.create(name=remember.name, kwargs={"value": 2})
+        Job.objects.create(
+            name=remember.name, run_at=timezone.now() + timedelta(minutes=1)
+        )
+
+        claimed = [Job.objects.claim(worker) for worker in ("a", "b", "c")]
+
+        self.assertEqual(
+            [job and job.pk for job in claimed], [first.pk, second.pk, None]
+        )
+        self.assertEqual(claimed[0].locked_by, "a")
+        self.assertEqual(claimed[0].status, Job.Status.RUNNING)
+        self.assertEqual(claimed[0].attempts, 1)
+
+    def test_claim_skips_jobs_taken_by_another_worker(self):
+        job = Job.objects.create(name=remember.name, kwargs={"value": 1})
+        # Another worker wins the race after this one listed the candidates.
+        Job.objects.filter(pk=job.pk).update(status=Job.Status.RUNNING)
+
+        self.assertIsNone(Job.objects.claim("late"))
+
+    def test_stale_jobs_are_requeued(self):
+        stale = Job.objects.create(
+            name=remember.name,
+            status=Job.Status.RUNNING,
+            locked_by="gone",
+            locked_at=timezone.now() - timedelta(minutes=10),
+        )
+        Job.objects.create(
+            name=remember.name,
+            status=Job.Status.RUNNING,
+            locked_by="busy",
+            locked_at=timezone.now(),
+        )
+
+        self.assertEqual(Job.objects.requeue_stale(300), 1)
+        stale.refresh_from_db()
+        self.assertEqual((stale.status, stale.locked_by), (Job.Status.QUEUED, ""))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+)
+class TestRunWorkers(TestCase):
+    def test_burst_runs_the_queue_and_exits(self):
+        calls.clear()
+        Job.objects.bulk_create(
+            Job(name=remember.name, kwargs={"value": value}) for value in range(3)
+        )
+
+        out = StringIO()
+        call_command("run_workers", processes=1, burst=True, stdout=out)
+
+        self.assertIn("Processed 3 jobs", out.getvalue())
+        self.assertEqual(calls, [0, 1, 2])
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_a_process_local_cache_is_refused(self):
+        Job.objects.create(name=remember.name, kwargs={"value": 1})
+
+        with self.assertRaisesMessage(CommandError, "CACHE_BACKEND"):
+            call_command("run_workers", processes=1, burst=True)
+
+        self.assertTrue(Job.objects.exists())
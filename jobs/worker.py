@@ -0,0 +1,136 @@
+"""
+Job execution.
+
+A worker claims due jobs one at a time and runs each in a transaction that
+also deletes it, so a job's database writes and its removal from the queue
+commit together. The delete is conditional on the worker's lock: a job that
+was requeued as stale or removed while it ran is rolled back instead, so two
+workers never both commit the same job. A failing job is retried after an exponential backoff
+(``JOBS_RETRY_BACKOFF`` seconds, doubled on every attempt) until it has run
+``max_attempts`` times, then kept as ``failed`` for inspection.
+"""
+
+import logging
+import os
+import signal
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import tasks
+
+logger = logging.getLogger(__name__)
+
+
+def backoff(attempts):
+    return min(
+        settings.JOBS_RETRY_BACKOFF * 2 ** (attempts - 1),
+        settings.JOBS_RETRY_BACKOFF_MAX,
+    )
+
+
+class _LockLost(Exception):
+    """The job was requeued or removed while this worker ran it."""
+
+
+def run_job(job):
+    """Run a claimed job; return whether it succeeded."""
+    # Every write below is conditional on the job still being ours.
+    mine = Job.objects.filter(pk=job.pk, locked_by=job.locked_by)
+    try:
+        with transaction.atomic():
+            # Held until commit: whoever deletes or requeues the job meanwhile
+            # (``rebuild_sales``, ``requeue_stale``) waits for the run to end.
+            if not mine.select_for_update().exists():
+                raise _LockLost
+            tasks[job.name](**job.kwargs)
+            # Without row locks (SQLite) the job may still have been taken
+            # away mid-run; its writes must not commit next to another run's.
+            if not mine.delete()[0]:
+                raise _LockLost
+    except _LockLost:
+        logger.warning("Job %s is no longer locked by this worker, rolled back", job)
+        return False
+    except Exception:
+        error = traceback.format_exc()
+        retry = job.name in tasks and job.attempts < job.max_attempts
+        mine.update(
+            status=Job.Status.QUEUED if retry else Job.Status.FAILED,
+            run_at=timezone.now() + timedelta(seconds=backoff(job.attempts)),
+            locked_by="",
+            locked_at=None,
+            last_error=error,
+        )
+        logger.warning(
+            "Job %s failed (attempt %d of %d)%s",
+            job,
+            job.attempts,
+            job.max_attempts,
+            "" if retry else ", giving up",
+            exc_info=True,
+        )
+        return False
+    return True
+
+
+def run_pending(worker=None):
+    """Run the due jobs in this process until none is left; return the count."""
+    worker = worker or default_worker_name()
+    count = 0
+    while (job := Job.objects.claim(worker)) is not None:
+        run_job(job)
+        count += 1
+    return count
+
+
+def default_worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def work(burst=False, poll_interval=None):
+    """
+    Process jobs until SIGTERM/SIGINT, or until the queue is empty when
+    ``burst`` is set.
+    """
+    poll_interval = poll_interval or settings.JOBS_POLL_INTERVAL
+    worker = default_worker_name()
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    handlers = {
+        signum: signal.signal(signum, stop)
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+
+    processed = 0
+    idle = True
+    try:
+        while not stopping:
+            close_old_connections()
+            if idle:
+                requeued = Job.objects.requeue_stale(settings.JOBS_LOCK_TIMEOUT)
+                if requeued:
+                    logger.warning("Requeued %d stale jobs", requeued)
+
+            job = Job.objects.claim(worker)
+            idle = job is None
+            if job is not None:
+                run_job(job)
+                processed += 1
+            elif burst:
+                break
+            else:
+                time.sleep(poll_interval)
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    return processed
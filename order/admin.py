@@ -0,0 +1,22 @@
+from django.contrib import admin
+
+from order.models import Order, OrderItem
+
+
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    raw_id_fields = ["product"]
+    extra = 1
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ["id", "user", "item_count", "total"]
+    readonly_fields = ["item_count", "total"]
+    inlines = [OrderItemInline]
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # Inline lines are saved one by one without the m2m signals.
+        form.instance.items.capture_prices()
+        form.instance.refresh_totals()
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class OrderConfig(AppConfig):
+    name = "order"
+
+    def ready(self):
+        from order import signals  # noqa: F401
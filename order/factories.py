@@ -1,8 +1,7 @@
 import factory
 from django.contrib.auth.models import User
 
-from order.models import Order
-from product.factories import ProductFactory
+from order.models import Order, OrderItem
 
 
 class UserFactory(factory.django.DjangoModelFactory):
@@ -22,8 +21,34 @@ class OrderFactory(factory.django.DjangoModelFactory):
             return
 
         if extracted:
-            for product in extracted:
-                self.product.add(product)
+            self.product.add(*extracted)
+
+    @classmethod
+    def create_bulk(cls, size, product=(), user=None, batch_size=1000, **kwargs):
+        """
+        Fast seeding: insert ``size`` orders and their line items with
+        ``bulk_create``, then compute the stored totals in one statement.
+        ``product`` is a list for every order or a callable taking the order's
+        index; ``user`` must already be saved and defaults to a new user.
+        """
+        user = user or UserFactory()
+        orders = Order.objects.bulk_create(
+            cls.build_batch(size, user=user, **kwargs), batch_size=batch_size
+        )
+        products_of = product if callable(product) else lambda index: product
+        OrderItem.objects.bulk_create(
+            (
+                OrderItem(order_id=order.pk, product_id=item.pk, unit_price=item.price)
+                for index, order in enumerate(orders)
+                for item in products_of(index)
+            ),
+            batch_size=batch_size,
+        )
+        if orders:
+            Order.objects.filter(
+                pk__range=(orders[0].pk, orders[-1].pk)
+            ).refresh_totals()
+        return orders
 
     class Meta:
         model = Order
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from order.models import Order
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored total and item count of every order."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        updated = 0
+
+        while True:
+            ids = list(
+                Order.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            updated += Order.objects.filter(pk__in=ids).refresh_totals()
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} orders."))
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Prefetch
+
+from api.export import EXPORT_CHUNK_SIZE, EXPORT_RENDERERS, stream_export
+from order.models import Order
+from order.serializers import OrderExportSerializer
+from product.models import Product
+
+RENDERERS = {renderer.format: renderer for renderer in EXPORT_RENDERERS}
+
+
+class Command(BaseCommand):
+    help = "Stream every order as NDJSON or CSV to a file or stdout."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=sorted(RENDERERS), default="ndjson")
+        parser.add_argument("--output", "-o", help="File to write (default: stdout)")
+        parser.add_argument("--user", type=int, help="Only export this user's orders")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        queryset = Order.objects.prefetch_related(
+            Prefetch("product", queryset=Product.objects.only("pk"))
+        ).order_by("id")
+        if options["user"] is not None:
+            queryset = queryset.filter(user_id=options["user"])
+
+        renderer = RENDERERS[options["format"]]()
+        chunks = stream_export(
+            renderer, OrderExportSerializer, queryset, options["chunk_size"]
+        )
+
+        output = (
+            open(options["output"], "w", newline="", encoding="utf-8")
+            if options["output"]
+            else self.stdout
+        )
+        started = time.perf_counter()
+        lines = 0
+        try:
+            # Every chunk is one line, so OutputWrapper adds no newline.
+            for chunk in chunks:
+                output.write(chunk)
+                lines += 1
+        finally:
+            if output is not self.stdout:
+                output.close()
+        elapsed = time.perf_counter() - started
+
+        # The CSV header is a line of its own.
+        rows = lines - (renderer.format == "csv")
+        self.stderr.write(
+            self.style.SUCCESS(f"Exported {rows} orders in {elapsed:.2f}s.")
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from order.sales import rebuild_sales
+
+
+class Command(BaseCommand):
+    help = "Recompute the daily product and category sales from the order lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Only rebuild the last N days (default: all of them).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rows = rebuild_sales(options["days"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily product rows."))
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="item_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="total",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0002_order_total"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
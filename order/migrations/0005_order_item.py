@@ -0,0 +1,120 @@
+# Generated by Django 6.0.1 on 2026-10-18 23:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 5000
+
+
+def copy_order_products(apps, schema_editor):
+    """Turn every order/product link into a one-unit line at today's price."""
+    db = schema_editor.connection.alias
+    Order = apps.get_model("order", "Order")
+    OrderItem = apps.get_model("order", "OrderItem")
+    Link = Order._meta.get_field("product").remote_field.through
+
+    last_id = 0
+    while True:
+        rows = list(
+            Link.objects.using(db)
+            .filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", "order_id", "product_id", "product__price")[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        OrderItem.objects.using(db).bulk_create(
+            OrderItem(
+                order_id=order_id,
+                product_id=product_id,
+                quantity=1,
+                unit_price=price,
+            )
+            for _, order_id, product_id, price in rows
+        )
+        last_id = rows[-1][0]
+
+
+def copy_order_items(apps, schema_editor):
+    db = schema_editor.connection.alias
+    Order = apps.get_model("order", "Order")
+    OrderItem = apps.get_model("order", "OrderItem")
+    Link = Order._meta.get_field("product").remote_field.through
+
+    last_id = 0
+    while True:
+        rows = list(
+            OrderItem.objects.using(db)
+            .filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", "order_id", "product_id")[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        Link.objects.using(db).bulk_create(
+            Link(order_id=order_id, product_id=product_id)
+            for _, order_id, product_id in rows
+        )
+        last_id = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0004_order_created_at"),
+        ("product", "0006_product_stock"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderItem",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("quantity", models.PositiveIntegerField(default=1)),
+                ("unit_price", models.PositiveIntegerField(null=True)),
+                (
+                    "order",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="items",
+                        to="order.order",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="product.product",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("order", "product"),
+                        name="order_item_order_product_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(copy_order_products, copy_order_items),
+        migrations.RemoveField(
+            model_name="order",
+            name="product",
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="product",
+            field=models.ManyToManyField(
+                through="order.OrderItem", to="product.product"
+            ),
+        ),
+    ]
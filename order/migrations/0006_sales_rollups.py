@@ -0,0 +1,77 @@
+# Generated by Django 6.0.1 on 2026-10-18 23:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0005_order_item"),
+        ("product", "0007_category_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyCategorySales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("units", models.PositiveBigIntegerField(default=0)),
+                ("revenue", models.PositiveBigIntegerField(default=0)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="product.category",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "category"), name="daily_category_sales_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="DailyProductSales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("units", models.PositiveBigIntegerField(default=0)),
+                ("revenue", models.PositiveBigIntegerField(default=0)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="product.product",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "product"), name="daily_product_sales_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -2,3 +2,5 @@
 # -*- coding: utf-8 -*-
 
 from .order import Order
+from .order_item import OrderItem
+from .sales import DailyCategorySales, DailyProductSales
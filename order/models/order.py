@@ -1,9 +1,67 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
+from order.models.order_item import OrderItem
 from product.models import Product
 
 
+class OrderQuerySet(models.QuerySet):
+    def with_products(self):
+        return self.select_related("user").prefetch_related(
+            "items", "product__category"
+        )
+
+    def with_computed_total(self):
+        return self.annotate(
+            computed_total=Coalesce(
+                Sum(F("items__quantity") * F("items__unit_price")), 0
+            ),
+            computed_item_count=Coalesce(Sum("items__quantity"), 0),
+        )
+
+    def refresh_totals(self):
+        # Line items carry their own price, so this never joins products.
+        items = OrderItem.objects.filter(order=OuterRef("pk")).values("order")
+
+        return self.update(
+            total=Coalesce(
+                Subquery(
+                    items.annotate(total=Sum(F("quantity") * F("unit_price"))).values(
+                        "total"
+                    )
+                ),
+                0,
+            ),
+            item_count=Coalesce(
+                Subquery(items.annotate(count=Sum("quantity")).values("count")), 0
+            ),
+            updated_at=timezone.now(),
+        )
+
+
 class Order(models.Model):
-    product = models.ManyToManyField(Product, blank=False)
+    product = models.ManyToManyField(Product, through=OrderItem, blank=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    total = models.PositiveIntegerField(default=0, db_index=True, editable=False)
+    item_count = models.PositiveIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = OrderQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="order_user_created_idx"
+            ),
+        ]
+
+    def refresh_totals(self):
+        orders = Order.objects.filter(pk=self.pk)
+        orders.refresh_totals()
+        self.total, self.item_count, self.updated_at = orders.values_list(
+            "total", "item_count", "updated_at"
+        ).get()
@@ -0,0 +1,32 @@
+from django.db import models
+from django.db.models import OuterRef, Subquery
+
+from product.models import Product
+
+
+class OrderItemQuerySet(models.QuerySet):
+    def capture_prices(self):
+        """Snapshot the current product price into lines that have none."""
+        price = Product.objects.filter(pk=OuterRef("product_id")).values("price")
+        return self.filter(unit_price__isnull=True).update(
+            unit_price=Subquery(price[:1])
+        )
+
+
+class OrderItem(models.Model):
+    order = models.ForeignKey(
+        "order.Order", on_delete=models.CASCADE, related_name="items"
+    )
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    quantity = models.PositiveIntegerField(default=1)
+    # Product price at purchase time; totals are computed from it.
+    unit_price = models.PositiveIntegerField(null=True)
+
+    objects = OrderItemQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["order", "product"], name="order_item_order_product_uniq"
+            ),
+        ]
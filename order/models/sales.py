@@ -0,0 +1,38 @@
+from django.db import models
+
+from product.models import Category, Product
+
+
+class DailyProductSales(models.Model):
+    """Units and revenue of one product on one day; see ``order.sales``."""
+
+    day = models.DateField()
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    units = models.PositiveBigIntegerField(default=0)
+    revenue = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "product"], name="daily_product_sales_uniq"
+            ),
+        ]
+
+
+class DailyCategorySales(models.Model):
+    """
+    Units and revenue of the products of one category on one day. A product
+    in several categories counts in each of them.
+    """
+
+    day = models.DateField()
+    category = models.ForeignKey(Category, on_delete=models.CASCADE)
+    units = models.PositiveBigIntegerField(default=0)
+    revenue = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "category"], name="daily_category_sales_uniq"
+            ),
+        ]
@@ -0,0 +1,195 @@
+"""
+Daily sales rollups.
+
+``record_sales`` adds the lines of newly created orders to
+``DailyProductSales`` and ``DailyCategorySales`` with one
+``INSERT ... ON CONFLICT DO UPDATE`` per table that increments the existing
+counters, so concurrent orders never overwrite each other. Rows are written
+in id order, keeping lock order consistent with stock reservations.
+``rebuild_sales`` recomputes the rollups from the order lines, for data
+written outside the order serializers, dropping the pending
+``record_order_sales`` jobs of the rebuilt days, and the read helpers sum a bounded
+number of daily rows instead of scanning orders.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import connections, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from jobs.models import Job
+from order.models import DailyCategorySales, DailyProductSales, OrderItem
+from product.models import Product
+
+
+def _upsert(model, key, rows, using):
+    """Insert ``(day, key_id, units, revenue)`` rows, adding to existing ones."""
+    if not rows:
+        return
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    column = qn(model._meta.get_field(key).column)
+    placeholders = ", ".join(["(%s, %s, %s, %s)"] * len(rows))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (day, {column}, units, revenue) "
+            f"VALUES {placeholders} "
+            f"ON CONFLICT (day, {column}) DO UPDATE SET "
+            f"units = {table}.units + excluded.units, "
+            f"revenue = {table}.revenue + excluded.revenue",
+            [value for row in rows for value in row],
+        )
+
+
+def record_sales(lines, day=None, using="default"):
+    """
+    Add ``lines`` (``(product_id, quantity, unit_price)``) sold on ``day``
+    (today by default) to the rollups. Call it in the transaction that
+    creates the orders.
+    """
+    day = day or timezone.localdate()
+    products = defaultdict(lambda: [0, 0])
+    for product_id, quantity, unit_price in lines:
+        products[product_id][0] += quantity
+        products[product_id][1] += quantity * (unit_price or 0)
+    if not products:
+        return
+
+    categories = defaultdict(lambda: [0, 0])
+    links = Product.category.through.objects.using(using).filter(
+        product_id__in=products
+    )
+    for product_id, category_id in links.values_list("product_id", "category_id"):
+        units, revenue = products[product_id]
+        categories[category_id][0] += units
+        categories[category_id][1] += revenue
+
+    _upsert(
+        DailyProductSales,
+        "product",
+        [(day, pk, *totals) for pk, totals in sorted(products.items())],
+        using,
+    )
+    _upsert(
+        DailyCategorySales,
+        "category",
+        [(day, pk, *totals) for pk, totals in sorted(categories.items())],
+        using,
+    )
+
+
+def _drop_sales_jobs(since, using):
+    """
+    Delete the ``record_order_sales`` jobs of days from ``since`` on (all
+    days when ``None``), whatever their status: the rebuild counts their
+    orders already. Running jobs hold their row lock until they commit, so
+    this waits for them and their increments are deleted with the old rows.
+    """
+    # order.tasks imports this module.
+    from order.tasks import record_order_sales
+
+    jobs = (
+        Job.objects.using(using)
+        .select_for_update()
+        .filter(name=record_order_sales.name)
+    )
+    pks = [
+        pk
+        for pk, kwargs in jobs.values_list("pk", "kwargs")
+        if since is None or kwargs["day"] >= since.isoformat()
+    ]
+    Job.objects.using(using).filter(pk__in=pks).delete()
+
+
+def rebuild_sales(days=None, batch_size=1000, using="default"):
+    """
+    Recompute the rollups of the last ``days`` days (all of them by
+    default) from ``OrderItem``. Returns the number of product rows written.
+
+    Pending sales jobs of those days are dropped in the same transaction, so
+    they do not add their orders a second time. An order committed while the
+    rebuild runs can still be counted twice, because its job is queued just
+    after the commit: run the rebuild when orders are quiet, or run it again.
+    """
+    since = timezone.localdate() - timedelta(days=days - 1) if days else None
+    items = OrderItem.objects.using(using).annotate(
+        day=TruncDate("order__created_at"), revenue=F("quantity") * F("unit_price")
+    )
+    if since:
+        items = items.filter(order__created_at__date__gte=since)
+
+    product_rows = (
+        items.values("day", "product")
+        .annotate(total_units=Sum("quantity"), total_revenue=Sum("revenue"))
+        .order_by()
+    )
+    category_rows = (
+        items.values("day", "product__category")
+        .annotate(total_units=Sum("quantity"), total_revenue=Sum("revenue"))
+        .order_by()
+    )
+
+    with transaction.atomic(using=using):
+        _drop_sales_jobs(since, using)
+        for model in (DailyProductSales, DailyCategorySales):
+            stale = model.objects.using(using)
+            if since:
+                stale = stale.filter(day__gte=since)
+            stale.delete()
+
+        DailyProductSales.objects.using(using).bulk_create(
+            (
+                DailyProductSales(
+                    day=row["day"],
+                    product_id=row["product"],
+                    units=row["total_units"],
+                    revenue=row["total_revenue"] or 0,
+                )
+                for row in product_rows.iterator()
+            ),
+            batch_size=batch_size,
+        )
+        DailyCategorySales.objects.using(using).bulk_create(
+            (
+                DailyCategorySales(
+                    day=row["day"],
+                    category_id=row["product__category"],
+                    units=row["total_units"],
+                    revenue=row["total_revenue"] or 0,
+                )
+                for row in category_rows.iterator()
+                if row["product__category"] is not None
+            ),
+            batch_size=batch_size,
+        )
+
+    rows = DailyProductSales.objects.using(using)
+    if since:
+        rows = rows.filter(day__gte=since)
+    return rows.count()
+
+
+def bestsellers(days, limit):
+    """Products with the most units sold in the last ``days`` days."""
+    since = timezone.localdate() - timedelta(days=days - 1)
+    return list(
+        DailyProductSales.objects.filter(day__gte=since)
+        .values("product", "product__title")
+        .annotate(units=Sum("units"), revenue=Sum("revenue"))
+        .order_by("-units", "product")[:limit]
+    )
+
+
+def category_revenue(days):
+    """Units and revenue of every category that sold in the last ``days`` days."""
+    since = timezone.localdate() - timedelta(days=days - 1)
+    return list(
+        DailyCategorySales.objects.filter(day__gte=since)
+        .values("category", "category__title")
+        .annotate(units=Sum("units"), revenue=Sum("revenue"))
+        .order_by("-revenue", "category")
+    )
@@ -1,4 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from .order_bulk_serializer import OrderBulkSerializer
+from .order_export_serializer import OrderExportSerializer
 from .order_serializer import OrderSerializer
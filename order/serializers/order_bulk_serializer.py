@@ -0,0 +1,130 @@
+from collections import Counter
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from api.metrics import TimedSerializerMixin
+from order.models import Order, OrderItem
+from order.tasks import record_order_sales
+from product.models import OutOfStock, Product
+
+
+class OrderBulkItemSerializer(TimedSerializerMixin, serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    user = serializers.IntegerField(source="user_id")
+    products_id = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, write_only=True
+    )
+    total = serializers.IntegerField(read_only=True)
+    item_count = serializers.IntegerField(read_only=True)
+
+
+class OrderBulkSerializer(serializers.ListSerializer):
+    """
+    Creates many orders at once.
+
+    Users and products of the whole batch are validated with one ``IN`` query
+    each, orders and their line items are written with ``bulk_create``, and
+    tracked stock is reserved for the whole batch in the same transaction.
+    """
+
+    child = OrderBulkItemSerializer()
+
+    def to_internal_value(self, data):
+        attrs = super().to_internal_value(data)
+
+        product_ids = {pk for item in attrs for pk in item["products_id"]}
+        user_ids = {item["user_id"] for item in attrs}
+
+        products = list(
+            Product.objects.filter(pk__in=product_ids).values_list(
+                "pk", "price", "stock"
+            )
+        )
+        self.prices = {pk: price for pk, price, _ in products}
+        self.tracked = {pk for pk, _, stock in products if stock is not None}
+        users = set(User.objects.filter(pk__in=user_ids).values_list("pk", flat=True))
+
+        errors = []
+        for item in attrs:
+            item_errors = {}
+            if item["user_id"] not in users:
+                item_errors["user"] = [
+                    f'Invalid pk "{item["user_id"]}" - object does not exist.'
+                ]
+            missing = [pk for pk in item["products_id"] if pk not in self.prices]
+            if missing:
+                item_errors["products_id"] = [
+                    f'Invalid pk "{pk}" - object does not exist.' for pk in missing
+                ]
+            errors.append(item_errors)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return attrs
+
+    def create(self, validated_data):
+        orders = []
+        for item in validated_data:
+            # A repeated product id adds a unit to its line.
+            item["quantities"] = Counter(item["products_id"])
+            orders.append(
+                Order(
+                    user_id=item["user_id"],
+                    total=sum(
+                        (self.prices[pk] or 0) * quantity
+                        for pk, quantity in item["quantities"].items()
+                    ),
+                    item_count=len(item["products_id"]),
+                )
+            )
+
+        # One reservation for the whole batch: it succeeds or fails as a unit.
+        quantities = Counter(
+            pk
+            for item in validated_data
+            for pk in item["products_id"]
+            if pk in self.tracked
+        )
+        try:
+            with transaction.atomic():
+                Order.objects.bulk_create(orders)
+                OrderItem.objects.bulk_create(
+                    OrderItem(
+                        order_id=order.pk,
+                        product_id=pk,
+                        quantity=quantity,
+                        unit_price=self.prices[pk],
+                    )
+                    for order, item in zip(orders, validated_data)
+                    for pk, quantity in item["quantities"].items()
+                )
+                Product.objects.reserve(quantities)
+                record_order_sales.delay(
+                    lines=[
+                        [pk, quantity, self.prices[pk]]
+                        for item in validated_data
+                        for pk, quantity in item["quantities"].items()
+                    ],
+                    day=timezone.localdate().isoformat(),
+                )
+        except OutOfStock as exc:
+            raise serializers.ValidationError(
+                [
+                    (
+                        {
+                            "products_id": [
+                                f'Product "{exc.product_id}" is out of stock.'
+                            ]
+                        }
+                        if exc.product_id in item["products_id"]
+                        else {}
+                    )
+                    for item in validated_data
+                ]
+            )
+
+        return orders
@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from order.models import Order
+
+
+class OrderExportSerializer(serializers.ModelSerializer):
+    """Flat order rows for the CSV / NDJSON export; products are ids."""
+
+    product = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            "id",
+            "user",
+            "total",
+            "item_count",
+            "product",
+            "created_at",
+            "updated_at",
+        ]
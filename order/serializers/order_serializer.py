@@ -1,32 +1,131 @@
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
 
-from order.models import Order
-from product.models import Product
+from api.metrics import TimedSerializerMixin
+from api.serializers import SparseFieldsetMixin
+from order.models import Order, OrderItem
+from order.tasks import record_order_sales
+from product.models import OutOfStock, Product
 from product.serializers.product_serializer import ProductSerializer
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderItemSerializer(serializers.ModelSerializer):
+    product = serializers.IntegerField(source="product_id")
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+    class Meta:
+        model = OrderItem
+        fields = ["product", "quantity", "unit_price"]
+        read_only_fields = ["unit_price"]
+
+
+class OrderSerializer(
+    TimedSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer
+):
+    """
+    Orders are written as ``items`` (product and quantity) or, as before,
+    ``products_id``, where a repeated id adds a unit. Each line stores the
+    product price at purchase time.
+    """
+
     product = ProductSerializer(read_only=True, many=True)
-    products_id = serializers.PrimaryKeyRelatedField(
-        queryset=Product.objects.all(), write_only=True, many=True
+    items = OrderItemSerializer(many=True, required=False, allow_empty=False)
+    products_id = serializers.ListField(
+        child=serializers.IntegerField(),
+        write_only=True,
+        required=False,
+        allow_empty=False,
     )
-    total = serializers.SerializerMethodField()
 
-    def get_total(self, instance):
-        total = sum([product.price for product in instance.product.all()])
-        return total
+    expandable_fields = ["product"]
 
     class Meta:
         model = Order
-        fields = ["product", "total", "user", "products_id"]
+        fields = [
+            "id",
+            "product",
+            "items",
+            "total",
+            "item_count",
+            "user",
+            "created_at",
+            "products_id",
+        ]
         extra_kwargs = {"product": {"required": False}}
 
+    def validate(self, attrs):
+        items = attrs.pop("items", None)
+        products_id = attrs.pop("products_id", None)
+
+        if self.instance is not None:
+            if items is not None or products_id is not None:
+                raise serializers.ValidationError(
+                    "The items of an order cannot be changed."
+                )
+            return attrs
+        if (items is None) == (products_id is None):
+            raise serializers.ValidationError("Send either items or products_id.")
+
+        quantities = Counter()
+        if items is None:
+            field = "products_id"
+            quantities.update(products_id)
+        else:
+            field = "items"
+            for item in items:
+                quantities[item["product_id"]] += item["quantity"]
+
+        products = Product.objects.in_bulk(quantities)
+        missing = [pk for pk in quantities if pk not in products]
+        if missing:
+            raise serializers.ValidationError(
+                {
+                    field: [
+                        f'Invalid pk "{pk}" - object does not exist.' for pk in missing
+                    ]
+                }
+            )
+
+        attrs["lines"] = [
+            (products[pk], quantity) for pk, quantity in quantities.items()
+        ]
+        return attrs
+
     def create(self, validated_data):
-        product_data = validated_data.pop("products_id")
+        lines = validated_data.pop("lines")
         user_data = validated_data.pop("user")
 
-        order = Order.objects.create(user=user_data)
-        for product in product_data:
-            order.product.add(product)
+        # Stock is reserved last so its row locks are held only until commit.
+        try:
+            with transaction.atomic():
+                order = Order.objects.create(
+                    user=user_data,
+                    total=sum((p.price or 0) * quantity for p, quantity in lines),
+                    item_count=sum(quantity for _, quantity in lines),
+                )
+                OrderItem.objects.bulk_create(
+                    OrderItem(
+                        order=order,
+                        product=p,
+                        quantity=quantity,
+                        unit_price=p.price,
+                    )
+                    for p, quantity in lines
+                )
+                Product.objects.reserve(
+                    {p.pk: quantity for p, quantity in lines if p.stock is not None}
+                )
+                record_order_sales.delay(
+                    lines=[[p.pk, quantity, p.price] for p, quantity in lines],
+                    day=timezone.localdate().isoformat(),
+                )
+        except OutOfStock as exc:
+            field = "items" if "items" in self.initial_data else "products_id"
+            raise serializers.ValidationError(
+                {field: [f'Product "{exc.product_id}" is out of stock.']}
+            )
 
         return order
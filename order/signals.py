@@ -0,0 +1,38 @@
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+from django.dispatch import receiver
+
+from order.models import Order, OrderItem
+from product.models import Product
+
+
+@receiver(m2m_changed, sender=OrderItem)
+def update_order_totals(sender, instance, action, reverse, pk_set, **kwargs):
+    # Lines added through ``order.product`` take the product's current price.
+    if action == "post_add":
+        lookup = "order" if not reverse else "product"
+        OrderItem.objects.filter(**{lookup: instance}).capture_prices()
+
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            instance.refresh_totals()
+        return
+
+    # Reverse side: `instance` is a Product and `pk_set` holds order ids.
+    if action == "pre_clear":
+        instance._cleared_order_ids = list(
+            instance.order_set.values_list("pk", flat=True)
+        )
+    elif action == "post_clear":
+        Order.objects.filter(pk__in=instance._cleared_order_ids).refresh_totals()
+    elif action in ("post_add", "post_remove"):
+        Order.objects.filter(pk__in=pk_set).refresh_totals()
+
+
+@receiver(pre_delete, sender=Product)
+def remember_product_orders(sender, instance, **kwargs):
+    instance._order_ids = list(instance.order_set.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Product)
+def update_orders_of_deleted_product(sender, instance, **kwargs):
+    Order.objects.filter(pk__in=instance._order_ids).refresh_totals()
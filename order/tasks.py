@@ -0,0 +1,10 @@
+from datetime import date
+
+from jobs.registry import task
+from order.sales import record_sales
+
+
+@task
+def record_order_sales(lines, day):
+    """Add the ``[product_id, quantity, unit_price]`` lines to the rollups."""
+    record_sales([tuple(line) for line in lines], date.fromisoformat(day))
@@ -0,0 +1 @@
+# Order Command Tests
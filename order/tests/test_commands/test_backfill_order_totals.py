@@ -0,0 +1,23 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from order.factories import OrderFactory
+from order.models import Order
+from product.factories import ProductFactory
+
+
+class TestBackfillOrderTotals(TestCase):
+    def test_backfill(self):
+        products = [ProductFactory(price=10), ProductFactory(price=15)]
+        orders = OrderFactory.create_batch(3, product=products)
+        Order.objects.update(total=0, item_count=0)
+
+        out = StringIO()
+        call_command("backfill_order_totals", batch_size=2, stdout=out)
+
+        self.assertIn("Updated 3 orders", out.getvalue())
+        for order in orders:
+            order.refresh_from_db()
+            self.assertEqual((order.total, order.item_count), (25, 2))
@@ -0,0 +1,43 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from order.factories import OrderFactory
+from product.factories import ProductFactory
+
+
+class TestExportOrders(TestCase):
+    def setUp(self):
+        self.orders = OrderFactory.create_batch(3, product=[ProductFactory()])
+
+    def test_ndjson_to_stdout(self):
+        out, err = StringIO(), StringIO()
+        call_command("export_orders", chunk_size=2, stdout=out, stderr=err)
+
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [o.pk for o in self.orders])
+        self.assertIn("Exported 3 orders", err.getvalue())
+
+    def test_csv_to_file_for_one_user(self):
+        user = self.orders[0].user
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "orders.csv")
+            call_command(
+                "export_orders",
+                format="csv",
+                output=path,
+                user=user.pk,
+                stderr=StringIO(),
+            )
+            with open(path, encoding="utf-8") as output:
+                lines = output.read().splitlines()
+
+        self.assertEqual(lines[0].split(",")[:2], ["id", "user"])
+        self.assertEqual(
+            lines[1].split(",")[:2], [str(self.orders[0].pk), str(user.pk)]
+        )
+        self.assertEqual(len(lines), 2)
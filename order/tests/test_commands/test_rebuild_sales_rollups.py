@@ -0,0 +1,61 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.worker import run_pending
+from order.factories import OrderFactory
+from order.models import DailyCategorySales, DailyProductSales
+from order.tasks import record_order_sales
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestRebuildSalesRollups(TestCase):
+    def test_rebuild(self):
+        category = CategoryFactory()
+        products = [
+            ProductFactory(price=10, category=[category]),
+            ProductFactory(price=20),
+        ]
+        OrderFactory.create_batch(3, product=products)
+
+        out = StringIO()
+        call_command("rebuild_sales_rollups", days=30, stdout=out)
+
+        self.assertIn("Rebuilt 2 daily product rows", out.getvalue())
+        today = timezone.localdate()
+        self.assertEqual(
+            set(DailyProductSales.objects.values_list("day", "units", "revenue")),
+            {(today, 3, 30), (today, 3, 60)},
+        )
+        self.assertEqual(
+            list(DailyCategorySales.objects.values_list("category", "units")),
+            [(category.pk, 3)],
+        )
+
+    def test_rebuild_drops_pending_sales_jobs_of_rebuilt_days(self):
+        product = ProductFactory(price=10)
+        OrderFactory(product=[product])
+        today = timezone.localdate()
+        old_day = today - timedelta(days=40)
+        # The order's rollup job has not run yet.
+        for day, status in ((today, Job.Status.QUEUED), (old_day, Job.Status.FAILED)):
+            Job.objects.create(
+                name=record_order_sales.name,
+                kwargs={"lines": [[product.pk, 1, "10"]], "day": day.isoformat()},
+                status=status,
+            )
+
+        call_command("rebuild_sales_rollups", days=30, stdout=StringIO())
+        run_pending()
+
+        self.assertEqual(
+            list(DailyProductSales.objects.values_list("day", "units")), [(today, 1)]
+        )
+        self.assertEqual(
+            list(Job.objects.values_list("kwargs__day", flat=True)),
+            [old_day.isoformat()],
+        )
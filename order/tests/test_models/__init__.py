@@ -0,0 +1 @@
+# Order Model Tests
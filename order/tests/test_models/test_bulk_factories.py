@@ -0,0 +1,33 @@
+from django.test import TestCase
+
+from order.factories import OrderFactory, UserFactory
+from order.models import Order
+from product.factories import CategoryFactory, ProductFactory
+from product.models import Product
+from product.search import search_products
+
+
+class TestBulkFactories(TestCase):
+    def test_products_with_categories(self):
+        categories = CategoryFactory.create_batch(2)
+
+        products = ProductFactory.create_bulk(
+            4, category=lambda index: categories[: index % 2 + 1], title="Dune"
+        )
+
+        self.assertEqual(Product.objects.count(), 4)
+        self.assertEqual(
+            [product.category.count() for product in products], [1, 2, 1, 2]
+        )
+        self.assertEqual(search_products(Product.objects.all(), "dune").count(), 4)
+
+    def test_orders_with_products_and_totals(self):
+        user = UserFactory()
+        products = [ProductFactory(price=10), ProductFactory(price=15)]
+
+        with self.assertNumQueries(3):
+            orders = OrderFactory.create_bulk(3, product=products, user=user)
+
+        for order in Order.objects.filter(pk__in=[o.pk for o in orders]):
+            self.assertEqual(order.user, user)
+            self.assertEqual((order.total, order.item_count), (25, 2))
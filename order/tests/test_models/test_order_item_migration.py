@@ -0,0 +1,53 @@
+from importlib import import_module
+from unittest import mock
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+migration = import_module("order.migrations.0005_order_item")
+
+
+class TestOrderItemMigration(TransactionTestCase):
+    before = [("order", "0004_order_created_at"), ("product", "0006_product_stock")]
+    after = [("order", "0005_order_item")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_links_become_one_unit_lines_in_batches(self):
+        apps = self.migrate(self.before)
+        User = apps.get_model("auth", "User")
+        Product = apps.get_model("product", "Product")
+        Order = apps.get_model("order", "Order")
+
+        user = User.objects.create(username="reader")
+        book = Product.objects.create(title="book", price=30)
+        pen = Product.objects.create(title="pen", price=5)
+        first = Order.objects.create(user=user)
+        first.product.add(book, pen)
+        second = Order.objects.create(user=user)
+        second.product.add(pen)
+
+        with mock.patch.object(migration, "BATCH_SIZE", 2):
+            apps = self.migrate(self.after)
+
+        OrderItem = apps.get_model("order", "OrderItem")
+        self.assertEqual(
+            sorted(
+                OrderItem.objects.values_list(
+                    "order_id", "product_id", "quantity", "unit_price"
+                )
+            ),
+            [
+                (first.pk, book.pk, 1, 30),
+                (first.pk, pen.pk, 1, 5),
+                (second.pk, pen.pk, 1, 5),
+            ],
+        )
@@ -0,0 +1,64 @@
+from django.test import TestCase
+
+from order.factories import OrderFactory
+from order.models import Order, OrderItem
+from product.factories import ProductFactory
+
+
+class TestOrderTotals(TestCase):
+    def setUp(self):
+        self.book = ProductFactory(price=30)
+        self.pen = ProductFactory(price=5)
+
+    def test_totals_follow_product_changes(self):
+        order = OrderFactory(product=[self.book, self.pen])
+
+        self.assertEqual((order.total, order.item_count), (35, 2))
+
+        order.product.remove(self.pen)
+        order.refresh_from_db()
+        self.assertEqual((order.total, order.item_count), (30, 1))
+
+        order.product.clear()
+        order.refresh_from_db()
+        self.assertEqual((order.total, order.item_count), (0, 0))
+
+    def test_totals_follow_reverse_changes(self):
+        order = OrderFactory(product=[self.book])
+
+        self.pen.order_set.add(order)
+        order.refresh_from_db()
+        self.assertEqual(order.total, 35)
+
+        self.book.delete()
+        order.refresh_from_db()
+        self.assertEqual((order.total, order.item_count), (5, 1))
+
+    def test_computed_total_matches_stored_total(self):
+        OrderFactory(product=[self.book, self.pen])
+        OrderFactory(product=[self.pen])
+
+        orders = Order.objects.with_computed_total().order_by("-computed_total")
+
+        self.assertEqual(
+            [(o.computed_total, o.computed_item_count) for o in orders],
+            [(35, 2), (5, 1)],
+        )
+        self.assertEqual([o.total for o in orders], [35, 5])
+
+    def test_totals_keep_the_price_paid(self):
+        order = OrderFactory(product=[self.book])
+        OrderItem.objects.filter(order=order).update(quantity=3)
+        order.refresh_totals()
+
+        self.book.price = 40
+        self.book.save()
+        Order.objects.filter(pk=order.pk).refresh_totals()
+        order.refresh_from_db()
+
+        self.assertEqual(order.items.get().unit_price, 30)
+        self.assertEqual((order.total, order.item_count), (90, 3))
+        computed = Order.objects.with_computed_total().get(pk=order.pk)
+        self.assertEqual(
+            (computed.computed_total, computed.computed_item_count), (90, 3)
+        )
@@ -0,0 +1,141 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from bookstore.testing import JobsMixin
+from order.factories import OrderFactory, UserFactory
+from order.models import DailyCategorySales, DailyProductSales, Order
+from order.sales import rebuild_sales, record_sales
+from product.factories import CategoryFactory, ProductFactory
+
+
+def product_sales():
+    return {
+        (row.day, row.product_id): (row.units, row.revenue)
+        for row in DailyProductSales.objects.all()
+    }
+
+
+def category_sales():
+    return {
+        (row.day, row.category_id): (row.units, row.revenue)
+        for row in DailyCategorySales.objects.all()
+    }
+
+
+class TestRecordSales(TestCase):
+    def test_record_sales_adds_to_existing_rows(self):
+        category = CategoryFactory()
+        product = ProductFactory(category=[category])
+        today = timezone.localdate()
+
+        record_sales([(product.pk, 2, 10)])
+        record_sales([(product.pk, 1, 10), (product.pk, 3, None)])
+
+        self.assertEqual(product_sales(), {(today, product.pk): (6, 30)})
+        self.assertEqual(category_sales(), {(today, category.pk): (6, 30)})
+
+
+class TestSalesRollupsFromOrders(JobsMixin, APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.books = CategoryFactory()
+        self.games = CategoryFactory()
+        self.book = ProductFactory(price=10, category=[self.books])
+        self.game = ProductFactory(price=50, category=[self.books, self.games])
+
+    def test_order_create_records_sales(self):
+        with self.runJobs():
+            response = self.client.post(
+                reverse("order-list", kwargs={"version": "v1"}),
+                {
+                    "items": [
+                        {"product": self.book.pk, "quantity": 3},
+                        {"product": self.game.pk},
+                    ],
+                    "user": self.user.pk,
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        today = timezone.localdate()
+        self.assertEqual(
+            product_sales(),
+            {(today, self.book.pk): (3, 30), (today, self.game.pk): (1, 50)},
+        )
+        self.assertEqual(
+            category_sales(),
+            {(today, self.books.pk): (4, 80), (today, self.games.pk): (1, 50)},
+        )
+
+    def test_bulk_create_records_sales(self):
+        items = [
+            {"user": self.user.pk, "products_id": [self.book.pk, self.book.pk]},
+            {"user": self.user.pk, "products_id": [self.book.pk, self.game.pk]},
+        ]
+
+        with self.runJobs():
+            response = self.client.post(
+                reverse("order-bulk", kwargs={"version": "v1"}), items, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        today = timezone.localdate()
+        self.assertEqual(
+            product_sales(),
+            {(today, self.book.pk): (3, 30), (today, self.game.pk): (1, 50)},
+        )
+
+    def test_rejected_order_records_nothing(self):
+        sold_out = ProductFactory(price=5, stock=0)
+
+        with self.runJobs():
+            response = self.client.post(
+                reverse("order-list", kwargs={"version": "v1"}),
+                {"products_id": [self.book.pk, sold_out.pk], "user": self.user.pk},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(DailyProductSales.objects.exists())
+        self.assertFalse(DailyCategorySales.objects.exists())
+
+    def test_rebuild_matches_incremental_rollups(self):
+        for products_id in ([self.book.pk], [self.book.pk, self.game.pk]):
+            with self.runJobs():
+                self.client.post(
+                    reverse("order-list", kwargs={"version": "v1"}),
+                    {"products_id": products_id, "user": self.user.pk},
+                    format="json",
+                )
+        expected = product_sales(), category_sales()
+
+        DailyProductSales.objects.update(units=0, revenue=0)
+        DailyCategorySales.objects.all().delete()
+        rebuild_sales()
+
+        self.assertEqual((product_sales(), category_sales()), expected)
+
+    def test_rebuild_limited_to_recent_days_keeps_older_rows(self):
+        OrderFactory(product=[self.book])
+        old = OrderFactory(product=[self.game])
+        last_week = timezone.now() - timedelta(days=7)
+        Order.objects.filter(pk=old.pk).update(created_at=last_week)
+
+        rebuild_sales()
+        DailyProductSales.objects.filter(product=self.game).update(units=99)
+        rebuild_sales(days=1)
+
+        self.assertEqual(
+            product_sales(),
+            {
+                (timezone.localdate(), self.book.pk): (1, 10),
+                (timezone.localtime(last_week).date(), self.game.pk): (99, 50),
+            },
+        )
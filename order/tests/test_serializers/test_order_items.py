@@ -0,0 +1,82 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from order.factories import OrderFactory, UserFactory
+from order.models import Order
+from product.factories import ProductFactory
+
+
+class TestOrderItems(APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+        self.book = ProductFactory(price=30)
+        self.pen = ProductFactory(price=5)
+
+    def create(self, **data):
+        return self.client.post(self.url, {"user": self.user.pk, **data}, format="json")
+
+    def test_create_with_items(self):
+        response = self.create(
+            items=[
+                {"product": self.book.pk, "quantity": 2},
+                {"product": self.pen.pk},
+                {"product": self.book.pk},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["total"], 95)
+        self.assertEqual(response.data["item_count"], 4)
+        self.assertEqual(
+            sorted(
+                (item["product"], item["quantity"], item["unit_price"])
+                for item in response.data["items"]
+            ),
+            sorted([(self.book.pk, 3, 30), (self.pen.pk, 1, 5)]),
+        )
+
+    def test_repeated_products_id_adds_units(self):
+        response = self.create(products_id=[self.pen.pk, self.pen.pk])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(pk=response.data["id"])
+        self.assertEqual(order.items.get().quantity, 2)
+        self.assertEqual((order.total, order.item_count), (10, 2))
+
+    def test_items_or_products_id_is_required(self):
+        for data in (
+            {},
+            {"items": [{"product": self.pen.pk}], "products_id": [self.pen.pk]},
+        ):
+            response = self.create(**data)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("non_field_errors", response.data)
+
+    def test_unknown_product(self):
+        response = self.create(items=[{"product": 0}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {"items": ['Invalid pk "0" - object does not exist.']}
+        )
+
+    def test_quantity_must_be_positive(self):
+        response = self.create(items=[{"product": self.pen.pk, "quantity": 0}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_items_cannot_be_changed(self):
+        order = OrderFactory(user=self.user, product=[self.pen])
+
+        response = self.client.patch(
+            reverse("order-detail", kwargs={"version": "v1", "pk": order.pk}),
+            {"items": [{"product": self.book.pk}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(order.product.all()), [self.pen])
@@ -0,0 +1,52 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from order.factories import OrderFactory, UserFactory
+from product.factories import ProductFactory
+
+
+class TestAsyncOrderViews(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.products = ProductFactory.create_batch(2)
+        self.orders = OrderFactory.create_batch(
+            3, user=self.user, product=self.products
+        )
+        self.other_order = OrderFactory(product=self.products)
+        self.staff = UserFactory(is_staff=True)
+
+    def url(self, name, **kwargs):
+        return reverse(name, kwargs={"version": "v1", **kwargs})
+
+    async def test_list_is_scoped_and_newest_first(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(self.url("async-order-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(
+            [item["id"] for item in results],
+            [order.pk for order in reversed(self.orders)],
+        )
+        self.assertEqual(results[0]["total"], sum(p.price for p in self.products))
+        self.assertEqual(len(results[0]["product"]), 2)
+
+    async def test_detail_of_another_users_order_is_not_found(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(
+            self.url("async-order-detail", pk=self.other_order.pk)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_staff_sees_every_order(self):
+        await self.async_client.aforce_login(self.staff)
+
+        response = await self.async_client.get(
+            self.url("async-order-list"), {"page_size": 10}
+        )
+
+        self.assertEqual(len(response.json()["results"]), 4)
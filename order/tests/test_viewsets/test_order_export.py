@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from order.factories import OrderFactory, UserFactory
+from order.viewsets import OrderViewSet
+from product.factories import ProductFactory
+
+
+class TestOrderExport(APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.products = ProductFactory.create_batch(2)
+        self.orders = OrderFactory.create_batch(
+            5, user=self.user, product=self.products
+        )
+        OrderFactory(product=self.products)
+        self.url = reverse("order-export", kwargs={"version": "v1"})
+        self.client.force_authenticate(user=self.user)
+
+    def content(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_is_the_default(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [o.pk for o in self.orders])
+        self.assertEqual(rows[0]["product"], [p.pk for p in self.products])
+        self.assertEqual(rows[0]["total"], sum(p.price for p in self.products))
+
+    def test_csv(self):
+        response = self.client.get(self.url, {"format": "csv"})
+
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="order.csv"'
+        )
+        rows = list(csv.DictReader(io.StringIO(self.content(response))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["product"], ";".join(str(p.pk) for p in self.products))
+
+    def test_queries_grow_per_chunk_not_per_row(self):
+        chunk_size = OrderViewSet.export_chunk_size
+        OrderViewSet.export_chunk_size = 2
+        self.addCleanup(setattr, OrderViewSet, "export_chunk_size", chunk_size)
+
+        response = self.client.get(self.url)
+        # One cursor over the orders and one product prefetch per chunk.
+        with self.assertNumQueries(1 + 3):
+            self.content(response)
@@ -0,0 +1,65 @@
+import json
+from unittest import skipUnless
+
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from order.factories import OrderFactory, UserFactory
+from order.models import Order
+from product.factories import ProductFactory
+
+
+class TestOrderHistory(APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.products = ProductFactory.create_batch(2)
+        self.orders = OrderFactory.create_batch(
+            3, user=self.user, product=self.products
+        )
+        self.other_order = OrderFactory(product=self.products)
+
+    def results(self, name, version="v1"):
+        response = self.client.get(reverse(name, kwargs={"version": version}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(response.content)["results"]
+
+    def test_list_is_scoped_to_the_user(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.assertEqual(len(self.results("order-list")), 3)
+
+        response = self.client.get(
+            reverse("order-detail", kwargs={"version": "v1", "pk": self.other_order.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_staff_sees_every_order_but_mine_is_scoped(self):
+        staff = UserFactory(is_staff=True)
+        OrderFactory(user=staff, product=self.products)
+        self.client.force_authenticate(user=staff)
+
+        self.assertEqual(len(self.results("order-list")), 5)
+        self.assertEqual(len(self.results("order-mine")), 1)
+
+    def test_mine_is_newest_first(self):
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(4):
+            results = self.results("order-mine", version="v2")
+
+        created = [order["created_at"] for order in results]
+        self.assertEqual(created, sorted(created, reverse=True))
+        self.assertEqual(len(results), 3)
+
+    @skipUnless(connection.vendor == "sqlite", "EXPLAIN output is backend specific")
+    def test_mine_is_an_index_range_scan(self):
+        plan = (
+            Order.objects.filter(user=self.user)
+            .order_by("-created_at", "-id")[:5]
+            .explain()
+        )
+
+        self.assertIn("order_user_created_idx (user_id=?)", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
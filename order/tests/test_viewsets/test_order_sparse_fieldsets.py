@@ -0,0 +1,50 @@
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from order.factories import OrderFactory
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestOrderSparseFieldsets(APITestCase):
+    def setUp(self):
+        self.category = CategoryFactory()
+        self.products = ProductFactory.create_batch(2, category=[self.category])
+        self.order = OrderFactory(product=self.products)
+        self.client.force_authenticate(user=self.order.user)
+
+    def get(self, version, **params):
+        response = self.client.get(
+            reverse("order-list", kwargs={"version": version}), params
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(response.content)["results"][0]
+
+    def test_v1_embeds_products(self):
+        order = self.get("v1")
+
+        self.assertEqual(order["product"][0]["id"], self.products[0].id)
+        self.assertEqual(order["product"][0]["category"][0]["id"], self.category.id)
+
+    def test_v2_returns_product_ids_unless_expanded(self):
+        self.assertEqual(
+            self.get("v2")["product"], [product.id for product in self.products]
+        )
+
+        order = self.get("v2", expand="product")
+        self.assertEqual(order["product"][1]["title"], self.products[1].title)
+
+    def test_fields_trims_representation_and_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            order = self.get("v2", fields="id,total")
+
+        self.assertEqual(order, {"id": self.order.id, "total": self.order.total})
+
+        # Conditional GET validators plus the page itself, without prefetches.
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn("item_count", queries[1]["sql"])
+        self.assertNotIn("auth_user", queries[1]["sql"])
@@ -0,0 +1,164 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APITestCase
+
+from order.factories import UserFactory
+from order.models import Order
+from order.serializers import OrderSerializer
+from product.factories import ProductFactory
+
+
+class TestOrderStock(APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("order-list", kwargs={"version": "v1"})
+
+    def create_order(self, *products):
+        return self.client.post(
+            self.url,
+            {"products_id": [p.pk for p in products], "user": self.user.pk},
+            format="json",
+        )
+
+    def test_create_order_reserves_stock(self):
+        tracked = ProductFactory(stock=2)
+        untracked = ProductFactory()
+
+        response = self.create_order(tracked, untracked)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        tracked.refresh_from_db()
+        untracked.refresh_from_db()
+        self.assertEqual(tracked.stock, 1)
+        self.assertIsNone(untracked.stock)
+
+    def test_order_keeps_the_cached_product_page(self):
+        cache.clear()
+        product = ProductFactory(stock=5)
+        url = reverse("product-detail", kwargs={"version": "v1", "pk": product.pk})
+        self.client.get(url)
+
+        self.create_order(product)
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.json()["stock"], 5)
+
+    def test_selling_out_refreshes_cached_product_page(self):
+        cache.clear()
+        product = ProductFactory(stock=1)
+        url = reverse("product-detail", kwargs={"version": "v1", "pk": product.pk})
+        cached = self.client.get(url)
+        self.assertEqual(cached.json()["stock"], 1)
+
+        self.create_order(product)
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["stock"], 0)
+        self.assertNotEqual(response["ETag"], cached["ETag"])
+
+    def test_out_of_stock_rolls_back_the_order(self):
+        available = ProductFactory(stock=5)
+        sold_out = ProductFactory(stock=0)
+
+        response = self.create_order(available, sold_out)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"products_id": [f'Product "{sold_out.pk}" is out of stock.']},
+        )
+        self.assertFalse(Order.objects.exists())
+        available.refresh_from_db()
+        self.assertEqual(available.stock, 5)
+
+    def test_bulk_reserves_stock_for_the_whole_batch(self):
+        product = ProductFactory(stock=3)
+        items = [{"user": self.user.pk, "products_id": [product.pk]}] * 3
+
+        response = self.client.post(
+            reverse("order-bulk", kwargs={"version": "v1"}), items, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 0)
+
+    def test_bulk_out_of_stock_rejects_the_whole_batch(self):
+        product = ProductFactory(stock=1)
+        other = ProductFactory(stock=1)
+        items = [
+            {"user": self.user.pk, "products_id": [other.pk]},
+            {"user": self.user.pk, "products_id": [product.pk]},
+            {"user": self.user.pk, "products_id": [product.pk]},
+        ]
+
+        response = self.client.post(
+            reverse("order-bulk", kwargs={"version": "v1"}), items, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = {"products_id": [f'Product "{product.pk}" is out of stock.']}
+        self.assertEqual(response.json(), [{}, error, error])
+        self.assertFalse(Order.objects.exists())
+        other.refresh_from_db()
+        self.assertEqual(other.stock, 1)
+
+
+class TestOrderStockContention(TransactionTestCase):
+    """Many concurrent orders for the same few products."""
+
+    workers = 8
+    orders = 100
+
+    def test_concurrent_orders_never_oversell(self):
+        user = UserFactory()
+        hot = ProductFactory(stock=40)
+        other = ProductFactory(stock=100)
+
+        barrier = Barrier(self.workers)
+
+        def place(index):
+            if index < self.workers:
+                barrier.wait()
+            # Alternate the request order; reservations still lock by id.
+            products = [hot.pk, other.pk] if index % 2 else [other.pk, hot.pk]
+            try:
+                while True:
+                    serializer = OrderSerializer(
+                        data={"products_id": products, "user": user.pk}
+                    )
+                    try:
+                        serializer.is_valid(raise_exception=True)
+                        serializer.save()
+                        return True
+                    except ValidationError:
+                        return False
+                    except OperationalError:
+                        # SQLite's shared in-memory test database fails with
+                        # "table is locked" instead of waiting; start over.
+                        if connection.vendor != "sqlite":
+                            raise
+                        time.sleep(0.01)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            placed = sum(pool.map(place, range(self.orders)))
+
+        hot.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(placed, 40)
+        self.assertEqual(Order.objects.count(), 40)
+        self.assertEqual(hot.stock, 0)
+        self.assertEqual(other.stock, 60)
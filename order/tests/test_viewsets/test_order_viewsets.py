@@ -4,13 +4,14 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
+from bookstore.testing import QueryCountMixin
 from order.factories import OrderFactory, UserFactory
 from order.models import Order
 from product.factories import CategoryFactory, ProductFactory
 from product.models import Product
 
 
-class TestOrderViewSet(APITestCase):
+class TestOrderViewSet(QueryCountMixin, APITestCase):
 
     client = APIClient()
 
@@ -20,6 +21,7 @@ class TestOrderViewSet(APITestCase):
             title="mouse", price=100, category=[self.category]
         )
         self.order = OrderFactory(product=[self.product])
+        self.client.force_authenticate(user=self.order.user)
 
     def test_order(self):
         response = self.client.get(reverse("order-list", kwargs={"version": "v1"}))
@@ -41,6 +43,41 @@ class TestOrderViewSet(APITestCase):
             self.category.title,
         )
 
+    def test_order_list_query_count(self):
+        url = reverse("order-list", kwargs={"version": "v1"})
+
+        def add_orders():
+            products = ProductFactory.create_batch(3, category=[self.category])
+            OrderFactory.create_batch(2, user=self.order.user, product=products)
+
+        self.assertConstantQueries(6, lambda: self.client.get(url), add_orders)
+
+    def test_order_list_conditional_get(self):
+        url = reverse("order-list", kwargs={"version": "v1"})
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.product.price = 150
+        self.product.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_order_list_etag_covers_only_the_served_page(self):
+        newest = OrderFactory(user=self.order.user, product=[self.product])
+        url = reverse("order-list", kwargs={"version": "v2"})
+        etag = self.client.get(url, {"page_size": 1})["ETag"]
+
+        self.order.save()
+        response = self.client.get(url, {"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        newest.save()
+        response = self.client.get(url, {"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_create_order(self):
         user = UserFactory()
         product = ProductFactory()
@@ -55,3 +92,51 @@ class TestOrderViewSet(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
         created_order = Order.objects.get(user=user)
+
+        self.assertEqual(created_order.total, product.price)
+        self.assertEqual(json.loads(response.content)["total"], product.price)
+
+    def test_bulk_create_orders(self):
+        users = UserFactory.create_batch(2)
+        products = ProductFactory.create_batch(3, price=10)
+        data = [
+            {"user": user.id, "products_id": [product.id for product in products]}
+            for user in users * 10
+        ]
+
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                reverse("order-bulk", kwargs={"version": "v1"}),
+                data=json.dumps(data),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        created = json.loads(response.content)
+        self.assertEqual(len(created), 20)
+        self.assertEqual(created[0]["total"], 30)
+        self.assertEqual(created[0]["item_count"], 3)
+
+        order = Order.objects.get(pk=created[-1]["id"])
+        self.assertEqual(order.user, users[1])
+        self.assertEqual(set(order.product.all()), set(products))
+
+    def test_bulk_create_orders_rejects_unknown_ids(self):
+        data = [
+            {"user": self.order.user.id, "products_id": [self.product.id]},
+            {"user": 0, "products_id": [self.product.id, 0]},
+        ]
+
+        response = self.client.post(
+            reverse("order-bulk", kwargs={"version": "v1"}),
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        errors = json.loads(response.content)
+        self.assertEqual(errors[0], {})
+        self.assertEqual(set(errors[1]), {"user", "products_id"})
+        self.assertEqual(Order.objects.count(), 1)
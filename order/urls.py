@@ -6,7 +6,7 @@ from django.urls import include, path
 
 from rest_framework import routers
 
-from order import viewsets
+from order import views, viewsets
 
 router = routers.DefaultRouter()
 router.register(r"order", viewsets.OrderViewSet, basename="order")
@@ -14,4 +14,10 @@ router.register(r"order", viewsets.OrderViewSet, basename="order")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path("async/order/", views.AsyncOrderView.as_view(), name="async-order-list"),
+    path(
+        "async/order/<int:pk>/",
+        views.AsyncOrderView.as_view(),
+        name="async-order-detail",
+    ),
 ]
@@ -0,0 +1,20 @@
+from api.async_views import AsyncReadView
+from order.models import Order
+from order.serializers import OrderSerializer
+
+
+class AsyncOrderView(AsyncReadView):
+    """
+    Orders for the authenticated user, or every order for staff.
+
+    Keyset pages run newest first, matching ``/order/mine/``.
+    """
+
+    serializer_class = OrderSerializer
+    ordering = "-pk"
+
+    def get_queryset(self, user):
+        queryset = Order.objects.with_products()
+        if not user.is_staff:
+            queryset = queryset.filter(user=user)
+        return queryset
@@ -1,23 +1,68 @@
+from django.db.models import Prefetch
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
-
-from rest_framework.authentication import (
-    SessionAuthentication,
-    BasicAuthentication,
-    TokenAuthentication,
-)
 from rest_framework.permissions import IsAuthenticated
 
+from api.conditional import ConditionalGetMixin
+from api.export import ExportMixin
+from api.idempotency import IdempotentCreateMixin
+from api.replicas import ReplicaReadMixin
+from api.serializers import SparseQuerysetMixin
 from order.models import Order
+from product.models import Product
 
-from order.serializers import OrderSerializer
+from order.serializers import (
+    OrderBulkSerializer,
+    OrderExportSerializer,
+    OrderSerializer,
+)
 
 
-class OrderViewSet(ModelViewSet):
-    authentication_classes = [
-        SessionAuthentication,
-        BasicAuthentication,
-        TokenAuthentication,
-    ]
+class OrderViewSet(
+    ReplicaReadMixin,
+    IdempotentCreateMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
     serializer_class = OrderSerializer
-    queryset = Order.objects.all().order_by("id")
+    export_serializer_class = OrderExportSerializer
+    sparse_prefetches = {"product": ["product__category"], "items": ["items"]}
+    conditional_fields = (
+        "updated_at",
+        "product__updated_at",
+        "product__category__updated_at",
+    )
+
+    def filter_owner(self, queryset):
+        if self.action == "mine" or not self.request.user.is_staff:
+            queryset = queryset.filter(user=self.request.user)
+        return queryset
+
+    def get_queryset(self):
+        queryset = Order.objects.with_products().order_by("-created_at", "-id")
+        return self.trim_queryset(self.filter_owner(queryset))
+
+    def get_export_queryset(self):
+        queryset = Order.objects.prefetch_related(
+            Prefetch("product", queryset=Product.objects.only("pk"))
+        ).order_by("id")
+        return self.filter_owner(queryset)
+
+    @action(detail=False)
+    def mine(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request, *args, **kwargs):
+        serializer = OrderBulkSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
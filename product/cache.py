@@ -0,0 +1,111 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+from api.conditional import conditional_response, make_etag
+from api.replicas import read_from_primary
+
+GENERATION_KEY = "catalog:generation"
+HITS_KEY = "catalog:hits"
+MISSES_KEY = "catalog:misses"
+
+
+def _incr(key, initial):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, initial, timeout=None)
+        return cache.get(key, initial)
+
+
+def get_generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # Seed with a timestamp so an evicted counter never restarts at a
+        # value that older entries may still be stored under.
+        cache.add(GENERATION_KEY, time.time_ns() // 1000, timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_generation():
+    return _incr(GENERATION_KEY, time.time_ns() // 1000)
+
+
+def invalidate_catalog():
+    # Bump right away for the current connection, and again once the
+    # transaction commits, so pages rendered from uncommitted state in the
+    # meantime are dropped as well.
+    bump_generation()
+    transaction.on_commit(bump_generation)
+
+
+def catalog_cache_stats():
+    values = cache.get_many([HITS_KEY, MISSES_KEY])
+    return {"hits": values.get(HITS_KEY, 0), "misses": values.get(MISSES_KEY, 0)}
+
+
+def catalog_cache_key(request):
+    params = sorted(
+        (key, value) for key, values in request.query_params.lists() for value in values
+    )
+    digest = hashlib.md5(
+        repr((request.path, params)).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"catalog:{get_generation()}:{request.version}:{digest}"
+
+
+class CatalogCacheMixin:
+    """
+    Read-through cache for ``list`` and ``retrieve`` responses, with
+    conditional GET support.
+
+    Entries are keyed by the catalog generation, which is bumped by the
+    signals in ``product.signals`` on every catalog write. The generation
+    therefore doubles as the validator: the ETag is derived from the cache
+    key and ``Last-Modified`` is the time the entry was rendered, so a hit
+    or a 304 costs no query at all. Misses are rendered from the primary
+    even when ``ReplicaReadMixin`` picked a replica for the request.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        key = catalog_cache_key(request)
+        etag = make_etag(key, request.accepted_renderer.format)
+
+        entry = cache.get(key)
+        if entry is not None:
+            _incr(HITS_KEY, 1)
+            return conditional_response(
+                request,
+                etag,
+                entry["last_modified"],
+                lambda: Response(entry["data"], headers={"X-Cache": "HIT"}),
+            )
+
+        last_modified = int(time.time())
+
+        def render():
+            _incr(MISSES_KEY, 1)
+            # A lagging replica would store pre-write data under the new
+            # generation for every client, so entries come from the primary.
+            with read_from_primary():
+                response = handler(request, *args, **kwargs)
+            if response.status_code == 200:
+                entry = {"data": response.data, "last_modified": last_modified}
+                cache.set(key, entry, settings.CATALOG_CACHE_TIMEOUT)
+            response["X-Cache"] = "MISS"
+            return response
+
+        # An evicted entry keeps its ETag while the generation holds, so a
+        # client revalidating it still gets a 304 without a render.
+        return conditional_response(request, etag, last_modified, render)
@@ -1,6 +1,8 @@
 import factory
 
+from product.cache import invalidate_catalog
 from product.models import Category, Product
+from product.search import index_products
 
 
 class CategoryFactory(factory.django.DjangoModelFactory):
@@ -24,8 +26,36 @@ class ProductFactory(factory.django.DjangoModelFactory):
             return
 
         if extracted:
-            for category in extracted:
-                self.category.add(category)
+            self.category.add(*extracted)
+
+    @classmethod
+    def create_bulk(cls, size, category=(), batch_size=1000, **kwargs):
+        """
+        Fast seeding: build ``size`` products and insert them, and their
+        category links, with ``bulk_create``. ``category`` is a list for every
+        product or a callable taking the product's index. Signals do not run,
+        so the search index, category stats and catalog cache are refreshed
+        here.
+        """
+        products = Product.objects.bulk_create(
+            cls.build_batch(size, **kwargs), batch_size=batch_size
+        )
+        categories_of = category if callable(category) else lambda index: category
+        through = Product.category.through
+        links = through.objects.bulk_create(
+            (
+                through(product_id=product.pk, category_id=item.pk)
+                for index, product in enumerate(products)
+                for item in categories_of(index)
+            ),
+            batch_size=batch_size,
+        )
+        index_products([product.pk for product in products])
+        Category.objects.filter(
+            pk__in={link.category_id for link in links}
+        ).refresh_stats()
+        invalidate_catalog()
+        return products
 
     class Meta:
         model = Product
@@ -0,0 +1,113 @@
+from django.db.models import Value
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from product.search import search_products
+
+
+class QueryParamFilter(BaseFilterBackend):
+    """
+    Whitelisted ``?param=value`` filters.
+
+    ``filters`` maps a query parameter to a ``(field, lookup)`` pair, where
+    the field is a serializer field used to parse and validate the value.
+    """
+
+    filters = {}
+
+    def filter_queryset(self, request, queryset, view):
+        lookups = {}
+        errors = {}
+        for param, (field, lookup) in self.filters.items():
+            if param not in request.query_params:
+                continue
+            try:
+                value = field.to_internal_value(request.query_params[param])
+            except serializers.ValidationError as exc:
+                errors[param] = exc.detail
+                continue
+            if isinstance(value, bool):
+                # Django renders `active=True` as `WHERE active`, which SQLite
+                # can not match against an index; a bound value it can.
+                value = Value(value)
+            lookups[self.get_lookup(lookup, value)] = value
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return queryset.filter(**lookups)
+
+    def get_lookup(self, lookup, value):
+        return lookup
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": param,
+                "required": False,
+                "in": "query",
+                "schema": {"type": "string"},
+            }
+            for param in self.filters
+        ]
+
+
+class CategoryFilter(QueryParamFilter):
+    filters = {
+        "active": (serializers.BooleanField(), "active"),
+        "slug": (serializers.SlugField(), "slug"),
+    }
+
+
+class ProductFilter(QueryParamFilter):
+    filters = {
+        "active": (serializers.BooleanField(), "active"),
+        "category": (serializers.CharField(), "category__slug"),
+        "price_min": (serializers.IntegerField(min_value=0), "price__gte"),
+        "price_max": (serializers.IntegerField(min_value=0), "price__lte"),
+    }
+
+    def get_lookup(self, lookup, value):
+        # `?category=` takes either a category id or a slug.
+        if lookup == "category__slug" and value.isdigit():
+            return "category__id"
+        return lookup
+
+
+class StableOrderingFilter(OrderingFilter):
+    """
+    ``OrderingFilter`` that breaks ties on ``id``, so pages stay stable.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering and not {"id", "-id"} & set(ordering):
+            ordering = [*ordering, "id"]
+        return ordering
+
+
+class ProductSearchFilter(BaseFilterBackend):
+    """
+    Ranked full-text search with ``?q=``, see ``product.search``.
+    """
+
+    search_param = "q"
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return queryset
+
+        return search_products(queryset, text)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Full-text search over title, description "
+                "and category titles.",
+                "schema": {"type": "string"},
+            },
+        ]
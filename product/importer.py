@@ -0,0 +1,230 @@
+"""
+Bulk catalog import.
+
+Rows are read lazily from CSV or NDJSON and written in batches: categories
+are upserted by ``slug`` and products by ``sku`` with
+``bulk_create(update_conflicts=True)``, and each product's category links are
+replaced with one bulk insert of through rows. Bulk writes skip model
+signals, so every batch reindexes its products for search, and category
+stats are recomputed and the catalog cache invalidated once the run stops,
+also when a bad row aborts it after earlier batches were committed. Values
+that do not parse (fractional prices, unknown booleans) reject their row.
+"""
+
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.db import transaction
+
+from product.cache import invalidate_catalog
+from product.models import Category, Product
+from product.search import index_products
+
+CATEGORY_FIELDS = ["title", "description", "active"]
+PRODUCT_FIELDS = ["title", "description", "price", "active"]
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+FALSE_VALUES = {"0", "false", "f", "no", "n"}
+
+
+class CatalogImportError(ValueError):
+    def __init__(self, line, message):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+def read_rows(stream, fmt):
+    """Yield ``(line, row)`` pairs from a CSV or NDJSON text stream."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            yield line, json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise CatalogImportError(line, f"invalid JSON ({exc.msg})") from None
+
+
+def _text(value):
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _bool(value, default=True):
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    value = str(value).strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def _price(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise ValueError("price must be a number")
+    try:
+        price = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError("price must be a number") from None
+    # Prices are stored in whole units; never round a fraction away.
+    if not price.is_finite() or price != price.to_integral_value():
+        raise ValueError("price must be a whole number")
+    if price < 0:
+        raise ValueError("price must not be negative")
+    return int(price)
+
+
+def _slugs(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(";")
+    return [slug.strip() for slug in value if slug.strip()]
+
+
+class CatalogImporter:
+    """
+    Import ``rows`` (``(line, dict)`` pairs) of ``model`` ("category" or
+    "product"), skipping the first ``skip`` rows.
+
+    ``on_batch(rows_done)`` runs after each committed batch, so the caller
+    can checkpoint progress; rerunning a batch is harmless because every
+    write is an upsert.
+    """
+
+    def __init__(self, model, batch_size=1000, on_batch=None, using="default"):
+        self.model = model
+        self.batch_size = batch_size
+        self.on_batch = on_batch
+        self.using = using
+        self.category_ids = {}
+
+    def run(self, rows, skip=0):
+        rows = islice(rows, skip, None)
+        done = skip
+        write_batch = (
+            self.write_products if self.model == "product" else self.write_categories
+        )
+
+        try:
+            while batch := list(islice(rows, self.batch_size)):
+                with transaction.atomic(using=self.using):
+                    write_batch(batch)
+                done += len(batch)
+                if self.on_batch:
+                    self.on_batch(done)
+        finally:
+            # Committed batches are live even when a later row aborts the run.
+            if done > skip:
+                Category.objects.using(self.using).refresh_stats()
+                invalidate_catalog()
+        return done - skip
+
+    def parse_category(self, line, row):
+        slug = _text(row.get("slug"))
+        if not slug:
+            raise CatalogImportError(line, "slug is required")
+        return Category(
+            slug=slug,
+            title=_text(row.get("title")) or slug,
+            description=_text(row.get("description")),
+            active=self.parse_active(line, row),
+        )
+
+    def parse_active(self, line, row):
+        try:
+            return _bool(row.get("active"))
+        except ValueError as exc:
+            raise CatalogImportError(line, f"invalid active ({exc})") from None
+
+    def parse_product(self, line, row):
+        sku, title = _text(row.get("sku")), _text(row.get("title"))
+        if not sku or not title:
+            raise CatalogImportError(line, "sku and title are required")
+        try:
+            price = _price(row.get("price"))
+        except ValueError as exc:
+            raise CatalogImportError(line, f"invalid price ({exc})") from None
+        product = Product(
+            sku=sku,
+            title=title,
+            description=_text(row.get("description")),
+            price=price,
+            active=self.parse_active(line, row),
+        )
+        return product, _slugs(row.get("category"))
+
+    def write_categories(self, batch):
+        # Last row wins when a slug repeats within a batch.
+        categories = {}
+        for line, row in batch:
+            category = self.parse_category(line, row)
+            categories[category.slug] = category
+
+        Category.objects.using(self.using).bulk_create(
+            categories.values(),
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=CATEGORY_FIELDS + ["updated_at"],
+        )
+
+    def resolve_categories(self, slugs):
+        """Map ``slugs`` to ids, creating categories that do not exist yet."""
+        missing = set(slugs) - self.category_ids.keys()
+        if not missing:
+            return
+
+        categories = Category.objects.using(self.using)
+        categories.bulk_create(
+            [Category(slug=slug, title=slug) for slug in missing],
+            ignore_conflicts=True,
+        )
+        self.category_ids.update(
+            categories.filter(slug__in=missing).values_list("slug", "pk")
+        )
+
+    def write_products(self, batch):
+        products = {}
+        for line, row in batch:
+            product, slugs = self.parse_product(line, row)
+            products[product.sku] = (product, slugs)
+
+        Product.objects.using(self.using).bulk_create(
+            [product for product, _ in products.values()],
+            update_conflicts=True,
+            unique_fields=["sku"],
+            update_fields=PRODUCT_FIELDS + ["updated_at"],
+        )
+        product_ids = dict(
+            Product.objects.using(self.using)
+            .filter(sku__in=products.keys())
+            .values_list("sku", "pk")
+        )
+
+        self.resolve_categories(
+            {slug for _, slugs in products.values() for slug in slugs}
+        )
+        through = Product.category.through
+        links = through.objects.using(self.using)
+        links.filter(product_id__in=product_ids.values()).delete()
+        links.bulk_create(
+            through(product_id=product_ids[sku], category_id=self.category_ids[slug])
+            for sku, (_, slugs) in products.items()
+            for slug in set(slugs)
+        )
+
+        index_products(list(product_ids.values()), using=self.using)
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from product.cache import catalog_cache_stats, get_generation
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters of the catalog response cache."
+
+    def handle(self, *args, **options):
+        stats = catalog_cache_stats()
+        lookups = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / lookups if lookups else 0
+
+        self.stdout.write(f"generation: {get_generation()}")
+        self.stdout.write(f"hits: {stats['hits']}")
+        self.stdout.write(f"misses: {stats['misses']}")
+        self.stdout.write(f"hit ratio: {ratio:.1%}")
@@ -0,0 +1,79 @@
+import os
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from product.importer import CatalogImporter, CatalogImportError, read_rows
+
+FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Upsert categories (by slug) or products (by sku) from a CSV or NDJSON "
+        "file. Product rows name their categories by slug in the `category` "
+        "column, separated by `;` in CSV."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument(
+            "--model", choices=["category", "product"], default="product"
+        )
+        parser.add_argument("--format", choices=["csv", "ndjson"])
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the rows committed by an earlier, interrupted run",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Progress file (default: <path>.progress), removed on success",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        fmt = options["format"] or FORMATS.get(path.suffix.lower())
+        if fmt is None:
+            raise CommandError(
+                "Can not tell the format from the extension, pass --format."
+            )
+
+        checkpoint = Path(options["checkpoint"] or f"{path}.progress")
+        skip = 0
+        if options["resume"] and checkpoint.exists():
+            skip = int(checkpoint.read_text() or 0)
+            self.stdout.write(f"Resuming after {skip} rows.")
+
+        started = time.perf_counter()
+
+        def on_batch(done):
+            checkpoint.write_text(str(done))
+            if options["verbosity"] > 1:
+                rate = (done - skip) / (time.perf_counter() - started)
+                self.stdout.write(f"{done} rows ({rate:.0f} rows/s)")
+
+        importer = CatalogImporter(
+            options["model"], batch_size=options["batch_size"], on_batch=on_batch
+        )
+        try:
+            with open(path, newline="", encoding="utf-8") as stream:
+                imported = importer.run(read_rows(stream, fmt), skip=skip)
+        except CatalogImportError as exc:
+            raise CommandError(
+                f"{exc}. Fix the row and rerun with --resume to continue."
+            ) from exc
+
+        elapsed = time.perf_counter() - started
+        if checkpoint.exists():
+            os.remove(checkpoint)
+
+        rate = imported / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported} {options['model']} rows in {elapsed:.2f}s "
+                f"({rate:.0f} rows/s)."
+            )
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from product.cache import invalidate_catalog
+from product.models import Category
+
+
+class Command(BaseCommand):
+    help = "Recompute the product count and price range of every category."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        updated = 0
+
+        while True:
+            ids = list(
+                Category.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            updated += Category.objects.filter(pk__in=ids).refresh_stats()
+            last_id = ids[-1]
+
+        invalidate_catalog()
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} categories."))
@@ -0,0 +1,69 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:40
+
+from django.db import migrations
+
+# Indexing statements are frozen here rather than imported from
+# product.search, so later changes to the live helpers can not break this
+# migration.
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE product_search USING fts5("
+    "title, description, categories, tokenize = 'unicode61 remove_diacritics 2')",
+    "INSERT INTO product_search (rowid, title, description, categories) "
+    "SELECT p.id, p.title, coalesce(p.description, ''), coalesce(("
+    "SELECT group_concat(c.title, ' ') FROM product_category c "
+    "INNER JOIN product_product_category pc ON pc.category_id = c.id "
+    "WHERE pc.product_id = p.id), '') "
+    "FROM product_product p",
+]
+SQLITE_BACKWARD = [
+    "DROP TABLE IF EXISTS product_search",
+]
+
+POSTGRESQL_FORWARD = [
+    "ALTER TABLE product_product ADD COLUMN search_vector tsvector",
+    "CREATE INDEX product_search_vector_gin ON product_product "
+    "USING GIN (search_vector)",
+    "UPDATE product_product p SET search_vector = "
+    "setweight(to_tsvector('simple', coalesce(p.title, '')), 'A') "
+    "|| setweight(to_tsvector('simple', coalesce(("
+    "SELECT string_agg(c.title, ' ') FROM product_category c "
+    "INNER JOIN product_product_category pc ON pc.category_id = c.id "
+    "WHERE pc.product_id = p.id), '')), 'B') "
+    "|| setweight(to_tsvector('simple', coalesce(p.description, '')), 'C')",
+]
+POSTGRESQL_BACKWARD = [
+    "DROP INDEX IF EXISTS product_search_vector_gin",
+    "ALTER TABLE product_product DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _execute(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        _execute(schema_editor, SQLITE_FORWARD)
+    elif vendor == "postgresql":
+        _execute(schema_editor, POSTGRESQL_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        _execute(schema_editor, SQLITE_BACKWARD)
+    elif vendor == "postgresql":
+        _execute(schema_editor, POSTGRESQL_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0002_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
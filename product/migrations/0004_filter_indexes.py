@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0003_product_search"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["active", "slug"], name="category_active_slug_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["active", "price"], name="product_active_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(fields=["price"], name="product_price_idx"),
+        ),
+        # The auto-created Product.category through table only has the
+        # (product_id, category_id) unique index plus single-column ones;
+        # listing a category's products wants category_id first.
+        migrations.RunSQL(
+            "CREATE INDEX product_category_product_idx "
+            "ON product_product_category (category_id, product_id)",
+            "DROP INDEX product_category_product_idx",
+        ),
+    ]
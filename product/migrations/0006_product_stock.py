@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0005_product_sku"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="stock",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 6.0.1 on 2026-10-18 23:50
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def compute_category_stats(apps, schema_editor):
+    Category = apps.get_model("product", "Category")
+    Product = apps.get_model("product", "Product")
+    products = (
+        Product.category.through.objects.filter(
+            category=OuterRef("pk"), product__active=True
+        )
+        .order_by()
+        .values("category")
+    )
+
+    def stat(aggregate):
+        return Subquery(products.annotate(value=aggregate).values("value"))
+
+    Category.objects.using(schema_editor.connection.alias).update(
+        product_count=Coalesce(stat(Count("product")), 0),
+        min_price=stat(Min("product__price")),
+        max_price=stat(Max("product__price")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0006_product_stock"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="product_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="min_price",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="max_price",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.RunPython(compute_category_stats, migrations.RunPython.noop),
+    ]
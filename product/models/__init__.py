@@ -2,4 +2,4 @@
 # -*- coding: utf-8 -*-
 
 from .category import Category
-from .product import Product
+from .product import OutOfStock, Product
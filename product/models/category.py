@@ -1,7 +1,37 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from django.apps import apps
 from django.db import models
+from django.db.models import Count, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+class CategoryQuerySet(models.QuerySet):
+    def refresh_stats(self):
+        """
+        Recompute ``product_count``, ``min_price`` and ``max_price`` over the
+        active products of each category, in one ``UPDATE``.
+        """
+        Product = apps.get_model("product", "Product")
+        products = (
+            Product.category.through.objects.filter(
+                category=OuterRef("pk"), product__active=True
+            )
+            .order_by()
+            .values("category")
+        )
+
+        def stat(aggregate):
+            return Subquery(products.annotate(value=aggregate).values("value"))
+
+        return self.update(
+            product_count=Coalesce(stat(Count("product")), 0),
+            min_price=stat(Min("product__price")),
+            max_price=stat(Max("product__price")),
+            updated_at=timezone.now(),
+        )
 
 
 class Category(models.Model):
@@ -9,6 +39,18 @@ class Category(models.Model):
     slug = models.SlugField(unique=True)
     description = models.CharField(max_length=200, blank=True, null=True)
     active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Stats over active products, kept current by ``product.signals``.
+    product_count = models.PositiveIntegerField(default=0, editable=False)
+    min_price = models.PositiveIntegerField(null=True, editable=False)
+    max_price = models.PositiveIntegerField(null=True, editable=False)
+
+    objects = CategoryQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["active", "slug"], name="category_active_slug_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -3,16 +3,80 @@
 
 
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 
+from product.cache import invalidate_catalog
 from product.models import Category
 
 
+class OutOfStock(Exception):
+    def __init__(self, product_id):
+        super().__init__(f"Product {product_id} is out of stock.")
+        self.product_id = product_id
+
+
+class ProductQuerySet(models.QuerySet):
+    def with_categories(self):
+        return self.prefetch_related("category")
+
+    def touch(self):
+        return self.update(updated_at=timezone.now())
+
+    def reserve(self, quantities):
+        """
+        Take ``quantities`` (product id -> units) off ``stock`` with one
+        conditional ``UPDATE ... WHERE stock > units`` per product, in id
+        order so concurrent reservations lock rows in the same order and
+        never deadlock. Raises ``OutOfStock`` at the first product that is
+        short; call it inside a transaction so earlier rows roll back.
+
+        ``updated_at`` is bumped with the stock. Cached catalog pages keep
+        showing the previous count until they expire, which is not worth a
+        catalog-wide invalidation on every checkout; only taking the last
+        units of a product (a second ``UPDATE ... WHERE stock = units``)
+        invalidates them, so nothing is shown as available once sold out.
+
+        Only pass products whose stock is tracked.
+        """
+        if not quantities:
+            return
+
+        now = timezone.now()
+        sold_out = False
+        for pk, quantity in sorted(quantities.items()):
+            rows = self.filter(pk=pk)
+            if rows.filter(stock__gt=quantity).update(
+                stock=F("stock") - quantity, updated_at=now
+            ):
+                continue
+            if not rows.filter(stock=quantity).update(stock=0, updated_at=now):
+                raise OutOfStock(pk)
+            sold_out = True
+
+        if sold_out:
+            invalidate_catalog()
+
+
 class Product(models.Model):
     title = models.CharField(max_length=100)
+    # Supplier stock-keeping unit; the natural key of catalog imports.
+    sku = models.CharField(max_length=64, unique=True, null=True, blank=True)
     description = models.TextField(max_length=500, blank=True, null=True)
     price = models.PositiveIntegerField(null=True)
+    # Units on hand; null means stock is not tracked and never runs out.
+    stock = models.PositiveIntegerField(null=True, blank=True)
     active = models.BooleanField(default=True)
     category = models.ManyToManyField(Category, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = ProductQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["active", "price"], name="product_active_price_idx"),
+            models.Index(fields=["price"], name="product_price_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,175 @@
+"""
+Full-text search over product titles, descriptions and category titles.
+
+PostgreSQL keeps a weighted ``tsvector`` in ``product_product.search_vector``
+behind a GIN index; SQLite keeps an FTS5 table, ``product_search``, keyed by
+product id. Both are created by migration ``product.0003_product_search`` and
+kept current by the receivers in ``product.signals``. Any other backend falls
+back to ``icontains`` lookups.
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+INDEX_BATCH_SIZE = 500
+
+CATEGORY_TITLES = """
+    SELECT {aggregate}
+    FROM product_category c
+    INNER JOIN product_product_category pc ON pc.category_id = c.id
+    WHERE pc.product_id = p.id
+"""
+
+
+def _terms(text):
+    return re.findall(r"\w+", text)
+
+
+def _batches(ids):
+    ids = list(ids)
+    for start in range(0, len(ids), INDEX_BATCH_SIZE):
+        yield ids[start:start + INDEX_BATCH_SIZE]
+
+
+class SearchBackend:
+    def index(self, cursor, ids):
+        pass
+
+    def remove(self, cursor, ids):
+        pass
+
+    def search(self, queryset, terms):
+        query = Q()
+        for term in terms:
+            query &= (
+                Q(title__icontains=term)
+                | Q(description__icontains=term)
+                | Q(category__title__icontains=term)
+            )
+        ids = queryset.model.objects.filter(query).values("pk")
+        return queryset.filter(pk__in=ids).annotate(
+            search_rank=Value(1.0, output_field=FloatField())
+        )
+
+
+class SQLiteSearchBackend(SearchBackend):
+    select_documents = """
+        SELECT p.id, p.title, coalesce(p.description, ''),
+               coalesce(({categories}), '')
+        FROM product_product p
+        WHERE p.id IN ({placeholders})
+    """
+
+    def index(self, cursor, ids):
+        self.remove(cursor, ids)
+        cursor.execute(
+            "INSERT INTO product_search (rowid, title, description, categories) "
+            + self.select_documents.format(
+                categories=CATEGORY_TITLES.format(
+                    aggregate="group_concat(c.title, ' ')"
+                ),
+                placeholders=", ".join(["%s"] * len(ids)),
+            ),
+            ids,
+        )
+
+    def remove(self, cursor, ids):
+        cursor.execute(
+            "DELETE FROM product_search WHERE rowid IN (%s)"
+            % ", ".join(["%s"] * len(ids)),
+            ids,
+        )
+
+    def search(self, queryset, terms):
+        match = " ".join(f'"{term}"*' for term in terms)
+        table = queryset.model._meta.db_table
+        return queryset.filter(
+            pk__in=RawSQL(
+                "SELECT rowid FROM product_search WHERE product_search MATCH %s",
+                [match],
+            )
+        ).annotate(
+            # bm25() is lower for better matches; columns are weighted
+            # title > categories > description.
+            search_rank=RawSQL(
+                "SELECT -bm25(product_search, 10.0, 2.0, 5.0) FROM product_search "
+                f'WHERE product_search MATCH %s AND rowid = "{table}"."id"',
+                [match],
+                output_field=FloatField(),
+            )
+        )
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    document = """
+        setweight(to_tsvector('simple', coalesce(p.title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(({categories}), '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(p.description, '')), 'C')
+    """
+
+    def index(self, cursor, ids):
+        cursor.execute(
+            "UPDATE product_product p SET search_vector = "
+            + self.document.format(
+                categories=CATEGORY_TITLES.format(aggregate="string_agg(c.title, ' ')")
+            )
+            + " WHERE p.id = ANY(%s)",
+            [ids],
+        )
+
+    def search(self, queryset, terms):
+        query = " & ".join(f"{term}:*" for term in terms)
+        table = queryset.model._meta.db_table
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT id FROM {table} "
+                "WHERE search_vector @@ to_tsquery('simple', %s)",
+                [query],
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'ts_rank("{table}"."search_vector", to_tsquery(\'simple\', %s))',
+                [query],
+                output_field=FloatField(),
+            )
+        )
+
+
+BACKENDS = {
+    "sqlite": SQLiteSearchBackend(),
+    "postgresql": PostgreSQLSearchBackend(),
+}
+
+
+def get_backend(using):
+    return BACKENDS.get(connections[using].vendor, SearchBackend())
+
+
+def index_products(ids, using="default"):
+    backend = get_backend(using)
+    with connections[using].cursor() as cursor:
+        for batch in _batches(ids):
+            backend.index(cursor, batch)
+
+
+def remove_products(ids, using="default"):
+    backend = get_backend(using)
+    with connections[using].cursor() as cursor:
+        for batch in _batches(ids):
+            backend.remove(cursor, batch)
+
+
+def search_products(queryset, text):
+    """
+    Filter ``queryset`` down to products matching every word of ``text``
+    (as a prefix), annotated with ``search_rank`` and best matches first.
+    """
+    terms = _terms(text)
+    if not terms:
+        return queryset.none()
+
+    queryset = get_backend(queryset.db).search(queryset, terms)
+    return queryset.order_by("-search_rank", "id")
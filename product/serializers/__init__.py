@@ -2,4 +2,6 @@
 # -*- coding: utf-8 -*-
 
 from .category_serializer import CategorySerializer
+from .product_export_serializer import ProductExportSerializer
 from .product_serializer import ProductSerializer
+from .sales_serializer import SalesWindowSerializer
@@ -1,9 +1,13 @@
 from rest_framework import serializers
 
+from api.metrics import TimedSerializerMixin
+from api.serializers import SparseFieldsetMixin
 from product.models.category import Category
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(
+    TimedSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer
+):
     """
     Serializer para o modelo Category.
     Gerencia a serialização e validação de categorias de produtos.
@@ -12,9 +16,13 @@ class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = [
+            "id",
             "title",
             "slug",
             "description",
             "active",
+            "product_count",
+            "min_price",
+            "max_price",
         ]
         extra_kwargs = {"slug": {"required": False}}
@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+from product.models import Product
+
+
+class ProductExportSerializer(serializers.ModelSerializer):
+    """Flat product rows for the CSV / NDJSON export; categories are slugs."""
+
+    category = serializers.SlugRelatedField(
+        slug_field="slug", many=True, read_only=True
+    )
+
+    class Meta:
+        model = Product
+        fields = [
+            "id",
+            "sku",
+            "title",
+            "description",
+            "price",
+            "stock",
+            "active",
+            "category",
+            "updated_at",
+        ]
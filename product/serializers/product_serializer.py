@@ -1,22 +1,30 @@
 from rest_framework import serializers
 
+from api.metrics import TimedSerializerMixin
+from api.serializers import SparseFieldsetMixin
 from product.models.product import Category, Product
 from product.serializers.category_serializer import CategorySerializer
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(
+    TimedSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer
+):
     category = CategorySerializer(read_only=True, many=True)
     categories_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(), write_only=True, many=True
     )
 
+    expandable_fields = ["category"]
+
     class Meta:
         model = Product
         fields = [
             "id",
+            "sku",
             "title",
             "description",
             "price",
+            "stock",
             "active",
             "category",
             "categories_id",
@@ -26,7 +34,6 @@ class ProductSerializer(serializers.ModelSerializer):
         category_data = validated_data.pop("categories_id")
 
         product = Product.objects.create(**validated_data)
-        for category in category_data:
-            product.category.add(category)
+        product.category.add(*category_data)
 
         return product
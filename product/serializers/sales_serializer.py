@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+
+class SalesWindowSerializer(serializers.Serializer):
+    """Query parameters of the sales reports."""
+
+    days = serializers.IntegerField(min_value=1, max_value=365, default=30)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
@@ -0,0 +1,109 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from product.cache import invalidate_catalog
+from product.models import Category, Product
+from product.search import index_products, remove_products
+from product.tasks import refresh_category_stats
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_catalog_on_write(sender, **kwargs):
+    invalidate_catalog()
+
+
+@receiver(post_save, sender=Product)
+def index_saved_product(sender, instance, using, **kwargs):
+    index_products([instance.pk], using=using)
+
+
+@receiver(post_delete, sender=Product)
+def remove_deleted_product(sender, instance, using, **kwargs):
+    remove_products([instance.pk], using=using)
+
+
+@receiver(m2m_changed, sender=Product.category.through)
+def touch_products_on_category_change(
+    sender, instance, action, reverse, pk_set, using, **kwargs
+):
+    # Reverse side: `instance` is a Category and `pk_set` holds product ids.
+    if reverse and action == "pre_clear":
+        instance._cleared_product_ids = list(
+            instance.product_set.values_list("pk", flat=True)
+        )
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        product_ids = [instance.pk]
+    elif action == "post_clear":
+        product_ids = instance._cleared_product_ids
+    else:
+        product_ids = list(pk_set)
+
+    Product.objects.filter(pk__in=product_ids).touch()
+    index_products(product_ids, using=using)
+    invalidate_catalog()
+
+
+@receiver(post_save, sender=Category)
+def reindex_products_of_saved_category(sender, instance, created, using, **kwargs):
+    if not created:
+        product_ids = list(instance.product_set.values_list("pk", flat=True))
+        index_products(product_ids, using=using)
+
+
+@receiver(pre_delete, sender=Category)
+def touch_products_of_deleted_category(sender, instance, **kwargs):
+    instance._product_ids = list(instance.product_set.values_list("pk", flat=True))
+    Product.objects.filter(pk__in=instance._product_ids).touch()
+
+
+@receiver(post_delete, sender=Category)
+def reindex_products_of_deleted_category(sender, instance, using, **kwargs):
+    index_products(instance._product_ids, using=using)
+
+
+def queue_stats_refresh(category_ids):
+    # Stats are not needed to answer the write, so they are refreshed by a
+    # background job once the transaction commits.
+    if category_ids:
+        refresh_category_stats.delay(category_ids=sorted(set(category_ids)))
+
+
+@receiver(post_save, sender=Product)
+def refresh_stats_of_saved_product(sender, instance, created, **kwargs):
+    # A new product has no categories until they are added.
+    if not created:
+        queue_stats_refresh(list(instance.category.values_list("pk", flat=True)))
+
+
+@receiver(pre_delete, sender=Product)
+def remember_product_categories(sender, instance, **kwargs):
+    instance._category_ids = list(instance.category.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Product)
+def refresh_stats_of_deleted_product(sender, instance, **kwargs):
+    queue_stats_refresh(instance._category_ids)
+
+
+@receiver(m2m_changed, sender=Product.category.through)
+def refresh_stats_on_category_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if reverse:
+        # `instance` is a Category.
+        if action.startswith("post_"):
+            queue_stats_refresh([instance.pk])
+    elif action == "pre_clear":
+        instance._cleared_category_ids = list(
+            instance.category.values_list("pk", flat=True)
+        )
+    elif action == "post_clear":
+        queue_stats_refresh(instance._cleared_category_ids)
+    elif action in ("post_add", "post_remove"):
+        queue_stats_refresh(pk_set)
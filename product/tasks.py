@@ -0,0 +1,11 @@
+from jobs.registry import task
+from product.cache import invalidate_catalog
+from product.models import Category
+
+
+@task
+def refresh_category_stats(category_ids):
+    Category.objects.filter(pk__in=category_ids).refresh_stats()
+    # Cached category pages still carry the old stats. The bump reaches the
+    # web processes through the shared cache run_workers insists on.
+    invalidate_catalog()
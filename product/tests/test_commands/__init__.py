@@ -0,0 +1 @@
+# Product Command Tests
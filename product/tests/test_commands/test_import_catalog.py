@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from product.cache import get_generation
+from product.factories import CategoryFactory, ProductFactory
+from product.models import Category, Product
+from product.search import search_products
+
+
+class TestImportCatalog(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(content)
+        return path
+
+    def test_categories_are_upserted_by_slug(self):
+        CategoryFactory(slug="books", title="Old title")
+        path = self.write(
+            "categories.csv",
+            "slug,title,active\nbooks,Books,true\ngames,Games,false\n",
+        )
+
+        out = StringIO()
+        call_command("import_catalog", path, model="category", stdout=out)
+
+        self.assertIn("Imported 2 category rows", out.getvalue())
+        self.assertEqual(
+            dict(Category.objects.values_list("slug", "title")),
+            {"books": "Books", "games": "Games"},
+        )
+        self.assertFalse(Category.objects.get(slug="games").active)
+
+    def test_products_are_upserted_by_sku_with_categories(self):
+        books = CategoryFactory(slug="books")
+        existing = ProductFactory(sku="B-1", title="Old", category=[books])
+        rows = [
+            {"sku": "B-1", "title": "Dune", "price": 50, "category": ["scifi"]},
+            {"sku": "B-2", "title": "Emma", "price": 30, "category": ["books"]},
+            {"sku": "B-3", "title": "Ulysses", "active": False},
+        ]
+        path = self.write(
+            "products.ndjson", "".join(json.dumps(row) + "\n" for row in rows)
+        )
+
+        call_command("import_catalog", path, batch_size=2, stdout=StringIO())
+
+        self.assertEqual(Product.objects.count(), 3)
+        existing.refresh_from_db()
+        self.assertEqual((existing.title, existing.price), ("Dune", 50))
+        self.assertEqual(
+            list(existing.category.values_list("slug", flat=True)), ["scifi"]
+        )
+        emma = Product.objects.get(sku="B-2")
+        self.assertEqual(list(emma.category.all()), [books])
+        self.assertFalse(Product.objects.get(sku="B-3").active)
+
+        # Bulk writes bypass the signals, so the importer indexes itself.
+        found = search_products(Product.objects.all(), "ulysses")
+        self.assertEqual([p.sku for p in found], ["B-3"])
+
+    def test_resume_after_a_bad_row(self):
+        path = self.write(
+            "products.csv",
+            "sku,title,price,category\n"
+            "A-1,One,10,books;games\n"
+            "A-2,Two,20,books\n"
+            "A-3,Three,oops,\n"
+            "A-4,Four,40,\n",
+        )
+
+        generation = get_generation()
+        with self.assertRaisesMessage(CommandError, "line 4: invalid price"):
+            call_command("import_catalog", path, batch_size=2, stdout=StringIO())
+
+        self.assertEqual(Product.objects.count(), 2)
+        # The committed batch is visible, so cached pages were dropped.
+        self.assertNotEqual(get_generation(), generation)
+        with open(f"{path}.progress") as checkpoint:
+            self.assertEqual(checkpoint.read(), "2")
+
+        self.write(
+            "products.csv",
+            "sku,title,price,category\n"
+            "A-1,One,10,books;games\n"
+            "A-2,Two,20,books\n"
+            "A-3,Three,30,\n"
+            "A-4,Four,40,\n",
+        )
+        out = StringIO()
+        call_command("import_catalog", path, batch_size=2, resume=True, stdout=out)
+
+        self.assertIn("Resuming after 2 rows", out.getvalue())
+        self.assertIn("Imported 2 product rows", out.getvalue())
+        self.assertEqual(Product.objects.count(), 4)
+        self.assertEqual(Product.objects.get(sku="A-1").category.count(), 2)
+        self.assertFalse(os.path.exists(f"{path}.progress"))
+
+    def test_unparseable_values_reject_the_row(self):
+        cases = [
+            ({"price": 10.5}, "line 1: invalid price (price must be a whole number)"),
+            ({"price": "9.99"}, "line 1: invalid price (price must be a whole number)"),
+            ({"price": True}, "line 1: invalid price (price must be a number)"),
+            ({"active": "maybe"}, "line 1: invalid active ('maybe' is not a boolean)"),
+        ]
+        for values, message in cases:
+            with self.subTest(values):
+                row = {"sku": "A-1", "title": "One", **values}
+                path = self.write("products.ndjson", json.dumps(row) + "\n")
+
+                with self.assertRaisesMessage(CommandError, message):
+                    call_command("import_catalog", path, stdout=StringIO())
+
+                self.assertFalse(Product.objects.exists())
+
+    def test_whole_prices_and_known_booleans_are_accepted(self):
+        path = self.write(
+            "products.csv",
+            "sku,title,price,active\nA-1,One,10.0,No\nA-2,Two,20,Y\n",
+        )
+
+        call_command("import_catalog", path, stdout=StringIO())
+
+        self.assertEqual(
+            set(Product.objects.values_list("sku", "price", "active")),
+            {("A-1", 10, False), ("A-2", 20, True)},
+        )
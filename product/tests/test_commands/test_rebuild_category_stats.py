@@ -0,0 +1,27 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from product.factories import CategoryFactory, ProductFactory
+from product.models import Category
+
+
+class TestRebuildCategoryStats(TestCase):
+    def test_rebuilds_every_category(self):
+        categories = CategoryFactory.create_batch(3)
+        ProductFactory(price=15, category=categories[:2])
+        Category.objects.update(product_count=0, min_price=None, max_price=None)
+        out = StringIO()
+
+        call_command("rebuild_category_stats", batch_size=2, stdout=out)
+
+        self.assertIn("Updated 3 categories.", out.getvalue())
+        self.assertEqual(
+            list(
+                Category.objects.order_by("pk").values_list(
+                    "product_count", "min_price", "max_price"
+                )
+            ),
+            [(1, 15, 15), (1, 15, 15), (0, None, None)],
+        )
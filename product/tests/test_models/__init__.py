@@ -0,0 +1 @@
+# Product Model Tests
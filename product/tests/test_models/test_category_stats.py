@@ -0,0 +1,77 @@
+from django.test import TestCase
+
+from bookstore.testing import JobsMixin
+from jobs.worker import run_pending
+from product.factories import CategoryFactory, ProductFactory
+from product.models import Category, Product
+
+
+class TestCategoryStats(JobsMixin, TestCase):
+    def setUp(self):
+        self.books = CategoryFactory()
+        self.games = CategoryFactory()
+
+    def stats(self, category):
+        category.refresh_from_db()
+        return category.product_count, category.min_price, category.max_price
+
+    def test_stats_follow_category_links(self):
+        with self.runJobs():
+            cheap = ProductFactory(price=10, category=[self.books])
+            ProductFactory(price=40, category=[self.books, self.games])
+
+        self.assertEqual(self.stats(self.books), (2, 10, 40))
+        self.assertEqual(self.stats(self.games), (1, 40, 40))
+
+        with self.runJobs():
+            cheap.category.remove(self.books)
+        self.assertEqual(self.stats(self.books), (1, 40, 40))
+
+        with self.runJobs():
+            self.games.product_set.add(cheap)
+        self.assertEqual(self.stats(self.games), (2, 10, 40))
+
+        with self.runJobs():
+            cheap.category.clear()
+        self.assertEqual(self.stats(self.games), (1, 40, 40))
+
+    def test_stats_follow_product_changes(self):
+        with self.runJobs():
+            product = ProductFactory(price=10, category=[self.books])
+            ProductFactory(price=30, category=[self.books])
+
+        with self.runJobs():
+            product.price = 50
+            product.save()
+        self.assertEqual(self.stats(self.books), (2, 30, 50))
+
+        with self.runJobs():
+            product.active = False
+            product.save()
+        self.assertEqual(self.stats(self.books), (1, 30, 30))
+
+        with self.runJobs():
+            Product.objects.filter(price=30).get().delete()
+        self.assertEqual(self.stats(self.books), (0, None, None))
+
+    def test_stats_wait_for_the_background_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductFactory(price=10, category=[self.books])
+
+        self.assertEqual(self.stats(self.books), (0, None, None))
+        run_pending()
+        self.assertEqual(self.stats(self.books), (1, 10, 10))
+
+    def test_bulk_factory_refreshes_stats(self):
+        ProductFactory.create_bulk(3, category=[self.games], price=20)
+
+        self.assertEqual(self.stats(self.games), (3, 20, 20))
+
+    def test_refresh_stats_is_one_query(self):
+        ProductFactory(price=10, category=[self.books])
+        Category.objects.update(product_count=0)
+
+        with self.assertNumQueries(1):
+            Category.objects.refresh_stats()
+
+        self.assertEqual(self.stats(self.books), (1, 10, 10))
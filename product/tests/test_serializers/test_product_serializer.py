@@ -1 +1,42 @@
 # Product Serializer Tests
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from product.factories import CategoryFactory, ProductFactory
+from product.serializers import CategorySerializer, ProductSerializer
+
+
+class TestProductSerializer(APITestCase):
+    def setUp(self):
+        self.category = CategoryFactory(title="books")
+        self.product = ProductFactory(title="dune", price=40, category=[self.category])
+
+    def serialize(self, serializer_class, instance, version, **params):
+        request = Request(APIRequestFactory().get("/", params))
+        request.version = version
+        return serializer_class(instance, context={"request": request}).data
+
+    def test_category_is_expandable(self):
+        data = self.serialize(ProductSerializer, self.product, "v1")
+        self.assertEqual(data["category"][0]["title"], "books")
+
+        data = self.serialize(ProductSerializer, self.product, "v2")
+        self.assertEqual(data["category"], [self.category.id])
+
+        data = self.serialize(ProductSerializer, self.product, "v2", expand="category")
+        self.assertEqual(data["category"][0]["title"], "books")
+
+    def test_fields(self):
+        data = self.serialize(ProductSerializer, self.product, "v1", fields="id,price")
+        self.assertEqual(data, {"id": self.product.id, "price": 40})
+
+        data = self.serialize(CategorySerializer, self.category, "v2", fields="title")
+        self.assertEqual(data, {"title": "books"})
+
+    def test_fields_on_category_list(self):
+        url = reverse("category-list", kwargs={"version": "v2"})
+
+        response = self.client.get(url, {"fields": "id,slug"})
+
+        self.assertEqual(set(response.data["results"][0]), {"id", "slug"})
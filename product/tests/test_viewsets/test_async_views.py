@@ -0,0 +1,69 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from order.factories import UserFactory
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestAsyncCatalogViews(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.token = Token.objects.create(user=self.user)
+        self.category = CategoryFactory(title="consoles")
+        self.products = ProductFactory.create_batch(7, category=[self.category])
+
+    def url(self, name, **kwargs):
+        return reverse(name, kwargs={"version": "v1", **kwargs})
+
+    async def get(self, url, **params):
+        return await self.async_client.get(
+            url, params, headers={"Authorization": f"Token {self.token.key}"}
+        )
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url("async-product-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_product_list_pages_by_id(self):
+        ids = [product.pk for product in self.products]
+
+        first = (await self.get(self.url("async-product-list"))).json()
+        self.assertEqual([item["id"] for item in first["results"]], ids[:5])
+        self.assertEqual(first["results"][0]["category"][0]["title"], "consoles")
+
+        second = (await self.get(first["next"])).json()
+        self.assertEqual([item["id"] for item in second["results"]], ids[5:])
+        self.assertIsNone(second["next"])
+
+    def test_product_list_query_count(self):
+        # Token lookup, one page of products and their categories.
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                self.url("async-product-list"),
+                {"page_size": 100},
+                headers={"Authorization": f"Token {self.token.key}"},
+            )
+
+        self.assertEqual(len(response.json()["results"]), 7)
+
+    async def test_product_detail(self):
+        product = self.products[0]
+
+        response = await self.get(self.url("async-product-detail", pk=product.pk))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["title"], product.title)
+
+        response = await self.get(self.url("async-product-detail", pk=0))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_category_list(self):
+        response = await self.get(self.url("async-category-list"))
+
+        self.assertEqual(
+            [item["slug"] for item in response.json()["results"]],
+            [self.category.slug],
+        )
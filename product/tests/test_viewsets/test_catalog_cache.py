@@ -0,0 +1,76 @@
+import json
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from order.factories import UserFactory
+from product.cache import catalog_cache_stats
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestCatalogCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.category = CategoryFactory(title="books")
+        self.product = ProductFactory(title="dune", category=[self.category])
+        self.client.force_authenticate(user=UserFactory())
+
+    def test_second_read_is_served_from_cache(self):
+        url = reverse("category-list", kwargs={"version": "v1"})
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(json.loads(response.content)["results"][0]["title"], "books")
+        self.assertEqual(catalog_cache_stats(), {"hits": 1, "misses": 1})
+
+    def test_key_includes_version_and_query_params(self):
+        self.client.get(reverse("category-list", kwargs={"version": "v1"}))
+
+        response = self.client.get(reverse("category-list", kwargs={"version": "v2"}))
+        self.assertEqual(response["X-Cache"], "MISS")
+
+        response = self.client.get(
+            reverse("category-list", kwargs={"version": "v1"}), {"page": 1}
+        )
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    def test_save_invalidates_entries(self):
+        url = reverse(
+            "category-detail", kwargs={"version": "v1", "pk": self.category.pk}
+        )
+        self.client.get(url)
+
+        self.category.title = "comics"
+        self.category.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(json.loads(response.content)["title"], "comics")
+
+    def test_category_change_invalidates_product_list(self):
+        url = reverse("product-list", kwargs={"version": "v1"})
+        self.client.get(url)
+
+        self.product.category.add(CategoryFactory(title="sci-fi"))
+
+        response = self.client.get(url)
+        product_data = json.loads(response.content)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(product_data["results"][0]["category"]), 2)
+
+    def test_delete_invalidates_entries(self):
+        url = reverse("product-list", kwargs={"version": "v1"})
+        self.client.get(url)
+
+        self.product.delete()
+
+        response = self.client.get(url)
+        self.assertEqual(json.loads(response.content)["results"], [])
@@ -4,11 +4,12 @@ from django.urls import reverse
 from rest_framework.test import APIClient, APITestCase
 from rest_framework.views import status
 
-from product.factories import CategoryFactory
+from bookstore.testing import JobsMixin
+from product.factories import CategoryFactory, ProductFactory
 from product.models import Category
 
 
-class CategoryViewSet(APITestCase):
+class CategoryViewSet(JobsMixin, APITestCase):
     client = APIClient()
 
     def setUp(self):
@@ -22,6 +23,37 @@ class CategoryViewSet(APITestCase):
 
         self.assertEqual(category_data["results"][0]["title"], self.category.title)
 
+    def test_category_list_reads_precomputed_stats(self):
+        CategoryFactory.create_batch(5)
+        with self.runJobs():
+            ProductFactory(price=20, category=[self.category])
+            ProductFactory(price=35, category=[self.category])
+
+        # Page count and the categories.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("category-list", kwargs={"version": "v1"})
+            )
+
+        books = response.json()["results"][0]
+        self.assertEqual(
+            (books["product_count"], books["min_price"], books["max_price"]),
+            (2, 20, 35),
+        )
+
+    def test_v2_category_page_size_is_capped(self):
+        CategoryFactory.create_batch(110)
+
+        response = self.client.get(
+            reverse("category-list", kwargs={"version": "v2"}), {"page_size": 1000}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        category_data = json.loads(response.content)
+
+        self.assertEqual(len(category_data["results"]), 100)
+        self.assertIsNotNone(category_data["next"])
+
     def test_create_category(self):
         data = json.dumps({"title": "technology"})
 
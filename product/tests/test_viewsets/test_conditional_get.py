@@ -0,0 +1,66 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from order.factories import UserFactory
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestConditionalGet(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.category = CategoryFactory(title="books")
+        self.product = ProductFactory(title="dune", category=[self.category])
+        self.client.force_authenticate(user=UserFactory())
+
+    def test_if_none_match_returns_not_modified(self):
+        url = reverse("category-list", kwargs={"version": "v1"})
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_if_modified_since_returns_not_modified(self):
+        url = reverse(
+            "category-detail", kwargs={"version": "v1", "pk": self.category.pk}
+        )
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_with_the_data(self):
+        url = reverse("product-list", kwargs={"version": "v1"})
+        etag = self.client.get(url)["ETag"]
+
+        self.product.category.add(CategoryFactory())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        self.category.title = "comics"
+        self.category.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        ProductFactory().delete()
+        self.product.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_etag_depends_on_the_page(self):
+        etags = {
+            self.client.get(reverse("category-list", kwargs={"version": version}))[
+                "ETag"
+            ]
+            for version in ("v1", "v2")
+        }
+
+        self.assertEqual(len(etags), 2)
@@ -0,0 +1,39 @@
+import csv
+import io
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from order.factories import UserFactory
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestProductExport(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(user=UserFactory())
+        self.category = CategoryFactory(slug="consoles")
+        self.products = ProductFactory.create_batch(
+            3, price=100, category=[self.category]
+        )
+        ProductFactory(price=5)
+        self.url = reverse("product-export", kwargs={"version": "v1"})
+
+    def test_csv_honours_filters(self):
+        response = self.client.get(self.url, {"format": "csv", "price_min": 50})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = list(
+            csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode()))
+        )
+        self.assertEqual(
+            [int(row["id"]) for row in rows], [p.pk for p in self.products]
+        )
+        self.assertEqual(rows[0]["category"], "consoles")
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,126 @@
+import json
+import re
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.views import status
+
+from order.factories import UserFactory
+from product.factories import CategoryFactory, ProductFactory
+from product.viewsets import CategoryViewSet, ProductViewSet
+
+
+class TestProductFilters(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=UserFactory())
+        self.books = CategoryFactory(title="books", slug="books", active=True)
+        self.games = CategoryFactory(title="games", slug="games", active=False)
+        ProductFactory(title="dune", price=40, category=[self.books])
+        ProductFactory(title="it", price=25, category=[self.books])
+        ProductFactory(title="chess", price=15, category=[self.games])
+        ProductFactory(title="old", price=10, active=False, category=[self.books])
+
+    def titles(self, name, **params):
+        response = self.client.get(reverse(name, kwargs={"version": "v1"}), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["title"] for item in json.loads(response.content)["results"]]
+
+    def test_filter_products(self):
+        self.assertEqual(
+            self.titles("product-list", active="true"), ["dune", "it", "chess"]
+        )
+        self.assertEqual(self.titles("product-list", category="games"), ["chess"])
+        self.assertEqual(self.titles("product-list", category=self.games.pk), ["chess"])
+        self.assertEqual(
+            self.titles("product-list", price_min=15, price_max=30), ["it", "chess"]
+        )
+
+    def test_active_products_in_category_cheapest_first(self):
+        self.assertEqual(
+            self.titles(
+                "product-list",
+                active="true",
+                category="books",
+                price_min=20,
+                ordering="price",
+            ),
+            ["it", "dune"],
+        )
+        self.assertEqual(
+            self.titles("product-list", ordering="-price"),
+            ["dune", "it", "chess", "old"],
+        )
+
+    def test_filter_categories(self):
+        self.assertEqual(self.titles("category-list", active="false"), ["games"])
+        self.assertEqual(self.titles("category-list", slug="books"), ["books"])
+
+    def test_invalid_filter_values(self):
+        response = self.client.get(
+            reverse("product-list", kwargs={"version": "v1"}),
+            {"price_min": "cheap", "active": "maybe"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(json.loads(response.content)), {"price_min", "active"})
+
+    def test_unknown_ordering_is_ignored(self):
+        self.assertEqual(
+            self.titles("product-list", ordering="description"),
+            ["dune", "it", "chess", "old"],
+        )
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN output is backend specific")
+class TestFilterIndexes(APITestCase):
+    """
+    Every supported filter has to be answered from an index, never from a
+    full scan of the table.
+    """
+
+    def plan(self, viewset, **params):
+        view = viewset(
+            request=Request(APIRequestFactory().get("/", params)),
+            format_kwarg=None,
+            kwargs={},
+        )
+        return view.filter_queryset(view.get_queryset()).explain()
+
+    def assertUsesIndex(self, plan, index):
+        self.assertIn(index, plan)
+        self.assertIsNone(re.search(r"SCAN \w+$", plan, re.MULTILINE), plan)
+
+    def test_active(self):
+        plan = self.plan(ProductViewSet, active="true")
+        self.assertUsesIndex(plan, "product_active_price_idx")
+
+    def test_category(self):
+        plan = self.plan(ProductViewSet, category="books")
+        self.assertUsesIndex(plan, "product_category_product_idx")
+
+        plan = self.plan(ProductViewSet, category="1")
+        self.assertUsesIndex(plan, "product_category_product_idx")
+
+    def test_price_range(self):
+        plan = self.plan(ProductViewSet, price_min=10, price_max=20)
+        self.assertUsesIndex(plan, "product_price_idx")
+
+    def test_ordering_by_price(self):
+        plan = self.plan(ProductViewSet, ordering="price")
+        self.assertUsesIndex(plan, "product_price_idx")
+
+        plan = self.plan(ProductViewSet, active="true", price_min=5, ordering="price")
+        self.assertUsesIndex(plan, "product_active_price_idx")
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_category_active_and_slug(self):
+        plan = self.plan(CategoryViewSet, active="false")
+        self.assertUsesIndex(plan, "category_active_slug_idx")
+
+        plan = self.plan(CategoryViewSet, slug="books")
+        self.assertUsesIndex(plan, "sqlite_autoindex_product_category_1")
@@ -0,0 +1,84 @@
+import json
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from order.factories import UserFactory
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestProductSearch(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=UserFactory())
+        self.scifi = CategoryFactory(title="science fiction")
+        self.dune = ProductFactory(
+            title="Dune", description="A desert planet", category=[self.scifi]
+        )
+        self.messiah = ProductFactory(
+            title="Dune Messiah", description="Sequel to Dune", category=[self.scifi]
+        )
+        self.mouse = ProductFactory(title="Mouse", description="Wireless")
+
+    def search(self, q, version="v1", **params):
+        response = self.client.get(
+            reverse("product-list", kwargs={"version": version}), {"q": q, **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(response.content)
+
+    def titles(self, q, **params):
+        return [product["title"] for product in self.search(q, **params)["results"]]
+
+    def test_search_matches_title_description_and_category(self):
+        self.assertEqual(self.titles("mouse"), ["Mouse"])
+        self.assertEqual(self.titles("wireless"), ["Mouse"])
+        self.assertEqual(set(self.titles("science")), {"Dune", "Dune Messiah"})
+        self.assertEqual(self.titles("nothing"), [])
+
+    def test_search_requires_every_word_as_prefix(self):
+        self.assertEqual(self.titles("dun mess"), ["Dune Messiah"])
+        self.assertEqual(self.titles("dune wireless"), [])
+
+    def test_search_ignores_query_syntax(self):
+        self.assertEqual(self.titles('mouse" -(*'), ["Mouse"])
+        self.assertEqual(self.titles("*"), [])
+
+    def test_results_are_ranked(self):
+        ProductFactory(title="Cooking", description="Dune cuisine")
+
+        self.assertEqual(self.titles("dune")[-1], "Cooking")
+
+    def test_index_follows_writes(self):
+        self.mouse.title = "Keyboard"
+        self.mouse.save()
+        self.assertEqual(self.titles("keyboard"), ["Keyboard"])
+
+        self.scifi.title = "space opera"
+        self.scifi.save()
+        self.assertEqual(set(self.titles("opera")), {"Dune", "Dune Messiah"})
+
+        self.dune.category.clear()
+        self.assertEqual(self.titles("opera"), ["Dune Messiah"])
+
+        self.messiah.delete()
+        self.assertEqual(self.titles("opera"), [])
+
+    def test_search_with_cursor_pagination(self):
+        ProductFactory.create_batch(5, title="Dune companion")
+
+        page = self.search("dune", version="v2", page_size=3)
+        ids = [product["id"] for product in page["results"]]
+        while page["next"]:
+            page = json.loads(self.client.get(page["next"]).content)
+            ids += [product["id"] for product in page["results"]]
+
+        ranked = [
+            product["id"]
+            for number in (1, 2)
+            for product in self.search("dune", page=number)["results"]
+        ]
+        self.assertEqual(ids, ranked)
+        self.assertEqual(len(set(ids)), 7)
@@ -5,12 +5,13 @@ from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient, APITestCase
 from rest_framework.views import status
 
+from bookstore.testing import QueryCountMixin
 from order.factories import UserFactory
 from product.factories import CategoryFactory, ProductFactory
 from product.models import Product
 
 
-class TestProductViewSet(APITestCase):
+class TestProductViewSet(QueryCountMixin, APITestCase):
     client = APIClient()
 
     def setUp(self):
@@ -35,6 +36,42 @@ class TestProductViewSet(APITestCase):
         self.assertEqual(product_data["results"][0]["price"], self.product.price)
         self.assertEqual(product_data["results"][0]["active"], self.product.active)
 
+    def test_product_list_query_count(self):
+        token = Token.objects.get(user__username=self.user.username)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+        url = reverse("product-list", kwargs={"version": "v1"})
+
+        def add_products():
+            categories = CategoryFactory.create_batch(2)
+            ProductFactory.create_batch(3, category=categories)
+
+        # Warm the token cache so every round skips the token lookup.
+        self.client.get(reverse("order-list", kwargs={"version": "v1"}))
+        self.assertConstantQueries(3, lambda: self.client.get(url), add_products)
+
+    def test_v2_product_list_uses_cursor_pagination(self):
+        token = Token.objects.get(user__username=self.user.username)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+        ProductFactory.create_batch(4)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                reverse("product-list", kwargs={"version": "v2"}), {"page_size": 3}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        product_data = json.loads(response.content)
+
+        self.assertNotIn("count", product_data)
+        self.assertEqual(len(product_data["results"]), 3)
+        self.assertEqual(product_data["results"][0]["title"], self.product.title)
+
+        response = self.client.get(product_data["next"])
+        product_data = json.loads(response.content)
+
+        self.assertEqual(len(product_data["results"]), 2)
+        self.assertIsNone(product_data["next"])
+
     def test_create_product(self):
         token = Token.objects.get(user__username=self.user.username)
         self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
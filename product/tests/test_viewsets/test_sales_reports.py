@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from bookstore.testing import QueryCountMixin
+from order.factories import UserFactory
+from order.models import DailyCategorySales, DailyProductSales
+from product.factories import CategoryFactory, ProductFactory
+
+
+class TestSalesReports(QueryCountMixin, APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("product-bestsellers", kwargs={"version": "v1"})
+
+        today = timezone.localdate()
+        self.category = CategoryFactory()
+        self.hot, self.cold = ProductFactory.create_batch(2, price=10)
+        DailyProductSales.objects.bulk_create(
+            [
+                DailyProductSales(day=today, product=self.hot, units=5, revenue=50),
+                DailyProductSales(
+                    day=today - timedelta(days=1),
+                    product=self.hot,
+                    units=2,
+                    revenue=20,
+                ),
+                DailyProductSales(day=today, product=self.cold, units=1, revenue=10),
+                DailyProductSales(
+                    day=today - timedelta(days=60),
+                    product=self.cold,
+                    units=100,
+                    revenue=1000,
+                ),
+            ]
+        )
+        DailyCategorySales.objects.create(
+            day=today, category=self.category, units=6, revenue=60
+        )
+
+    def test_bestsellers(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "product": self.hot.pk,
+                    "title": self.hot.title,
+                    "units": 7,
+                    "revenue": 70,
+                },
+                {
+                    "product": self.cold.pk,
+                    "title": self.cold.title,
+                    "units": 1,
+                    "revenue": 10,
+                },
+            ],
+        )
+
+    def test_bestsellers_window_and_limit(self):
+        response = self.client.get(self.url, {"days": 90, "limit": 1})
+
+        self.assertEqual([row["product"] for row in response.json()], [self.cold.pk])
+
+    def test_bestsellers_are_cached(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()), 2)
+
+    def test_bestsellers_rejects_large_windows(self):
+        response = self.client.get(self.url, {"days": 1000, "limit": 0})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.json()), {"days", "limit"})
+
+    def test_category_revenue_is_staff_only(self):
+        url = reverse("category-revenue", kwargs={"version": "v1"})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "category": self.category.pk,
+                    "title": self.category.title,
+                    "units": 6,
+                    "revenue": 60,
+                }
+            ],
+        )
@@ -4,7 +4,7 @@
 from django.urls import include, path
 from rest_framework import routers
 
-from product import viewsets
+from product import views, viewsets
 
 router = routers.DefaultRouter()
 router.register(r"product", viewsets.ProductViewSet, basename="product")
@@ -12,4 +12,24 @@ router.register(r"category", viewsets.CategoryViewSet, basename="category")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path(
+        "async/product/",
+        views.AsyncProductView.as_view(),
+        name="async-product-list",
+    ),
+    path(
+        "async/product/<int:pk>/",
+        views.AsyncProductView.as_view(),
+        name="async-product-detail",
+    ),
+    path(
+        "async/category/",
+        views.AsyncCategoryView.as_view(),
+        name="async-category-list",
+    ),
+    path(
+        "async/category/<int:pk>/",
+        views.AsyncCategoryView.as_view(),
+        name="async-category-detail",
+    ),
 ]
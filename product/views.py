@@ -0,0 +1,13 @@
+from api.async_views import AsyncReadView
+from product.models import Category, Product
+from product.serializers import CategorySerializer, ProductSerializer
+
+
+class AsyncProductView(AsyncReadView):
+    queryset = Product.objects.with_categories()
+    serializer_class = ProductSerializer
+
+
+class AsyncCategoryView(AsyncReadView):
+    queryset = Category.objects.all()
+    serializer_class = CategorySerializer
@@ -1,11 +1,46 @@
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from api.idempotency import IdempotentCreateMixin
+from api.replicas import ReplicaReadMixin
+from api.serializers import SparseQuerysetMixin
+from order.sales import category_revenue
+from product.cache import CatalogCacheMixin
+from product.filters import CategoryFilter, StableOrderingFilter
 from product.models import Category
 from product.serializers.category_serializer import CategorySerializer
+from product.serializers.sales_serializer import SalesWindowSerializer
 
 
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(
+    ReplicaReadMixin,
+    IdempotentCreateMixin,
+    CatalogCacheMixin,
+    SparseQuerysetMixin,
+    ModelViewSet,
+):
     serializer_class = CategorySerializer
+    filter_backends = [CategoryFilter, StableOrderingFilter]
+    ordering_fields = ["id", "title"]
 
     def get_queryset(self):
-        return Category.objects.all().order_by("id")
+        return self.trim_queryset(Category.objects.all().order_by("id"))
+
+    @action(detail=False, permission_classes=[IsAdminUser])
+    def revenue(self, request, *args, **kwargs):
+        params = SalesWindowSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        return Response(
+            [
+                {
+                    "category": row["category"],
+                    "title": row["category__title"],
+                    "units": row["units"],
+                    "revenue": row["revenue"],
+                }
+                for row in category_revenue(params.validated_data["days"])
+            ]
+        )
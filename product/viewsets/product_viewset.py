@@ -1,13 +1,66 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
 
-from product.models import Product
+from api.export import ExportMixin
+from api.idempotency import IdempotentCreateMixin
+from api.replicas import ReplicaReadMixin
+from api.serializers import SparseQuerysetMixin
+from order.sales import bestsellers
+from product.cache import CatalogCacheMixin
+from product.filters import ProductFilter, ProductSearchFilter, StableOrderingFilter
+from product.models import Category, Product
+from product.serializers.product_export_serializer import ProductExportSerializer
 from product.serializers.product_serializer import ProductSerializer
+from product.serializers.sales_serializer import SalesWindowSerializer
 
 
-class ProductViewSet(ModelViewSet):
+class ProductViewSet(
+    ReplicaReadMixin,
+    IdempotentCreateMixin,
+    CatalogCacheMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
     serializer_class = ProductSerializer
+    export_serializer_class = ProductExportSerializer
+    filter_backends = [ProductFilter, ProductSearchFilter, StableOrderingFilter]
+    ordering_fields = ["id", "price", "title"]
+    sparse_prefetches = {"category": ["category"]}
 
     def get_queryset(self):
-        return Product.objects.all().order_by("id")
+        return self.trim_queryset(Product.objects.with_categories().order_by("id"))
+
+    def get_export_queryset(self):
+        queryset = Product.objects.prefetch_related(
+            Prefetch("category", queryset=Category.objects.only("pk", "slug"))
+        ).order_by("id")
+        return self.filter_queryset(queryset)
+
+    @action(detail=False)
+    def bestsellers(self, request, *args, **kwargs):
+        params = SalesWindowSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        days, limit = params.validated_data["days"], params.validated_data["limit"]
+
+        key = f"sales:bestsellers:{days}:{limit}"
+        data = cache.get(key)
+        if data is None:
+            data = [
+                {
+                    "product": row["product"],
+                    "title": row["product__title"],
+                    "units": row["units"],
+                    "revenue": row["revenue"],
+                }
+                for row in bestsellers(days, limit)
+            ]
+            cache.set(key, data, settings.BESTSELLERS_CACHE_TIMEOUT)
+
+        return Response(data)